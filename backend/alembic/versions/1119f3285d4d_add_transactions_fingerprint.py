@@ -0,0 +1,32 @@
+"""add transactions fingerprint
+
+Revision ID: 1119f3285d4d
+Revises: 68238cf0c873
+Create Date: 2026-10-18 16:05:12.874120
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1119f3285d4d"
+down_revision: Union[str, Sequence[str], None] = "68238cf0c873"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows keep NULL (never treated as duplicates)
+    op.add_column("transactions", sa.Column("fingerprint", sa.String(length=40), nullable=True))
+    op.create_index("uq_transactions_fingerprint", "transactions", ["fingerprint"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_transactions_fingerprint", table_name="transactions")
+    op.drop_column("transactions", "fingerprint")
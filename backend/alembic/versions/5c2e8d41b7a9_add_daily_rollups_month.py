@@ -0,0 +1,47 @@
+"""add daily_rollups month
+
+Revision ID: 5c2e8d41b7a9
+Revises: 1119f3285d4d
+Create Date: 2026-10-18 18:12:40.512377
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2e8d41b7a9"
+down_revision: Union[str, Sequence[str], None] = "1119f3285d4d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Stored generated column: Postgres fills it for existing rows while adding it
+    op.add_column(
+        "daily_rollups",
+        sa.Column(
+            "month",
+            sa.Date(),
+            sa.Computed(
+                "CAST(date_trunc('month', CAST(day AS timestamp)) AS date)", persisted=True
+            ),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_daily_rollups_month_day",
+        "daily_rollups",
+        ["month", "day"],
+        postgresql_include=["tx_type", "amount"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_daily_rollups_month_day", table_name="daily_rollups")
+    op.drop_column("daily_rollups", "month")
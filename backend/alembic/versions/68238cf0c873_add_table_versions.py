@@ -0,0 +1,60 @@
+"""add table versions
+
+Revision ID: 68238cf0c873
+Revises: a3bdac898976
+Create Date: 2026-10-18 14:20:41.532907
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "68238cf0c873"
+down_revision: Union[str, Sequence[str], None] = "a3bdac898976"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = ("transactions", "budgets", "goals")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "table_versions",
+        sa.Column("table_name", sa.String(length=63), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("table_name"),
+    )
+    op.execute(
+        "INSERT INTO table_versions (table_name, version) VALUES "
+        + ", ".join(f"('{name}', 0)" for name in VERSIONED_TABLES)
+    )
+
+    # One bump per write statement (not per row), in the writer's transaction,
+    # so readers never see a new version before the data it stands for
+    op.execute("""
+        CREATE FUNCTION bump_table_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = TG_TABLE_NAME;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """)
+    for name in VERSIONED_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {name}_bump_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {name}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()
+            """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in VERSIONED_TABLES:
+        op.execute(f"DROP TRIGGER {name}_bump_version ON {name}")
+    op.execute("DROP FUNCTION bump_table_version()")
+    op.drop_table("table_versions")
@@ -0,0 +1,61 @@
+"""create budget alert states
+
+Revision ID: 8e4b1f2a6c3d
+Revises: 5c2e8d41b7a9
+Create Date: 2026-10-18 19:34:05.118264
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8e4b1f2a6c3d"
+down_revision: Union[str, Sequence[str], None] = "5c2e8d41b7a9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "budget_alert_states",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("category", sa.String(length=50), nullable=False),
+        sa.Column("monthly_limit", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("spent", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("level", sa.Integer(), nullable=False),
+        sa.Column("previous_level", sa.Integer(), nullable=False),
+        sa.Column("level_changed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("month", "category", name="uq_budget_alert_states_month_category"),
+    )
+
+    # Backfill with the default thresholds (50/80/100 % of the limit); with other
+    # BUDGET_ALERT_THRESHOLDS, run `python -m app.services.budget_alerts rebuild`
+    op.execute("""
+        INSERT INTO budget_alert_states
+            (month, category, monthly_limit, spent, level, previous_level, level_changed_at)
+        SELECT r.month, b.category, b.monthly_limit, SUM(r.amount),
+               CASE
+                   WHEN SUM(r.amount) * 100 > b.monthly_limit * 100 THEN 100
+                   WHEN SUM(r.amount) * 100 > b.monthly_limit * 80 THEN 80
+                   WHEN SUM(r.amount) * 100 > b.monthly_limit * 50 THEN 50
+                   ELSE 0
+               END,
+               0,
+               now()
+        FROM monthly_rollups r
+        JOIN budgets b ON b.category = r.category
+        WHERE r.tx_type = 'expense'
+        GROUP BY r.month, b.category, b.monthly_limit
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("budget_alert_states")
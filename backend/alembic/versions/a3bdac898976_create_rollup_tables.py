@@ -0,0 +1,82 @@
+"""create rollup tables
+
+Revision ID: a3bdac898976
+Revises: a4db9976f81f
+Create Date: 2026-10-18 11:02:17.284931
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3bdac898976"
+down_revision: Union[str, Sequence[str], None] = "a4db9976f81f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "daily_rollups",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("tx_type", sa.String(length=10), nullable=False),
+        sa.Column("category", sa.String(length=50), nullable=True),
+        sa.Column("bucket", sa.String(length=20), nullable=True),
+        sa.Column("amount", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("tx_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_daily_rollups_key",
+        "daily_rollups",
+        ["day", "tx_type", "category", "bucket"],
+        unique=True,
+        postgresql_nulls_not_distinct=True,
+    )
+    op.create_table(
+        "monthly_rollups",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("tx_type", sa.String(length=10), nullable=False),
+        sa.Column("category", sa.String(length=50), nullable=True),
+        sa.Column("bucket", sa.String(length=20), nullable=True),
+        sa.Column("amount", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("tx_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_monthly_rollups_key",
+        "monthly_rollups",
+        ["month", "tx_type", "category", "bucket"],
+        unique=True,
+        postgresql_nulls_not_distinct=True,
+    )
+
+    # Backfill from existing transactions
+    op.execute("""
+        INSERT INTO daily_rollups (day, tx_type, category, bucket, amount, tx_count)
+        SELECT occurred_on, tx_type, category, bucket, SUM(amount), COUNT(*)
+        FROM transactions
+        GROUP BY occurred_on, tx_type, category, bucket
+        """)
+    op.execute("""
+        INSERT INTO monthly_rollups (month, tx_type, category, bucket, amount, tx_count)
+        SELECT CAST(date_trunc('month', day) AS date), tx_type, category, bucket,
+               SUM(amount), SUM(tx_count)
+        FROM daily_rollups
+        GROUP BY 1, tx_type, category, bucket
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_monthly_rollups_key", table_name="monthly_rollups")
+    op.drop_table("monthly_rollups")
+    op.drop_index("uq_daily_rollups_key", table_name="daily_rollups")
+    op.drop_table("daily_rollups")
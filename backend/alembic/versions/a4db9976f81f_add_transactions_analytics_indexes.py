@@ -0,0 +1,43 @@
+"""add transactions analytics indexes
+
+Revision ID: a4db9976f81f
+Revises: 17fe2169b25f
+Create Date: 2026-10-18 10:12:41.503118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a4db9976f81f"
+down_revision: Union[str, Sequence[str], None] = "17fe2169b25f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Expense-only aggregates (by bucket/category, alerts, cut targets) over a date range
+    op.create_index(
+        "ix_transactions_tx_type_occurred_on",
+        "transactions",
+        ["tx_type", "occurred_on"],
+        unique=False,
+        postgresql_include=["amount", "category", "bucket"],
+    )
+    # Date-range totals, daily/monthly series and (occurred_on desc, id desc) listing
+    op.create_index(
+        "ix_transactions_occurred_on_id",
+        "transactions",
+        ["occurred_on", "id"],
+        unique=False,
+        postgresql_include=["tx_type", "amount"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_transactions_occurred_on_id", table_name="transactions")
+    op.drop_index("ix_transactions_tx_type_occurred_on", table_name="transactions")
@@ -0,0 +1,59 @@
+"""drop table versions
+
+Revision ID: b71d3e9a0f52
+Revises: 8e4b1f2a6c3d
+Create Date: 2026-10-18 21:02:17.640193
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b71d3e9a0f52"
+down_revision: Union[str, Sequence[str], None] = "8e4b1f2a6c3d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = ("transactions", "budgets", "goals")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ETags now follow the response cache's data version; the per-statement
+    # UPDATE of one counter row serialized concurrent writers to these tables
+    for name in VERSIONED_TABLES:
+        op.execute(f"DROP TRIGGER {name}_bump_version ON {name}")
+    op.execute("DROP FUNCTION bump_table_version()")
+    op.drop_table("table_versions")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_table(
+        "table_versions",
+        sa.Column("table_name", sa.String(length=63), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("table_name"),
+    )
+    op.execute(
+        "INSERT INTO table_versions (table_name, version) VALUES "
+        + ", ".join(f"('{name}', 0)" for name in VERSIONED_TABLES)
+    )
+    op.execute("""
+        CREATE FUNCTION bump_table_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = TG_TABLE_NAME;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """)
+    for name in VERSIONED_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {name}_bump_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {name}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()
+            """)
@@ -2,28 +2,34 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
 
-from app.crud.alerts import get_over_budget_alerts
-from app.db.session import get_db
+from app.core.cache import response_cache
+from app.crud.alerts import AlertRow, get_over_budget_alerts
+from app.db.runner import DbRunner, get_db_runner
 from app.schemas.alerts import AlertsResponse
+from app.services.budget_alerts import alert_thresholds
 
 router = APIRouter(prefix="/alerts", tags=["alerts"])
 
 
-@router.get("", response_model=AlertsResponse)
-def alerts(
-    db: Session = Depends(get_db),
-    month: str | None = Query(None, description="YYYY-MM. Defaults to current month."),
-):
+def alerts_month(month: str | None) -> date:
     if month:
         # Parse YYYY-MM
-        for_date = datetime.strptime(month + "-01", "%Y-%m-%d").date()
-    else:
-        for_date = date.today()
+        return datetime.strptime(month + "-01", "%Y-%m-%d").date()
+    return date.today()
+
 
-    rows = get_over_budget_alerts(db, for_date=for_date)
+def alerts_threshold(threshold: int) -> int:
+    # Only configured thresholds are tracked as alert levels
+    if threshold not in alert_thresholds():
+        raise HTTPException(
+            status_code=400, detail=f"threshold must be one of {alert_thresholds()}"
+        )
+    return threshold
+
+
+def alerts_payload(for_date: date, rows: list[AlertRow]) -> dict:
     return {
         "month": for_date.strftime("%Y-%m"),
         "alerts": [
@@ -32,7 +38,26 @@ def alerts(
                 "monthly_limit": r.monthly_limit,
                 "spent": r.spent,
                 "over_by": r.over_by,
+                "threshold": r.level,
             }
             for r in rows
         ],
     }
+
+
+@router.get("", response_model=AlertsResponse)
+async def alerts(
+    run: DbRunner = Depends(get_db_runner),
+    month: str | None = Query(None, description="YYYY-MM. Defaults to current month."),
+    threshold: int = Query(100, description="Percent of the limit; one of the configured levels."),
+):
+    for_date = alerts_month(month)
+    threshold = alerts_threshold(threshold)
+
+    async def compute():
+        rows = await run(get_over_budget_alerts, for_date=for_date, threshold=threshold)
+        return alerts_payload(for_date, rows)
+
+    return await response_cache.aget_or_compute(
+        "alerts", {"for_date": for_date, "threshold": threshold}, AlertsResponse, compute
+    )
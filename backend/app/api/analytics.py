@@ -2,24 +2,24 @@ from __future__ import annotations
 
 from datetime import date, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
+from app.api.etag import conditional_get
+from app.core.cache import response_cache
+from app.core.money import cents_mode, money_json, money_response
 from app.crud.analytics.daily import get_daily_series
-from app.crud.analytics.summary import get_by_bucket, get_by_category, get_monthly, get_totals
-from app.db.session import get_db
+from app.crud.analytics.summary import get_summary
+from app.db.runner import DbRunner, get_db_runner
 from app.schemas.analytics import AnalyticsSummary
 from app.schemas.daily_analytics import DailySeries
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
+# One point per day: ten years is plenty for a chart and bounds the response
+MAX_DAILY_SPAN_DAYS = 3660
 
-@router.get("/daily", response_model=DailySeries)
-def analytics_daily(
-    db: Session = Depends(get_db),
-    date_from: date | None = None,
-    date_to: date | None = None,
-):
+
+def daily_range(date_from: date | None, date_to: date | None) -> tuple[date, date]:
     # Default: last 30 days
     if date_to is None:
         date_to = date.today()
@@ -28,27 +28,96 @@ def analytics_daily(
 
     if date_from > date_to:
         raise HTTPException(status_code=400, detail="date_from must be <= date_to")
+    return date_from, date_to
+
+
+def daily_params(
+    date_from: date, date_to: date, fill: bool, cumulative: bool, rolling: bool
+) -> dict:
+    # Running and rolling sums are only defined over the gap-filled calendar
+    fill = fill or cumulative or rolling
+    # A filled series has a point per calendar day; a sparse one only per day with data
+    if fill and (date_to - date_from).days >= MAX_DAILY_SPAN_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"a filled date range must span at most {MAX_DAILY_SPAN_DAYS} days",
+        )
+    return {
+        "date_from": date_from,
+        "date_to": date_to,
+        "fill": fill,
+        "cumulative": cumulative,
+        "rolling": rolling,
+    }
+
+
+# Points only carry cumulative_net / net_7d / net_30d when asked for
+@router.get("/daily", response_model=DailySeries, response_model_exclude_none=True)
+async def analytics_daily(
+    response: Response,
+    run: DbRunner = Depends(get_db_runner),
+    date_from: date | None = None,
+    date_to: date | None = None,
+    fill: bool = False,
+    cumulative: bool = False,
+    rolling: bool = False,
+):
+    date_from, date_to = daily_range(date_from, date_to)
+    params = daily_params(date_from, date_to, fill, cumulative, rolling)
+    cents = cents_mode()
+
+    async def compute():
+        points = await run(get_daily_series, **params, cents=cents)
+        return money_json({"points": points}) if cents else {"points": points}
+
+    if cents:
+        content = await response_cache.aget_or_compute(
+            "analytics.daily.cents", params, None, compute
+        )
+        return money_response(response, content)
 
-    points = get_daily_series(db, date_from=date_from, date_to=date_to)
-    return {"points": points}
+    return await response_cache.aget_or_compute("analytics.daily", params, DailySeries, compute)
 
 
-@router.get("/summary", response_model=AnalyticsSummary)
-def analytics_summary(
-    db: Session = Depends(get_db),
+@router.get(
+    "/summary",
+    response_model=AnalyticsSummary,
+    dependencies=[conditional_get()],
+)
+async def analytics_summary(
+    response: Response,
+    run: DbRunner = Depends(get_db_runner),
     date_from: date | None = None,
     date_to: date | None = None,
     top_categories: int = Query(10, ge=1, le=50),
     months: int = Query(12, ge=1, le=60),
 ):
-    totals = get_totals(db, date_from=date_from, date_to=date_to)
-    by_bucket = get_by_bucket(db, date_from=date_from, date_to=date_to)
-    by_category = get_by_category(db, top_n=top_categories, date_from=date_from, date_to=date_to)
-    monthly = get_monthly(db, months=months, date_from=date_from, date_to=date_to)
-
-    return {
-        "totals": totals,
-        "by_bucket": by_bucket,
-        "by_category": by_category,
-        "monthly": monthly,
+    params = {
+        "date_from": date_from,
+        "date_to": date_to,
+        "top_categories": top_categories,
+        "months": months,
     }
+    cents = cents_mode()
+
+    # One scan for all four aggregates; see get_summary
+    async def compute():
+        summary = await run(
+            get_summary,
+            top_n=top_categories,
+            months=months,
+            date_from=date_from,
+            date_to=date_to,
+            cents=cents,
+        )
+        return money_json(summary) if cents else summary
+
+    if cents:
+        content = await response_cache.aget_or_compute(
+            "analytics.summary.cents", params, None, compute
+        )
+        return money_response(response, content)
+
+    return await response_cache.aget_or_compute(
+        "analytics.summary", params, AnalyticsSummary, compute
+    )
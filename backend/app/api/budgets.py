@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.api.etag import conditional_get
 from app.crud.budgets import (
     create_budget,
     delete_budget,
@@ -33,7 +34,7 @@ def create_budget_endpoint(payload: BudgetCreate, db: Session = Depends(get_db))
     ) from None
 
 
-@router.get("", response_model=list[BudgetRead])
+@router.get("", response_model=list[BudgetRead], dependencies=[conditional_get()])
 def list_budgets_endpoint(
     db: Session = Depends(get_db),
     limit: int = Query(50, ge=1, le=200),
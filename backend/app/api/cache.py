@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+
+from app.core.cache import response_cache
+
+router = APIRouter(tags=["cache"])
+
+
+@router.get("/cache/stats")
+def cache_stats():
+    return response_cache.stats()
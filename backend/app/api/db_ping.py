@@ -2,7 +2,10 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.core.config import settings
+from app.db.async_session import get_async_engine
+from app.db.pool import pool_status
+from app.db.session import engine, get_db
 
 router = APIRouter(tags=["db"])
 
@@ -11,3 +14,15 @@ router = APIRouter(tags=["db"])
 def db_ping(db: Session = Depends(get_db)):
     db.execute(text("SELECT 1"))
     return {"db": "ok"}
+
+
+@router.get("/db/pool")
+def db_pool():
+    """Connection pool usage; `async` is only reported when DB_MODE=async."""
+    return {
+        "pre_ping": settings.db_pool_pre_ping,
+        "sync": pool_status(engine),
+        "async": (
+            pool_status(get_async_engine().sync_engine) if settings.db_mode == "async" else None
+        ),
+    }
@@ -0,0 +1,55 @@
+"""
+Conditional GET for polled read endpoints.
+
+The ETag hashes the path, the query string and the response cache's data
+version, which every committed write already bumps (after its commit, so a
+reader never pairs a new tag with old data). The version is qualified by its
+scope: a memory-mode counter restarts at 0 in every process, so its numbers
+are only comparable within the process that counted them. Reading it takes no
+lock and no query: a matching If-None-Match answers 304 from the dependency,
+before the endpoint opens a session. With CACHE_BACKEND=none there is no data
+version and responses carry no ETag.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Depends, HTTPException, Request, Response
+
+from app.core.cache import response_cache
+
+# Clients must revalidate, but may keep the body and send If-None-Match
+CACHE_CONTROL = "no-cache"
+
+
+def compute_etag(request: Request, version: str) -> str:
+    query = sorted(request.query_params.multi_items())
+    raw = f"{request.url.path}|{query}|{version}"
+    return f'W/"{hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()}"'
+
+
+def _matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: ignore W/ prefixes on either side
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def conditional_get():
+    """Route dependency: ETag / If-None-Match driven by the data version."""
+
+    def dependency(request: Request, response: Response) -> None:
+        version = response_cache.version_tag()
+        if version is None:
+            return
+        etag = compute_etag(request, version)
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if _matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+
+    return Depends(dependency)
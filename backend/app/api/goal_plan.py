@@ -1,30 +1,145 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from datetime import date
 
-from app.crud.goal_planner import plan_goal
-from app.crud.goals import get_goal
-from app.db.session import get_db
-from app.schemas.goal_plan import GoalPlanResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+
+from app.core.cache import response_cache
+from app.core.money import cents_mode, money_json, money_response
+from app.crud.goal_planner import plan_goal, plan_goals, simulate_goal_plan
+from app.crud.goals import get_goal, list_goals
+from app.db.runner import DbRunner, get_db_runner
+from app.models.goal import Goal
+from app.schemas.goal_plan import GoalPlanResponse, GoalPlansResponse, GoalSimulationResponse
 
 router = APIRouter(prefix="/goals", tags=["goals"])
 
 
+def plans_payload(goals: list[Goal], plans: list[dict]) -> dict:
+    return {
+        "plans": [
+            {"goal_id": g.id, "name": g.name, **plan} for g, plan in zip(goals, plans, strict=True)
+        ]
+    }
+
+
+def plans_params(ids: list[int] | None, history_months: int, limit: int, offset: int) -> dict:
+    return {
+        "ids": sorted(set(ids)) if ids is not None else None,
+        "history_months": history_months,
+        "limit": limit,
+        "offset": offset,
+        "today": date.today(),
+    }
+
+
+def simulation_params(
+    goal_id: int, history_months: int, paths: int, horizon_months: int, seed: int | None
+) -> dict:
+    return {
+        "goal_id": goal_id,
+        "history_months": history_months,
+        "paths": paths,
+        "horizon_months": horizon_months,
+        "seed": seed,
+        "today": date.today(),
+    }
+
+
+# Registered before the goals router, so "plans" is never parsed as a goal_id
+@router.get("/plans", response_model=GoalPlansResponse)
+async def goal_plans(
+    response: Response,
+    run: DbRunner = Depends(get_db_runner),
+    ids: list[int] | None = Query(None, description="Plan only these goals (repeatable)."),
+    history_months: int = Query(6, ge=1, le=24),
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+):
+    cents = cents_mode()
+
+    async def compute():
+        goals = await run(list_goals, limit=limit, offset=offset, ids=ids)
+        plans = await run(
+            plan_goals,
+            [(g.target_amount, g.target_date) for g in goals],
+            history_months=history_months,
+            cents=cents,
+        )
+        payload = plans_payload(goals, plans)
+        return money_json(payload) if cents else payload
+
+    params = plans_params(ids, history_months, limit, offset)
+    if cents:
+        content = await response_cache.aget_or_compute("goals.plans.cents", params, None, compute)
+        return money_response(response, content)
+
+    return await response_cache.aget_or_compute("goals.plans", params, GoalPlansResponse, compute)
+
+
 @router.get("/{goal_id}/plan", response_model=GoalPlanResponse)
-def goal_plan(
+async def goal_plan(
     goal_id: int,
-    db: Session = Depends(get_db),
+    response: Response,
+    run: DbRunner = Depends(get_db_runner),
     history_months: int = Query(6, ge=1, le=24),
 ):
-    g = get_goal(db, goal_id)
-    if not g:
-        raise HTTPException(status_code=404, detail="Goal not found")
-
-    data = plan_goal(
-        db,
-        target_amount=g.target_amount,
-        target_date=g.target_date,
-        history_months=history_months,
+    cents = cents_mode()
+
+    async def compute():
+        g = await run(get_goal, goal_id)
+        if not g:
+            raise HTTPException(status_code=404, detail="Goal not found")
+
+        plan = await run(
+            plan_goal,
+            target_amount=g.target_amount,
+            target_date=g.target_date,
+            history_months=history_months,
+            cents=cents,
+        )
+        return money_json(plan) if cents else plan
+
+    # plan_goal counts months from today, so the date is part of the key
+    params = {"goal_id": goal_id, "history_months": history_months, "today": date.today()}
+    if cents:
+        content = await response_cache.aget_or_compute("goals.plan.cents", params, None, compute)
+        return money_response(response, content)
+
+    return await response_cache.aget_or_compute("goals.plan", params, GoalPlanResponse, compute)
+
+
+@router.get("/{goal_id}/simulation", response_model=GoalSimulationResponse)
+async def goal_simulation(
+    goal_id: int,
+    run: DbRunner = Depends(get_db_runner),
+    history_months: int = Query(12, ge=1, le=60),
+    paths: int = Query(10_000, ge=100, le=50_000),
+    horizon_months: int = Query(120, ge=1, le=600),
+    seed: int | None = Query(None, ge=0, description="Fix for reproducible paths."),
+):
+    async def compute():
+        g = await run(get_goal, goal_id)
+        if not g:
+            raise HTTPException(status_code=404, detail="Goal not found")
+
+        return await run(
+            simulate_goal_plan,
+            target_amount=g.target_amount,
+            target_date=g.target_date,
+            history_months=history_months,
+            paths=paths,
+            horizon_months=horizon_months,
+            seed=seed,
+        )
+
+    # Only seeded runs are reproducible, so only they are cached; without a seed
+    # every request draws a fresh sample
+    if seed is None:
+        return await compute()
+    return await response_cache.aget_or_compute(
+        "goals.simulation",
+        simulation_params(goal_id, history_months, paths, horizon_months, seed),
+        GoalSimulationResponse,
+        compute,
     )
-    return data
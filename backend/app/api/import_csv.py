@@ -1,28 +1,75 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+import shutil
+import tempfile
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
+from app.services.bulk_loader import DuplicateMode
 from app.services.csv_import import import_transactions_csv
+from app.services.import_jobs import import_job_runner
 
 router = APIRouter(prefix="/import", tags=["import"])
 
 
-@router.post("/csv")
-async def import_csv(file: UploadFile = File(...), db: Session = Depends(get_db)):
+def _check_upload(file: UploadFile) -> None:
     if not file.filename.lower().endswith(".csv"):
         raise HTTPException(status_code=400, detail="Only .csv files are supported")
 
-    content = await file.read()
-    if not content:
+    if not file.size:
         raise HTTPException(status_code=400, detail="Uploaded file is empty")
 
-    result = import_transactions_csv(db, content)
+
+_ON_DUPLICATE_QUERY = Query(
+    None, description="Rows imported before: skip (default) or upsert their mutable fields"
+)
+
+
+@router.post("/csv")
+def import_csv(
+    file: UploadFile = File(...),
+    on_duplicate: DuplicateMode | None = _ON_DUPLICATE_QUERY,
+    db: Session = Depends(get_db),
+):
+    _check_upload(file)
+
+    # Stream from the spooled upload instead of loading it into memory
+    file.file.seek(0)
+    result = import_transactions_csv(db, file.file, on_duplicate=on_duplicate)
 
     return {
         "inserted_count": result.inserted_count,
+        "skipped_count": result.skipped_count,
+        "updated_count": result.updated_count,
         "rejected_rows": [
             {"row_number": r.row_number, "reason": r.reason} for r in result.rejected_rows
         ],
     }
+
+
+@router.post("/jobs", status_code=status.HTTP_202_ACCEPTED)
+def create_import_job(
+    response: Response,
+    file: UploadFile = File(...),
+    on_duplicate: DuplicateMode | None = _ON_DUPLICATE_QUERY,
+):
+    _check_upload(file)
+
+    # The upload is gone once the request ends; the worker reads (and removes) this copy
+    file.file.seek(0)
+    with tempfile.NamedTemporaryFile(prefix="spendsense-import-", suffix=".csv", delete=False) as f:
+        shutil.copyfileobj(file.file, f)
+
+    job = import_job_runner.submit(f.name, file.filename, on_duplicate=on_duplicate)
+    response.headers["Location"] = f"/import/jobs/{job.id}"
+    return {"job_id": job.id, "status": job.status}
+
+
+@router.get("/jobs/{job_id}")
+def get_import_job(job_id: str):
+    job = import_job_runner.store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return job.to_dict()
@@ -1,35 +1,72 @@
 from __future__ import annotations
 
+import base64
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from app.api.etag import conditional_get
+from app.core.config import settings
 from app.crud.transactions import (
+    apply_transaction_batch,
     create_transaction,
     delete_transaction,
     get_transaction,
+    iter_transaction_rows,
     list_transactions,
     update_transaction,
 )
-from app.db.session import get_db
-from app.schemas.transaction import TransactionCreate, TransactionRead, TransactionUpdate
+from app.db.session import SessionLocal, get_db
+from app.models.transaction import Transaction
+from app.schemas.transaction import (
+    TransactionBatchRequest,
+    TransactionBatchResponse,
+    TransactionCreate,
+    TransactionRead,
+    TransactionUpdate,
+)
+from app.services.csv_export import EXPORT_MEDIA_TYPES, ExportFormat, iter_export
 
 router = APIRouter()
 
 
-@router.get("/transactions", response_model=list[TransactionRead])
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(tx: Transaction) -> str:
+    raw = f"{tx.occurred_on.isoformat()}|{tx.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[date, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        occurred_on, tx_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return date.fromisoformat(occurred_on), int(tx_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+
+@router.get(
+    "/transactions",
+    response_model=list[TransactionRead],
+    dependencies=[conditional_get()],
+)
 def list_txs(
+    response: Response,
     db: Session = Depends(get_db),
     limit: int = Query(50, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description=f"Value of a previous {NEXT_CURSOR_HEADER}"),
     tx_type: str | None = None,
     category: str | None = None,
     bucket: str | None = None,
     date_from: date | None = None,
     date_to: date | None = None,
 ):
-    return list_transactions(
+    txs = list_transactions(
         db,
         limit=limit,
         offset=offset,
@@ -38,6 +75,45 @@ def list_txs(
         bucket=bucket,
         date_from=date_from,
         date_to=date_to,
+        after=decode_cursor(cursor) if cursor else None,
+    )
+
+    # A full page may have more rows behind it; hand out a keyset cursor for the next one
+    if len(txs) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(txs[-1])
+    return txs
+
+
+@router.get("/transactions/export")
+def export_txs(
+    format: ExportFormat = Query("csv"),
+    tx_type: str | None = None,
+    category: str | None = None,
+    bucket: str | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+):
+    # The stream outlives the request's dependencies, so it owns its session
+    def stream():
+        db = SessionLocal()
+        try:
+            batches = iter_transaction_rows(
+                db,
+                batch_size=settings.export_batch_size,
+                tx_type=tx_type,
+                category=category,
+                bucket=bucket,
+                date_from=date_from,
+                date_to=date_to,
+            )
+            yield from iter_export(batches, format)
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        stream(),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="transactions.{format}"'},
     )
 
 
@@ -54,6 +130,11 @@ def create_tx(payload: TransactionCreate, db: Session = Depends(get_db)):
     return create_transaction(db, payload)
 
 
+@router.post("/transactions/batch", response_model=TransactionBatchResponse)
+def batch_txs(payload: TransactionBatchRequest, db: Session = Depends(get_db)):
+    return {"results": apply_transaction_batch(db, payload.operations)}
+
+
 @router.put("/transactions/{tx_id}", response_model=TransactionRead)
 def update_tx(tx_id: int, payload: TransactionUpdate, db: Session = Depends(get_db)):
     tx = get_transaction(db, tx_id)
@@ -0,0 +1,227 @@
+"""
+Response cache for the dashboard read endpoints.
+
+Keys are "<endpoint>:<data version>:<normalized params>". Every committed write
+that can change an aggregate (transactions, budgets, goals, CSV import) calls
+bump_data_version(), so stale entries are never read again and simply age out
+(TTL / LRU) instead of being deleted one by one.
+
+Backends (CACHE_BACKEND):
+- "memory": per-process LRU with TTL (default). The data version is per
+            process too: a write served by one uvicorn worker does not
+            invalidate the others' entries or ETags, so with more than one
+            worker responses can be stale. Use "redis" then.
+- "redis":  any Redis-protocol server at CACHE_REDIS_URL (Redis, Valkey, ...);
+            entries and the data version are shared between workers
+- "none":   caching disabled
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, Protocol
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+_VERSION_KEY = "spendsense:data_version"
+
+
+class CacheBackend(Protocol):
+    # Where the data version counts: equal versions only mean equal data within a scope
+    scope: str
+
+    def get(self, key: str) -> Any | None: ...
+
+    def set(self, key: str, value: Any, ttl: float) -> None: ...
+
+    def data_version(self) -> int: ...
+
+    def bump_data_version(self) -> int: ...
+
+    def __len__(self) -> int: ...
+
+
+class MemoryBackend:
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = 0
+        # The counter restarts at 0 in every process: a restart or another
+        # worker can reach the same number for different data
+        self.scope = uuid.uuid4().hex
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def data_version(self) -> int:
+        return self._version
+
+    def bump_data_version(self) -> int:
+        with self._lock:
+            self._version += 1
+            return self._version
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisBackend:
+    def __init__(self, client: Any) -> None:
+        # Anything with redis-py's get/set(px=)/incr/dbsize
+        self._client = client
+        # One counter shared by every worker
+        self.scope = "redis"
+
+    @classmethod
+    def from_url(cls, url: str) -> RedisBackend:
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package") from e
+        return cls(redis.Redis.from_url(url))
+
+    def get(self, key: str) -> Any | None:
+        raw = self._client.get(key)
+        return None if raw is None else json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._client.set(key, json.dumps(value), px=int(ttl * 1000))
+
+    def data_version(self) -> int:
+        return int(self._client.get(_VERSION_KEY) or 0)
+
+    def bump_data_version(self) -> int:
+        return int(self._client.incr(_VERSION_KEY))
+
+    def __len__(self) -> int:
+        return int(self._client.dbsize())
+
+
+class ResponseCache:
+    def __init__(self, backend: CacheBackend | None, ttl: float) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def key(self, endpoint: str, params: dict[str, Any]) -> str:
+        normalized = json.dumps(jsonable_encoder(params), sort_keys=True, separators=(",", ":"))
+        return f"{endpoint}:{self.backend.data_version()}:{normalized}"
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _lookup(self, endpoint: str, params: dict[str, Any]) -> tuple[str, Any | None]:
+        # Read the version before computing: a write committed meanwhile moves
+        # later readers to a new key, so this result can't shadow fresher data
+        key = self.key(endpoint, params)
+        value = self.backend.get(key)
+        self._count(value is not None)
+        return key, value
+
+    def _store(self, key: str, model: type[BaseModel] | None, result: Any) -> Any:
+        # Cache exactly what the response model would serialize (Decimals as strings);
+        # model=None means the result is JSON-ready already (see app.core.money)
+        value = result if model is None else model.model_validate(result).model_dump(mode="json")
+        self.backend.set(key, value, self.ttl)
+        return value
+
+    def get_or_compute(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        model: type[BaseModel] | None,
+        compute: Callable[[], Any],
+    ):
+        if self.backend is None:
+            return compute()
+        key, value = self._lookup(endpoint, params)
+        if value is None:
+            value = self._store(key, model, compute())
+        return value
+
+    async def aget_or_compute(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        model: type[BaseModel] | None,
+        compute: Callable[[], Awaitable[Any]],
+    ):
+        if self.backend is None:
+            return await compute()
+        key, value = self._lookup(endpoint, params)
+        if value is None:
+            value = self._store(key, model, await compute())
+        return value
+
+    def data_version(self) -> int | None:
+        return self.backend.data_version() if self.backend is not None else None
+
+    def version_tag(self) -> str | None:
+        """The data version qualified by its scope, for validators such as ETags."""
+        if self.backend is None:
+            return None
+        return f"{self.backend.scope}:{self.backend.data_version()}"
+
+    def bump_data_version(self) -> None:
+        if self.backend is not None:
+            self.backend.bump_data_version()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "backend": settings.cache_backend,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "entries": len(self.backend) if self.backend is not None else 0,
+            "data_version": self.backend.data_version() if self.backend is not None else 0,
+        }
+
+
+def _make_backend() -> CacheBackend | None:
+    if settings.cache_backend == "none":
+        return None
+    if settings.cache_backend == "redis":
+        return RedisBackend.from_url(settings.cache_redis_url)
+    if settings.cache_backend == "memory":
+        return MemoryBackend(settings.cache_max_entries)
+    raise ValueError(f"Unknown cache backend: {settings.cache_backend}")
+
+
+response_cache = ResponseCache(_make_backend(), settings.cache_ttl_seconds)
+
+
+def bump_data_version() -> None:
+    """Call after committing a write that can change a cached aggregate."""
+    response_cache.bump_data_version()
@@ -8,6 +8,52 @@ class Settings(BaseSettings):
     cors_origins: str = "http://localhost:3000"
 
     database_url: str  # REQUIRED
+    # "async" serves dashboard reads through an AsyncSession (needs postgresql+psycopg)
+    db_mode: str = "sync"  # sync | async
+
+    # Connection pool (applies to both the sync and async engines)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    # Seconds before a connection is replaced on checkout; -1 keeps connections forever
+    db_pool_recycle: int = 1800
+    # "always" pings on every checkout, "idle" only after DB_POOL_PRE_PING_IDLE_SECONDS
+    # in the pool, "never" relies on db_pool_recycle
+    db_pool_pre_ping: str = "idle"  # always | idle | never
+    db_pool_pre_ping_idle_seconds: float = 30.0
+
+    # CSV import: rows read, validated and committed per chunk
+    csv_import_chunk_size: int = 50_000
+    # "auto" uses COPY on PostgreSQL (psycopg 3) and batched INSERTs elsewhere
+    csv_import_backend: str = "auto"  # auto | copy | insert
+    csv_import_insert_batch_size: int = 5_000
+    # Rows already imported (same content fingerprint): skip | upsert
+    csv_import_on_duplicate: str = "skip"
+    # >1 parses/validates files larger than one byte-range chunk in a process pool
+    csv_import_workers: int = 1
+    csv_import_parallel_chunk_bytes: int = 16 * 1024 * 1024
+    # Background imports (POST /import/jobs): parallel workers and finished jobs kept
+    import_job_workers: int = 2
+    import_job_retention: int = 100
+
+    # Dashboard response cache; entries are also invalidated by any data write
+    cache_backend: str = "memory"  # memory | redis | none
+    cache_ttl_seconds: float = 300.0
+    cache_max_entries: int = 1_024
+    cache_redis_url: str = "redis://localhost:6379/0"
+
+    # "cents": aggregate endpoints carry amounts as int cents from SQL to the JSON
+    # encoder instead of Decimals through the response models (app/core/money.py)
+    money_mode: str = "decimal"  # decimal | cents
+
+    # Serve analytics from an in-process NumPy copy of `transactions` instead of SQL
+    columnar_store: bool = False
+
+    # Budget alert levels, in percent of the monthly limit (comma-separated)
+    budget_alert_thresholds: str = "50,80,100"
+
+    # Rows fetched per server-side cursor batch by GET /transactions/export
+    export_batch_size: int = 5_000
 
     model_config = SettingsConfigDict(
         env_file=".env",
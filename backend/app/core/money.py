@@ -0,0 +1,100 @@
+"""
+Integer-cents money mode (MONEY_MODE=cents) for the aggregate endpoints.
+
+In the default "decimal" mode amounts are Decimals from SQL through the
+response models. In "cents" mode the aggregate queries return
+ROUND(SUM(amount) * 100) as BIGINT, Python adds and subtracts plain ints, and
+the values become decimal strings only here, at the JSON boundary: the payload
+skips response-model validation and Decimal serialization entirely. The JSON
+is the same as in decimal mode ("12.30", "-0.05"), except that zero is always
+rendered as "0.00".
+"""
+
+from __future__ import annotations
+
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from sqlalchemy import BigInteger, cast, func
+
+from app.core.config import settings
+
+# Keys whose int values are cents in a cents-mode payload
+MONEY_FIELDS = frozenset(
+    {
+        "income",
+        "expense",
+        "net",
+        "cumulative_net",
+        "net_7d",
+        "net_30d",
+        "required_monthly_saving",
+        "avg_monthly_net_saving",
+        "monthly_shortfall",
+    }
+)
+
+
+def cents_mode() -> bool:
+    if settings.money_mode not in ("decimal", "cents"):
+        raise ValueError(f"Unknown money mode: {settings.money_mode}")
+    return settings.money_mode == "cents"
+
+
+def sum_cents(amount_sum):
+    """SQL: a money SUM(...) expression as rounded BIGINT cents."""
+    return cast(func.round(amount_sum * 100), BigInteger)
+
+
+def zero(cents: bool) -> int | Decimal:
+    return 0 if cents else Decimal("0.00")
+
+
+def cents_of(amount: Decimal) -> int:
+    return int(amount.scaleb(2).to_integral_value(ROUND_HALF_UP))
+
+
+def from_cents(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
+
+
+def div_cents(numerator: int, denominator: int) -> int:
+    """numerator / denominator rounded half-even, like Decimal.quantize."""
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    quotient, remainder = divmod(numerator, denominator)
+    if 2 * remainder > denominator or (2 * remainder == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
+
+def format_cents(cents: int) -> str:
+    sign = "-" if cents < 0 else ""
+    units, rem = divmod(abs(cents), 100)
+    return f"{sign}{units}.{rem:02d}"
+
+
+def money_json(value: Any) -> Any:
+    """Render the int cents under MONEY_FIELDS keys of a payload as decimal strings."""
+    if isinstance(value, list):
+        return [money_json(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    out = {}
+    for k, v in value.items():
+        if type(v) is int and k in MONEY_FIELDS:
+            out[k] = format_cents(v)
+        elif isinstance(v, (dict, list)):
+            out[k] = money_json(v)
+        else:
+            out[k] = v
+    return out
+
+
+def money_response(response: Response, content: Any) -> JSONResponse:
+    """Return JSON-ready content as is, keeping headers set by dependencies (ETag)."""
+    out = JSONResponse(content)
+    out.headers.raw.extend(response.headers.raw)
+    return out
@@ -3,11 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.models.budget import Budget
-from app.models.transaction import Transaction
+from app.models.budget import BudgetAlertState
 
 
 @dataclass
@@ -16,6 +15,7 @@ class AlertRow:
     monthly_limit: object  # Decimal from DB
     spent: object  # Decimal from DB
     over_by: object  # Decimal from DB
+    level: int  # highest threshold exceeded, percent of the limit
 
 
 def month_bounds(d: date) -> tuple[date, date]:
@@ -29,46 +29,29 @@ def month_bounds(d: date) -> tuple[date, date]:
     return start, end
 
 
-def get_over_budget_alerts(db: Session, *, for_date: date) -> list[AlertRow]:
-    start, end = month_bounds(for_date)
+def get_over_budget_alerts(db: Session, *, for_date: date, threshold: int = 100) -> list[AlertRow]:
+    """
+    Budgets whose spend in the month of `for_date` exceeds `threshold` percent
+    of the limit, most over budget first. Reads the alert states kept current
+    by services/budget_alerts.py instead of scanning the month's transactions.
+    """
+    start, _ = month_bounds(for_date)
+    states = BudgetAlertState
 
-    # Spend per category this month
-    spent_stmt = (
-        select(
-            Transaction.category.label("category"),
-            func.coalesce(func.sum(Transaction.amount), 0).label("spent"),
-        )
-        .where(Transaction.tx_type == "expense")
-        .where(Transaction.occurred_on >= start)
-        .where(Transaction.occurred_on <= end)
-        .group_by(Transaction.category)
-        .subquery()
-    )
-
-    # Join budgets with spent
     stmt = (
-        select(
-            Budget.category,
-            Budget.monthly_limit,
-            func.coalesce(spent_stmt.c.spent, 0).label("spent"),
-        )
-        .select_from(Budget)
-        .join(spent_stmt, spent_stmt.c.category == Budget.category, isouter=True)
+        select(states.category, states.monthly_limit, states.spent, states.level)
+        .where(states.month == start)
+        .where(states.level >= threshold)
+        .order_by((states.spent - states.monthly_limit).desc())
     )
 
-    rows = db.execute(stmt).all()
-
-    alerts: list[AlertRow] = []
-    for r in rows:
-        spent = r.spent
-        limit_ = r.monthly_limit
-        if spent > limit_:
-            alerts.append(
-                AlertRow(
-                    category=r.category, monthly_limit=limit_, spent=spent, over_by=spent - limit_
-                )
-            )
-
-    # sort by most over budget
-    alerts.sort(key=lambda x: x.over_by, reverse=True)
-    return alerts
+    return [
+        AlertRow(
+            category=r.category,
+            monthly_limit=r.monthly_limit,
+            spent=r.spent,
+            over_by=r.spent - r.monthly_limit,
+            level=r.level,
+        )
+        for r in db.execute(stmt)
+    ]
@@ -1,40 +1,88 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import date
-from decimal import Decimal
 
 from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 
-from app.models.transaction import Transaction
+from app.core.money import sum_cents, zero
+from app.models.rollup import DailyRollup
+from app.services.columnar_store import columnar_store
 
+# Trailing windows (days, inclusive of the day itself) of the rolling net sums
+ROLLING_WINDOWS = (7, 30)
 
-def get_daily_series(db: Session, *, date_from: date, date_to: date) -> list[dict]:
-    # Group by occurred_on (daily)
+
+def _total(tx_type: str, cents: bool):
+    total = func.coalesce(
+        func.sum(case((DailyRollup.tx_type == tx_type, DailyRollup.amount), else_=0)), 0
+    )
+    return sum_cents(total) if cents else total
+
+
+def get_daily_series(
+    db: Session,
+    *,
+    date_from: date,
+    date_to: date,
+    fill: bool = False,
+    cumulative: bool = False,
+    rolling: bool = False,
+    cents: bool = False,
+) -> list[dict]:
+    """
+    Income/expense/net per day in [date_from, date_to], oldest first.
+
+    By default only days with transactions are returned. With `fill` every day
+    of the range is, zeros included. `cumulative` adds `cumulative_net` (running
+    net from date_from) and `rolling` adds `net_7d`/`net_30d` (trailing sums,
+    counting the days before date_from too); both imply `fill`.
+    """
+    fill = fill or cumulative or rolling
+    # Rolling windows at the start of the range reach back before date_from
+    # (no further than date.min: there is nothing to sum before it)
+    lookback = max(ROLLING_WINDOWS) - 1 if rolling else 0
+    start = date.fromordinal(max(date_from.toordinal() - lookback, date.min.toordinal()))
+
+    if columnar_store.enabled:
+        points = columnar_store.daily(db, date_from=start, date_to=date_to, cents=cents)
+    else:
+        points = _sparse_series(db, date_from=start, date_to=date_to, cents=cents)
+
+    if not fill:
+        return points
+    return _fill_series(
+        points,
+        start=start,
+        date_from=date_from,
+        date_to=date_to,
+        cumulative=cumulative,
+        rolling=rolling,
+        cents=cents,
+    )
+
+
+def _sparse_series(db: Session, *, date_from: date, date_to: date, cents: bool) -> list[dict]:
+    # Read from the daily rollup: one row per (day, tx_type, category, bucket)
     stmt = (
         select(
-            Transaction.occurred_on.label("d"),
-            func.coalesce(
-                func.sum(case((Transaction.tx_type == "income", Transaction.amount), else_=0)),
-                0,
-            ).label("income"),
-            func.coalesce(
-                func.sum(case((Transaction.tx_type == "expense", Transaction.amount), else_=0)),
-                0,
-            ).label("expense"),
+            DailyRollup.day.label("d"),
+            _total("income", cents).label("income"),
+            _total("expense", cents).label("expense"),
         )
-        .where(Transaction.occurred_on >= date_from)
-        .where(Transaction.occurred_on <= date_to)
-        .group_by(Transaction.occurred_on)
-        .order_by(Transaction.occurred_on.asc())
+        .where(DailyRollup.day >= date_from)
+        .where(DailyRollup.day <= date_to)
+        .group_by(DailyRollup.day)
+        .order_by(DailyRollup.day.asc())
     )
 
     rows = db.execute(stmt).all()
 
     out: list[dict] = []
     for r in rows:
-        income = r.income or Decimal("0.00")
-        expense = r.expense or Decimal("0.00")
+        income = r.income or zero(cents)
+        expense = r.expense or zero(cents)
         out.append(
             {
                 "date": r.d.isoformat(),
@@ -44,3 +92,53 @@ def get_daily_series(db: Session, *, date_from: date, date_to: date) -> list[dic
             }
         )
     return out
+
+
+def _fill_series(
+    points: Iterable[dict],
+    *,
+    start: date,
+    date_from: date,
+    date_to: date,
+    cumulative: bool = False,
+    rolling: bool = False,
+    cents: bool = False,
+) -> list[dict]:
+    """
+    Expand sparse points (oldest first, covering [start, date_to]) to every day
+    in [date_from, date_to], in one pass with running window sums. Cheaper than
+    generate_series + window functions in Postgres, which ship a row per
+    calendar day (see benchmarks/bench_daily_calendar.py), and dialect-neutral.
+    """
+    by_day = {p["date"]: p for p in points}
+    nets: list = []
+    running = zero(cents)
+    windows = {days: zero(cents) for days in ROLLING_WINDOWS}
+    out: list[dict] = []
+
+    # By ordinal: stepping a date past date_to would overflow at date.max
+    for ordinal in range(start.toordinal(), date_to.toordinal() + 1):
+        day = date.fromordinal(ordinal)
+        key = day.isoformat()
+        p = by_day.get(key)
+        income = p["income"] if p else zero(cents)
+        expense = p["expense"] if p else zero(cents)
+        net = income - expense
+        nets.append(net)
+        if rolling:
+            for days in windows:
+                # Slide each trailing window by one day
+                windows[days] += net
+                if len(nets) > days:
+                    windows[days] -= nets[-days - 1]
+
+        if day >= date_from:
+            point = {"date": key, "income": income, "expense": expense, "net": net}
+            if cumulative:
+                running += net
+                point["cumulative_net"] = running
+            if rolling:
+                for days, total in windows.items():
+                    point[f"net_{days}d"] = total
+            out.append(point)
+    return out
@@ -3,25 +3,47 @@ from __future__ import annotations
 from datetime import date
 from decimal import Decimal
 
-from sqlalchemy import case, func, select
+from sqlalchemy import case, func, select, tuple_
 from sqlalchemy.orm import Session
 
+from app.core.money import sum_cents, zero
+from app.models.rollup import DailyRollup, MonthlyRollup
 from app.models.transaction import Transaction
+from app.services.columnar_store import columnar_store
 
+# GROUPING(bucket, category, month) values for each grouping set in get_summary
+_GROUPED_BY_BUCKET = 0b011
+_GROUPED_BY_CATEGORY = 0b101
+_GROUPED_BY_MONTH = 0b110
+_GROUPED_TOTAL = 0b111
 
-def _d0(x) -> Decimal:
-    return x if x is not None else Decimal("0.00")
 
+def _d0(x, cents: bool = False) -> Decimal | int:
+    return x if x is not None else zero(cents)
 
-def get_totals(db: Session, *, date_from: date | None = None, date_to: date | None = None) -> dict:
-    income_expr = func.coalesce(
-        func.sum(case((Transaction.tx_type == "income", Transaction.amount), else_=0)),
-        0,
+
+def _total(amount_sum, cents: bool):
+    # COALESCE(SUM(...), 0); rounded BIGINT cents in cents mode (see app.core.money)
+    total = func.coalesce(amount_sum, 0)
+    return sum_cents(total) if cents else total
+
+
+def get_totals(
+    db: Session,
+    *,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    cents: bool = False,
+) -> dict:
+    if columnar_store.enabled:
+        return columnar_store.totals(db, date_from=date_from, date_to=date_to, cents=cents)
+
+    income_expr = _total(
+        func.sum(case((Transaction.tx_type == "income", Transaction.amount), else_=0)), cents
     ).label("income")
 
-    expense_expr = func.coalesce(
-        func.sum(case((Transaction.tx_type == "expense", Transaction.amount), else_=0)),
-        0,
+    expense_expr = _total(
+        func.sum(case((Transaction.tx_type == "expense", Transaction.amount), else_=0)), cents
     ).label("expense")
 
     stmt = select(income_expr, expense_expr)
@@ -32,18 +54,25 @@ def get_totals(db: Session, *, date_from: date | None = None, date_to: date | No
         stmt = stmt.where(Transaction.occurred_on <= date_to)
 
     income, expense = db.execute(stmt).one()
-    income = _d0(income)
-    expense = _d0(expense)
+    income = _d0(income, cents)
+    expense = _d0(expense, cents)
     return {"income": income, "expense": expense, "net": income - expense}
 
 
 def get_by_bucket(
-    db: Session, *, date_from: date | None = None, date_to: date | None = None
+    db: Session,
+    *,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    cents: bool = False,
 ) -> list[dict]:
+    if columnar_store.enabled:
+        return columnar_store.by_bucket(db, date_from=date_from, date_to=date_to, cents=cents)
+
     stmt = (
         select(
             Transaction.bucket.label("bucket"),
-            func.coalesce(func.sum(Transaction.amount), 0).label("expense"),
+            _total(func.sum(Transaction.amount), cents).label("expense"),
         )
         .where(Transaction.tx_type == "expense")
         .group_by(Transaction.bucket)
@@ -56,7 +85,7 @@ def get_by_bucket(
         stmt = stmt.where(Transaction.occurred_on <= date_to)
 
     rows = db.execute(stmt).all()
-    return [{"bucket": r.bucket, "expense": _d0(r.expense)} for r in rows]
+    return [{"bucket": r.bucket, "expense": _d0(r.expense, cents)} for r in rows]
 
 
 def get_by_category(
@@ -65,11 +94,17 @@ def get_by_category(
     top_n: int = 10,
     date_from: date | None = None,
     date_to: date | None = None,
+    cents: bool = False,
 ) -> list[dict]:
+    if columnar_store.enabled:
+        return columnar_store.by_category(
+            db, top_n=top_n, date_from=date_from, date_to=date_to, cents=cents
+        )
+
     stmt = (
         select(
             Transaction.category.label("category"),
-            func.coalesce(func.sum(Transaction.amount), 0).label("expense"),
+            _total(func.sum(Transaction.amount), cents).label("expense"),
         )
         .where(Transaction.tx_type == "expense")
         .group_by(Transaction.category)
@@ -83,7 +118,7 @@ def get_by_category(
         stmt = stmt.where(Transaction.occurred_on <= date_to)
 
     rows = db.execute(stmt).all()
-    return [{"category": r.category, "expense": _d0(r.expense)} for r in rows]
+    return [{"category": r.category, "expense": _d0(r.expense, cents)} for r in rows]
 
 
 def get_monthly(
@@ -92,40 +127,148 @@ def get_monthly(
     months: int = 12,
     date_from: date | None = None,
     date_to: date | None = None,
+    cents: bool = False,
 ) -> list[dict]:
-    # Postgres: to_char(date, 'YYYY-MM') for grouping
-    month_expr = func.to_char(Transaction.occurred_on, "YYYY-MM").label("month")
+    if columnar_store.enabled:
+        return columnar_store.monthly(
+            db, months=months, date_from=date_from, date_to=date_to, cents=cents
+        )
 
-    income_expr = func.coalesce(
-        func.sum(case((Transaction.tx_type == "income", Transaction.amount), else_=0)),
-        0,
+    # Whole months come from the monthly rollup; date bounds need day granularity.
+    # Both group by an indexed first-of-month date, so rows come out in index order
+    # (no sort on to_char() strings) and the query runs unchanged on SQLite.
+    if date_from or date_to:
+        month_col = DailyRollup.month
+        rollup = DailyRollup
+    else:
+        month_col = MonthlyRollup.month
+        rollup = MonthlyRollup
+
+    income_expr = _total(
+        func.sum(case((rollup.tx_type == "income", rollup.amount), else_=0)), cents
     ).label("income")
 
-    expense_expr = func.coalesce(
-        func.sum(case((Transaction.tx_type == "expense", Transaction.amount), else_=0)),
-        0,
+    expense_expr = _total(
+        func.sum(case((rollup.tx_type == "expense", rollup.amount), else_=0)), cents
     ).label("expense")
 
     stmt = (
-        select(month_expr, income_expr, expense_expr)
-        .group_by(month_expr)
-        .order_by(month_expr.desc())
+        select(month_col.label("month"), income_expr, expense_expr)
+        .group_by(month_col)
+        .order_by(month_col.desc())
         .limit(months)
     )
 
     if date_from:
-        stmt = stmt.where(Transaction.occurred_on >= date_from)
+        # The month bound lets the (month, day) index skip earlier months
+        stmt = stmt.where(month_col >= date_from.replace(day=1), DailyRollup.day >= date_from)
     if date_to:
-        stmt = stmt.where(Transaction.occurred_on <= date_to)
+        stmt = stmt.where(month_col <= date_to, DailyRollup.day <= date_to)
 
     rows = db.execute(stmt).all()
 
     out: list[dict] = []
     for r in rows:
-        income = _d0(r.income)
-        expense = _d0(r.expense)
+        income = _d0(r.income, cents)
+        expense = _d0(r.expense, cents)
         out.append(
-            {"month": r.month, "income": income, "expense": expense, "net": income - expense}
+            {
+                "month": r.month.strftime("%Y-%m"),
+                "income": income,
+                "expense": expense,
+                "net": income - expense,
+            }
         )
 
     return list(reversed(out))
+
+
+def get_summary(
+    db: Session,
+    *,
+    top_n: int = 10,
+    months: int = 12,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    cents: bool = False,
+) -> dict:
+    """
+    Totals, by-bucket, by-category and monthly aggregates in one statement.
+    Same payload as calling get_totals/get_by_bucket/get_by_category/get_monthly,
+    but the daily rollup is scanned once via GROUPING SETS.
+    With `cents`, every amount is an int number of cents instead of a Decimal.
+    """
+    if columnar_store.enabled:
+        return columnar_store.summary(
+            db, top_n=top_n, months=months, date_from=date_from, date_to=date_to, cents=cents
+        )
+
+    month_expr = DailyRollup.month
+    is_expense = DailyRollup.tx_type == "expense"
+
+    def _sum(amount, where):
+        amount_sum = func.sum(amount).filter(where)
+        return sum_cents(amount_sum) if cents else amount_sum
+
+    # Bitmask of rolled-up columns (bucket, category, month): 1 = not grouped by that column
+    grouping_expr = func.grouping(DailyRollup.bucket, DailyRollup.category, month_expr)
+
+    stmt = select(
+        grouping_expr.label("grouping"),
+        DailyRollup.bucket.label("bucket"),
+        DailyRollup.category.label("category"),
+        month_expr.label("month"),
+        _sum(DailyRollup.amount, DailyRollup.tx_type == "income").label("income"),
+        _sum(DailyRollup.amount, is_expense).label("expense"),
+        func.sum(DailyRollup.tx_count).filter(is_expense).label("expense_rows"),
+    ).group_by(
+        func.grouping_sets(
+            tuple_(),
+            tuple_(DailyRollup.bucket),
+            tuple_(DailyRollup.category),
+            tuple_(month_expr),
+        )
+    )
+
+    if date_from:
+        stmt = stmt.where(DailyRollup.day >= date_from)
+    if date_to:
+        stmt = stmt.where(DailyRollup.day <= date_to)
+
+    totals = {"income": zero(cents), "expense": zero(cents), "net": zero(cents)}
+    by_bucket: list[dict] = []
+    by_category: list[dict] = []
+    monthly: list[dict] = []
+
+    for r in db.execute(stmt):
+        income = _d0(r.income, cents)
+        expense = _d0(r.expense, cents)
+        if r.grouping == _GROUPED_TOTAL:
+            totals = {"income": income, "expense": expense, "net": income - expense}
+        elif r.grouping == _GROUPED_BY_BUCKET:
+            # Mirror the WHERE tx_type = 'expense' of get_by_bucket
+            if r.expense_rows:
+                by_bucket.append({"bucket": r.bucket, "expense": expense})
+        elif r.grouping == _GROUPED_BY_CATEGORY:
+            if r.expense_rows:
+                by_category.append({"category": r.category, "expense": expense})
+        elif r.grouping == _GROUPED_BY_MONTH:
+            monthly.append(
+                {
+                    "month": r.month.strftime("%Y-%m"),
+                    "income": income,
+                    "expense": expense,
+                    "net": income - expense,
+                }
+            )
+
+    by_bucket.sort(key=lambda x: x["expense"], reverse=True)
+    by_category.sort(key=lambda x: x["expense"], reverse=True)
+    monthly.sort(key=lambda x: x["month"])
+
+    return {
+        "totals": totals,
+        "by_bucket": by_bucket,
+        "by_category": by_category[:top_n],
+        "monthly": monthly[-months:],
+    }
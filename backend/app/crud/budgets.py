@@ -3,8 +3,10 @@ from __future__ import annotations
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.core.cache import bump_data_version
 from app.models.budget import Budget
 from app.schemas.budget import BudgetCreate, BudgetUpdate
+from app.services.budget_alerts import refresh_alert_states
 
 
 def create_budget(db: Session, payload: BudgetCreate) -> Budget:
@@ -14,7 +16,10 @@ def create_budget(db: Session, payload: BudgetCreate) -> Budget:
         currency=payload.currency.upper(),
     )
     db.add(b)
+    db.flush()
+    refresh_alert_states(db, category=b.category)
     db.commit()
+    bump_data_version()
     db.refresh(b)
     return b
 
@@ -40,11 +45,17 @@ def update_budget(db: Session, b: Budget, payload: BudgetUpdate) -> Budget:
             v = v.upper()
         setattr(b, k, v)
     db.add(b)
+    db.flush()
+    refresh_alert_states(db, category=b.category)
     db.commit()
+    bump_data_version()
     db.refresh(b)
     return b
 
 
 def delete_budget(db: Session, b: Budget) -> None:
     db.delete(b)
+    db.flush()
+    refresh_alert_states(db, category=b.category)
     db.commit()
+    bump_data_version()
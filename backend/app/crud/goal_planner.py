@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import date
 from decimal import Decimal
-from math import ceil
 
+import numpy as np
 from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 
+from app.core.money import cents_of, div_cents, from_cents, sum_cents, zero
+from app.models.rollup import MonthlyRollup
 from app.models.transaction import Transaction
+from app.services.goal_simulation import simulate_goal
 
 
 def month_start(d: date) -> date:
@@ -25,45 +29,50 @@ def months_between_inclusive(start: date, end: date) -> int:
     return (end.year - start.year) * 12 + (end.month - start.month) + 1
 
 
-def get_recent_monthly_net(db: Session, *, months: int = 6) -> list[dict]:
-    # returns list of {"month": "YYYY-MM", "income": Decimal, "expense": Decimal, "net": Decimal}
-    month_expr = func.to_char(Transaction.occurred_on, "YYYY-MM").label("month")
+def _total(amount_sum, cents: bool):
+    total = func.coalesce(amount_sum, 0)
+    return sum_cents(total) if cents else total
+
 
+def get_recent_monthly_net(db: Session, *, months: int = 6, cents: bool = False) -> list[dict]:
+    # returns list of {"month": "YYYY-MM", "income": Decimal, "expense": Decimal, "net": Decimal}
+    # (int cents instead of Decimals with `cents`)
+    # Group by the first-of-month date: the rollup's key index already has it in order
     stmt = (
         select(
-            month_expr,
-            func.coalesce(
+            MonthlyRollup.month,
+            _total(
                 func.sum(
                     case(
-                        (Transaction.tx_type == "income", Transaction.amount),
+                        (MonthlyRollup.tx_type == "income", MonthlyRollup.amount),
                         else_=0,
                     )
                 ),
-                0,
+                cents,
             ).label("income"),
-            func.coalesce(
+            _total(
                 func.sum(
                     case(
-                        (Transaction.tx_type == "expense", Transaction.amount),
+                        (MonthlyRollup.tx_type == "expense", MonthlyRollup.amount),
                         else_=0,
                     )
                 ),
-                0,
+                cents,
             ).label("expense"),
         )
-        .group_by(month_expr)
-        .order_by(month_expr.desc())
+        .group_by(MonthlyRollup.month)
+        .order_by(MonthlyRollup.month.desc())
         .limit(months)
     )
 
     rows = db.execute(stmt).all()
     out = []
     for r in rows:
-        income = r.income or Decimal("0.00")
-        expense = r.expense or Decimal("0.00")
+        income = r.income or zero(cents)
+        expense = r.expense or zero(cents)
         out.append(
             {
-                "month": r.month,
+                "month": r.month.strftime("%Y-%m"),
                 "income": income,
                 "expense": expense,
                 "net": income - expense,
@@ -79,11 +88,12 @@ def get_top_spend_categories(
     date_to: date,
     buckets: list[str],
     top_n: int = 5,
+    cents: bool = False,
 ) -> list[dict]:
     stmt = (
         select(
             Transaction.category.label("category"),
-            func.coalesce(func.sum(Transaction.amount), 0).label("expense"),
+            _total(func.sum(Transaction.amount), cents).label("expense"),
         )
         .where(Transaction.tx_type == "expense")
         .where(Transaction.occurred_on >= date_from)
@@ -95,44 +105,17 @@ def get_top_spend_categories(
     )
 
     rows = db.execute(stmt).all()
-    return [{"category": r.category, "expense": r.expense or Decimal("0.00")} for r in rows]
-
-
-def plan_goal(
-    db: Session,
-    *,
-    target_amount: Decimal,
-    target_date: date,
-    history_months: int = 6,
-) -> dict:
-    today = date.today()
-    start_month = month_start(today)
-    end_month = month_start(target_date)
+    return [{"category": r.category, "expense": r.expense or zero(cents)} for r in rows]
 
-    months_remaining = months_between_inclusive(start_month, end_month)
-    required_monthly = (target_amount / Decimal(months_remaining)).quantize(Decimal("0.01"))
 
-    monthly = get_recent_monthly_net(db, months=history_months)
-    if monthly:
-        avg_net = (
-            sum((m["net"] for m in monthly), Decimal("0.00")) / Decimal(len(monthly))
-        ).quantize(Decimal("0.01"))
-    else:
-        avg_net = Decimal("0.00")
-
-    feasible = avg_net >= required_monthly and avg_net > 0
+def _div_half_even(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    # Vectorized div_cents for denominator > 0
+    quotient, remainder = np.divmod(numerator, denominator)
+    half = 2 * remainder
+    return quotient + ((half > denominator) | ((half == denominator) & (quotient % 2 == 1)))
 
-    shortfall = (
-        (required_monthly - avg_net).quantize(Decimal("0.01")) if not feasible else Decimal("0.00")
-    )
-
-    # If not feasible but avg_net > 0, estimate projected months to reach target
-    projected_months = None
-    projected_date = None
-    if avg_net > 0:
-        projected_months = int(ceil((target_amount / avg_net)))
-        projected_date = add_months(start_month, projected_months - 1)  # inclusive months
 
+def _current_month_cuts(db: Session, today: date, *, cents: bool) -> list[dict]:
     # Suggest where to cut based on last 30 days spend in controllable/unnecessary buckets
     # (simple heuristic; later we can use month boundaries)
     date_from = today.replace(day=1)
@@ -140,24 +123,131 @@ def plan_goal(
     next_month = add_months(date_from, 1)
     date_to = date(next_month.year, next_month.month, 1).fromordinal(next_month.toordinal() - 1)
 
-    top_cuts = get_top_spend_categories(
+    return get_top_spend_categories(
         db,
         date_from=date_from,
         date_to=date_to,
         buckets=["controllable", "unnecessary"],
         top_n=5,
+        cents=cents,
+    )
+
+
+def plan_goals(
+    db: Session,
+    goals: Sequence[tuple[Decimal, date]],
+    *,
+    history_months: int = 6,
+    cents: bool = False,
+) -> list[dict]:
+    """
+    Plan several (target_amount, target_date) goals at once: the monthly-net
+    history and the cut targets do not depend on the goal, so they are queried
+    once, and the per-goal math runs over NumPy arrays. Two queries in total,
+    whatever the number of goals. Each plan has plan_goal's payload.
+    """
+    # Arithmetic runs on int cents; Decimal.quantize's half-even rounding is kept
+    today = date.today()
+    start_month = month_start(today)
+    start_index = start_month.year * 12 + start_month.month - 1
+
+    monthly = get_recent_monthly_net(db, months=history_months, cents=True)
+    avg_net = div_cents(sum(m["net"] for m in monthly), len(monthly)) if monthly else 0
+    top_cuts = _current_month_cuts(db, today, cents=cents) if goals else []
+
+    target = np.array([cents_of(amount) for amount, _ in goals], dtype=np.int64)
+    end_index = np.array([d.year * 12 + d.month - 1 for _, d in goals], dtype=np.int64)
+    months_remaining = end_index - start_index + 1
+    # A goal whose month has passed needs the whole target now, not a division by <= 0
+    required_monthly = _div_half_even(target, np.maximum(months_remaining, 1))
+
+    feasible = (avg_net >= required_monthly) & (avg_net > 0)
+    shortfall = np.where(feasible, 0, required_monthly - avg_net)
+
+    # If not feasible but avg_net > 0, estimate projected months to reach target
+    if avg_net > 0:
+        projected = -(-target // avg_net)  # ceil
+        projected_labels = [
+            f"{i // 12:04d}-{i % 12 + 1:02d}" for i in (start_index + projected - 1).tolist()
+        ]  # inclusive months
+    else:
+        projected = projected_labels = None
+
+    money = int if cents else from_cents
+    avg = money(avg_net)
+    return [
+        {
+            "months_remaining": int(months_remaining[k]),
+            "required_monthly_saving": money(int(required_monthly[k])),
+            "avg_monthly_net_saving": avg,
+            "feasible": bool(feasible[k]),
+            "monthly_shortfall": money(int(shortfall[k])),
+            "projected_months_if_unchanged": int(projected[k]) if projected is not None else None,
+            "projected_goal_month_if_unchanged": (
+                projected_labels[k] if projected_labels is not None else None
+            ),
+            "suggested_cut_targets": top_cuts,
+            "history_months_used": history_months,
+        }
+        for k in range(len(goals))
+    ]
+
+
+def plan_goal(
+    db: Session,
+    *,
+    target_amount: Decimal,
+    target_date: date,
+    history_months: int = 6,
+    cents: bool = False,
+) -> dict:
+    return plan_goals(
+        db, [(target_amount, target_date)], history_months=history_months, cents=cents
+    )[0]
+
+
+def simulate_goal_plan(
+    db: Session,
+    *,
+    target_amount: Decimal,
+    target_date: date,
+    history_months: int = 12,
+    paths: int = 10_000,
+    horizon_months: int = 120,
+    seed: int | None = None,
+) -> dict:
+    """Monte Carlo counterpart of plan_goal (see app.services.goal_simulation)."""
+    start_month = month_start(date.today())
+    months_remaining = months_between_inclusive(start_month, month_start(target_date))
+
+    monthly = get_recent_monthly_net(db, months=history_months, cents=True)
+    result = simulate_goal(
+        [m["net"] for m in monthly],
+        target=cents_of(target_amount),
+        months_to_target=months_remaining,
+        paths=paths,
+        horizon_months=horizon_months,
+        seed=seed,
     )
 
     return {
         "months_remaining": months_remaining,
-        "required_monthly_saving": required_monthly,
-        "avg_monthly_net_saving": avg_net,
-        "feasible": feasible,
-        "monthly_shortfall": shortfall,
-        "projected_months_if_unchanged": projected_months,
-        "projected_goal_month_if_unchanged": (
-            projected_date.strftime("%Y-%m") if projected_date else None
-        ),
-        "suggested_cut_targets": top_cuts,
-        "history_months_used": history_months,
+        "paths": result.paths,
+        "horizon_months": result.horizon_months,
+        "history_months_sampled": len(monthly),
+        "probability_by_target_date": result.probability_by_target,
+        "probability_within_horizon": result.probability_within_horizon,
+        "completion_percentiles": [
+            {
+                "percentile": p,
+                "months": months,
+                # inclusive months, as projected_goal_month_if_unchanged
+                "month": (
+                    add_months(start_month, months - 1).strftime("%Y-%m")
+                    if months is not None
+                    else None
+                ),
+            }
+            for p, months in result.completion_months.items()
+        ],
     }
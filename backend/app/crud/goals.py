@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Collection
+
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.core.cache import bump_data_version
 from app.models.goal import Goal
 from app.schemas.goal import GoalCreate
 
@@ -16,6 +19,7 @@ def create_goal(db: Session, payload: GoalCreate) -> Goal:
     )
     db.add(g)
     db.commit()
+    bump_data_version()
     db.refresh(g)
     return g
 
@@ -24,11 +28,16 @@ def get_goal(db: Session, goal_id: int) -> Goal | None:
     return db.get(Goal, goal_id)
 
 
-def list_goals(db: Session, *, limit: int = 50, offset: int = 0) -> list[Goal]:
+def list_goals(
+    db: Session, *, limit: int = 50, offset: int = 0, ids: Collection[int] | None = None
+) -> list[Goal]:
     stmt = select(Goal).order_by(Goal.target_date.asc(), Goal.id.asc()).offset(offset).limit(limit)
+    if ids is not None:
+        stmt = stmt.where(Goal.id.in_(ids))
     return list(db.execute(stmt).scalars().all())
 
 
 def delete_goal(db: Session, g: Goal) -> None:
     db.delete(g)
     db.commit()
+    bump_data_version()
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
 from datetime import date
 
-from sqlalchemy import Select, select
+from sqlalchemy import Row, Select, delete, insert, select, tuple_, update
 from sqlalchemy.orm import Session
 
+from app.core.cache import bump_data_version
 from app.models.transaction import Transaction
-from app.schemas.transaction import TransactionCreate, TransactionUpdate
-from app.services.bucket_classifier import infer_bucket
+from app.schemas.transaction import BatchOperation, TransactionCreate, TransactionUpdate
+from app.services.bucket_classifier import infer_bucket, infer_buckets
+from app.services.bulk_loader import TRANSACTION_COLUMNS
+from app.services.columnar_store import columnar_store
+from app.services.rollups import apply_transaction_rows, transaction_row
 
 
 def create_transaction(db: Session, payload: TransactionCreate) -> Transaction:
@@ -21,8 +26,11 @@ def create_transaction(db: Session, payload: TransactionCreate) -> Transaction:
 
     tx = Transaction(**data)
     db.add(tx)
+    apply_transaction_rows(db, [transaction_row(tx)])
     db.commit()
+    bump_data_version()
     db.refresh(tx)
+    columnar_store.upsert_rows([(tx.id, *transaction_row(tx))])
     return tx
 
 
@@ -31,23 +39,15 @@ def get_transaction(db: Session, tx_id: int) -> Transaction | None:
     return db.get(Transaction, tx_id)
 
 
-def list_transactions(
-    db: Session,
+def _filter_transactions(
+    stmt: Select,
     *,
-    limit: int = 50,
-    offset: int = 0,
     tx_type: str | None = None,
     category: str | None = None,
     bucket: str | None = None,
     date_from: date | None = None,
     date_to: date | None = None,
-) -> list[Transaction]:
-    """List transactions with optional filters + pagination."""
-    stmt: Select[tuple[Transaction]] = select(Transaction).order_by(
-        Transaction.occurred_on.desc(),
-        Transaction.id.desc(),
-    )
-
+) -> Select:
     if tx_type:
         stmt = stmt.where(Transaction.tx_type == tx_type)
     if category:
@@ -58,24 +58,181 @@ def list_transactions(
         stmt = stmt.where(Transaction.occurred_on >= date_from)
     if date_to:
         stmt = stmt.where(Transaction.occurred_on <= date_to)
+    return stmt
+
 
-    stmt = stmt.offset(offset).limit(limit)
+def list_transactions(
+    db: Session,
+    *,
+    limit: int = 50,
+    offset: int = 0,
+    tx_type: str | None = None,
+    category: str | None = None,
+    bucket: str | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    after: tuple[date, int] | None = None,
+) -> list[Transaction]:
+    """
+    List transactions with optional filters + pagination.
+
+    `after` is a keyset cursor: the (occurred_on, id) of the last row of the
+    previous page. When given, `offset` is ignored and the page starts right
+    after that row, which the (occurred_on, id) index serves without skipping.
+    """
+    stmt: Select[tuple[Transaction]] = select(Transaction).order_by(
+        Transaction.occurred_on.desc(),
+        Transaction.id.desc(),
+    )
+    stmt = _filter_transactions(
+        stmt,
+        tx_type=tx_type,
+        category=category,
+        bucket=bucket,
+        date_from=date_from,
+        date_to=date_to,
+    )
+
+    if after is not None:
+        stmt = stmt.where(tuple_(Transaction.occurred_on, Transaction.id) < tuple_(*after))
+    else:
+        stmt = stmt.offset(offset)
+
+    stmt = stmt.limit(limit)
     return list(db.execute(stmt).scalars().all())
 
 
+def iter_transaction_rows(
+    db: Session,
+    *,
+    batch_size: int = 5_000,
+    tx_type: str | None = None,
+    category: str | None = None,
+    bucket: str | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> Iterator[Sequence[Row]]:
+    """
+    Yield batches of plain rows in TRANSACTION_COLUMNS order, oldest first.
+    Uses a server-side cursor, so memory is bounded by `batch_size`.
+    """
+    columns = [getattr(Transaction, c) for c in TRANSACTION_COLUMNS]
+    stmt = select(*columns).order_by(Transaction.occurred_on.asc(), Transaction.id.asc())
+    stmt = _filter_transactions(
+        stmt,
+        tx_type=tx_type,
+        category=category,
+        bucket=bucket,
+        date_from=date_from,
+        date_to=date_to,
+    )
+
+    result = db.execute(stmt.execution_options(yield_per=batch_size))
+    yield from result.partitions()
+
+
 def update_transaction(db: Session, tx: Transaction, payload: TransactionUpdate) -> Transaction:
     data = payload.model_dump(exclude_unset=True)
+    old_row = transaction_row(tx)
 
     # Intentionally NOT auto-assign bucket during updates.
     for k, v in data.items():
         setattr(tx, k, v)
 
     db.add(tx)
+    apply_transaction_rows(db, [old_row], sign=-1)
+    apply_transaction_rows(db, [transaction_row(tx)])
     db.commit()
+    bump_data_version()
     db.refresh(tx)
+    columnar_store.upsert_rows([(tx.id, *transaction_row(tx))])
     return tx
 
 
 def delete_transaction(db: Session, tx: Transaction) -> None:
+    apply_transaction_rows(db, [transaction_row(tx)], sign=-1)
+    tx_id = tx.id
     db.delete(tx)
     db.commit()
+    bump_data_version()
+    columnar_store.delete_ids([tx_id])
+
+
+def apply_transaction_batch(db: Session, operations: Sequence[BatchOperation]) -> list[dict]:
+    """
+    Apply create/update/delete operations in one database transaction.
+
+    Operations are resolved in request order in memory, then written with one
+    executemany INSERT ... RETURNING, one executemany UPDATE and one DELETE.
+    Returns one result dict per operation (see BatchItemResult).
+    """
+    columns = [Transaction.id, *(getattr(Transaction, c) for c in TRANSACTION_COLUMNS)]
+    ids = {op.id for op in operations if op.op != "create"}
+    existing: dict[int, dict] = {}
+    if ids:
+        rows = db.execute(select(*columns).where(Transaction.id.in_(ids))).mappings()
+        existing = {r["id"]: dict(r) for r in rows}
+
+    current = {tx_id: dict(row) for tx_id, row in existing.items()}
+    creates: list[tuple[int, dict]] = []
+    updated: set[int] = set()
+    deleted: set[int] = set()
+    results: list[dict] = []
+
+    for index, op in enumerate(operations):
+        result = {"index": index, "op": op.op, "status": "ok"}
+        if op.op == "create":
+            creates.append((index, op.data.model_dump()))
+        elif op.id not in current:
+            result.update(status="not_found", id=op.id)
+        elif op.op == "update":
+            # Intentionally NOT auto-assign bucket during updates.
+            current[op.id].update(op.data.model_dump(exclude_unset=True))
+            updated.add(op.id)
+            result["id"] = op.id
+        else:
+            del current[op.id]
+            updated.discard(op.id)
+            deleted.add(op.id)
+            result["id"] = op.id
+        results.append(result)
+
+    # Auto-bucket only for expenses if bucket missing, classified in one batch
+    unbucketed = [d for _, d in creates if d["tx_type"] == "expense" and not d["bucket"]]
+    guesses = infer_buckets((d["category"], d["note"]) for d in unbucketed)
+    for data, guessed in zip(unbucketed, guesses, strict=True):
+        data["bucket"] = guessed
+
+    def as_row(data: dict) -> tuple:
+        return tuple(data[c] for c in TRANSACTION_COLUMNS)
+
+    inserted = []
+    if creates:
+        stmt = insert(Transaction).returning(*columns, sort_by_parameter_order=True)
+        inserted = db.execute(stmt, [d for _, d in creates]).mappings().all()
+        for (index, _), row in zip(creates, inserted, strict=True):
+            results[index].update(id=row["id"], transaction=dict(row))
+        apply_transaction_rows(db, [as_row(r) for r in inserted])
+
+    if updated:
+        db.execute(update(Transaction), [current[tx_id] for tx_id in updated])
+    if deleted:
+        db.execute(delete(Transaction).where(Transaction.id.in_(deleted)))
+
+    apply_transaction_rows(db, [as_row(existing[i]) for i in updated | deleted], sign=-1)
+    apply_transaction_rows(db, [as_row(current[i]) for i in updated])
+    db.commit()
+    bump_data_version()
+    columnar_store.upsert_rows(
+        [(r["id"], *as_row(r)) for r in inserted] + [(i, *as_row(current[i])) for i in updated]
+    )
+    columnar_store.delete_ids(deleted)
+
+    if updated:
+        # Re-read updated rows once so results carry the stored (rounded) values
+        stmt = select(*columns).where(Transaction.id.in_(updated))
+        stored = {r["id"]: dict(r) for r in db.execute(stmt).mappings()}
+        for result in results:
+            if result["op"] == "update" and result.get("id") in stored:
+                result["transaction"] = stored[result["id"]]
+    return results
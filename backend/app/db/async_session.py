@@ -0,0 +1,28 @@
+from functools import lru_cache
+
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.db.pool import InstrumentedAsyncQueuePool, engine_options, instrument
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    # Created on first use: only DB_MODE=async needs an async driver (postgresql+psycopg)
+    engine = create_async_engine(
+        settings.database_url,
+        **engine_options(settings.database_url, InstrumentedAsyncQueuePool),
+    )
+    instrument(engine.sync_engine)
+    return engine
+
+
+@lru_cache
+def get_async_sessionmaker() -> async_sessionmaker:
+    # No expire_on_commit: attribute refreshes would need an awaited lazy load
+    return async_sessionmaker(bind=get_async_engine(), autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
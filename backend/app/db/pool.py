@@ -0,0 +1,179 @@
+"""
+Connection pool configuration and instrumentation shared by the sync and async engines.
+
+Pre-ping strategies (DB_POOL_PRE_PING):
+- "always": SQLAlchemy's pool_pre_ping, one extra round trip on every checkout
+- "idle":   ping only connections that sat in the pool longer than
+            DB_POOL_PRE_PING_IDLE_SECONDS
+- "never":  no ping; rely on DB_POOL_RECYCLE to retire old connections
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from sqlalchemy import event, exc, make_url
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+
+
+class PoolMetrics:
+    """Counters for one pool; read through snapshot()."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total_s = 0.0
+        self.wait_max_s = 0.0
+        self.overflow_peak = 0
+        self.connects = 0
+        self.disconnects = 0
+        self.pings = 0
+        self._connected_at: dict[int, float] = {}
+
+    def record_wait(self, seconds: float, *, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.checkouts += 1
+            self.wait_total_s += seconds
+            self.wait_max_s = max(self.wait_max_s, seconds)
+
+    def record_overflow(self, overflow: int) -> None:
+        with self._lock:
+            self.overflow_peak = max(self.overflow_peak, overflow)
+
+    def record_connect(self, key: int) -> None:
+        with self._lock:
+            self.connects += 1
+            self._connected_at[key] = time.monotonic()
+
+    def record_close(self, key: int) -> None:
+        with self._lock:
+            if self._connected_at.pop(key, None) is not None:
+                self.disconnects += 1
+
+    def record_ping(self) -> None:
+        with self._lock:
+            self.pings += 1
+
+    def snapshot(self, pool: QueuePool) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            ages = [now - t for t in self._connected_at.values()]
+            return {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+                "overflow_peak": self.overflow_peak,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_avg_ms": (
+                    round(self.wait_total_s / self.checkouts * 1000, 3) if self.checkouts else 0.0
+                ),
+                "wait_max_ms": round(self.wait_max_s * 1000, 3),
+                "connects": self.connects,
+                "disconnects": self.disconnects,
+                "pings": self.pings,
+                "open_connections": len(ages),
+                "connection_age_avg_s": round(sum(ages) / len(ages), 1) if ages else 0.0,
+                "connection_age_max_s": round(max(ages), 1) if ages else 0.0,
+            }
+
+
+class _InstrumentedPoolMixin:
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep counting into the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        # Time spent waiting for a free slot (or opening a new connection)
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record_wait(time.perf_counter() - start)
+        self.metrics.record_overflow(self.overflow())
+        return conn
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(url: str, poolclass: type[QueuePool]) -> dict:
+    """create_engine / create_async_engine keyword arguments from Settings."""
+    if make_url(url).get_backend_name() == "sqlite":
+        # SQLite keeps SQLAlchemy's default pool; sizing does not apply
+        return {"pool_pre_ping": settings.db_pool_pre_ping == "always"}
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping == "always",
+    }
+
+
+def instrument(engine: Engine) -> None:
+    """Attach PoolMetrics and the "idle" pre-ping strategy to a (sync) engine's pool."""
+    pool = engine.pool
+    if not isinstance(pool, _InstrumentedPoolMixin):
+        return
+    metrics = pool.metrics
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection, record):
+        metrics.record_connect(id(record))
+
+    @event.listens_for(pool, "close")
+    def _on_close(dbapi_connection, record):
+        metrics.record_close(id(record))
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(dbapi_connection, record, exception):
+        metrics.record_close(id(record))
+
+    if settings.db_pool_pre_ping != "idle":
+        return
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, record):
+        record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, record, proxy):
+        checked_in_at = record.info.get("checked_in_at")
+        if checked_in_at is None:
+            return
+        if time.monotonic() - checked_in_at < settings.db_pool_pre_ping_idle_seconds:
+            return
+        metrics.record_ping()
+        if not engine.dialect.do_ping(dbapi_connection):
+            # The pool discards this connection and retries with a fresh one
+            raise exc.DisconnectionError()
+
+
+def pool_status(engine: Engine) -> dict | None:
+    metrics = getattr(engine.pool, "metrics", None)
+    if metrics is None:
+        return None
+    return metrics.snapshot(engine.pool)
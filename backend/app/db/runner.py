@@ -0,0 +1,38 @@
+"""
+Database access for endpoints that serve both DB modes.
+
+Such endpoints are async and take a DbRunner instead of a session:
+`await run(fn, *args, **kwargs)` calls the sync implementation `fn(db, ...)`.
+By default it runs in the threadpool on a Session; with DB_MODE=async,
+create_app overrides get_db_runner with get_async_db_runner and the same
+function runs through AsyncSession.run_sync on the async driver.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.db.async_session import get_async_db
+from app.db.session import get_db
+
+DbRunner = Callable[..., Awaitable[Any]]
+
+
+async def get_db_runner(db: Session = Depends(get_db)) -> DbRunner:
+    async def run(fn: Callable[..., Any], *args, **kwargs):
+        return await run_in_threadpool(fn, db, *args, **kwargs)
+
+    return run
+
+
+async def get_async_db_runner(db: AsyncSession = Depends(get_async_db)) -> DbRunner:
+    async def run(fn: Callable[..., Any], *args, **kwargs):
+        return await db.run_sync(fn, *args, **kwargs)
+
+    return run
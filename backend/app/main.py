@@ -4,14 +4,17 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.alerts import router as alerts_router
 from app.api.analytics import router as analytics_router
 from app.api.budgets import router as budgets_router
+from app.api.cache import router as cache_router
 from app.api.db_ping import router as db_router
 from app.api.goal_plan import router as goal_plan_router
 from app.api.goals import router as goals_router
 from app.api.health import router as health_router
 from app.api.import_csv import router as import_router
+from app.api.transactions import NEXT_CURSOR_HEADER
 from app.api.transactions import router as transactions_router
 from app.core.config import settings
 from app.core.logging import setup_logging
+from app.db.runner import get_async_db_runner, get_db_runner
 
 
 def create_app() -> FastAPI:
@@ -29,10 +32,13 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
     )
 
     app.include_router(db_router)
 
+    app.include_router(cache_router)
+
     app.include_router(transactions_router)
 
     app.include_router(health_router)
@@ -41,13 +47,17 @@ def create_app() -> FastAPI:
 
     app.include_router(analytics_router)
 
-    app.include_router(budgets_router)
-
     app.include_router(alerts_router)
 
+    app.include_router(goal_plan_router)
+
+    app.include_router(budgets_router)
+
     app.include_router(goals_router)
 
-    app.include_router(goal_plan_router)
+    if settings.db_mode == "async":
+        # Endpoints taking a DbRunner (the dashboard reads) move to an AsyncSession
+        app.dependency_overrides[get_db_runner] = get_async_db_runner
 
     return app
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from datetime import date, datetime
 from decimal import Decimal
 
-from sqlalchemy import Numeric, String, UniqueConstraint
+from sqlalchemy import Date, DateTime, Integer, Numeric, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -20,3 +21,30 @@ class Budget(Base):
     currency: Mapped[str] = mapped_column(String(3), nullable=False, default="EUR")
 
     __table_args__ = (UniqueConstraint("category", name="uq_budgets_category"),)
+
+
+class BudgetAlertState(Base):
+    """
+    Spend against a budget per (month, category), kept current on every write
+    (see services/budget_alerts.py); GET /alerts reads it by month.
+    """
+
+    __tablename__ = "budget_alert_states"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+
+    month: Mapped[date] = mapped_column(Date, nullable=False)  # first day of the month
+    category: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    monthly_limit: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    spent: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+
+    # Highest threshold (percent of the limit) that spent exceeds, 0 below all of them
+    level: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Level before the last transition and when it happened
+    previous_level: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    level_changed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("month", "category", name="uq_budget_alert_states_month_category"),
+    )
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import (
+    DDL,
+    Computed,
+    Date,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    column,
+    event,
+    func,
+    literal_column,
+)
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.functions import GenericFunction
+
+from app.db.base import Base
+
+
+class month_of(GenericFunction):
+    """First day of the month of a date, in an expression a stored generated column accepts."""
+
+    type = Date()
+    inherit_cache = True
+
+
+@compiles(month_of, "postgresql")
+def _month_of_postgresql(element, compiler, **kw):
+    # date_trunc on a timestamp (not timestamptz) is immutable
+    return "CAST(date_trunc('month', CAST(%s AS timestamp)) AS date)" % compiler.process(
+        element.clauses, **kw
+    )
+
+
+@compiles(month_of, "sqlite")
+def _month_of_sqlite(element, compiler, **kw):
+    return "date(%s, 'start of month')" % compiler.process(element.clauses, **kw)
+
+
+# Stands in for a NULL category/bucket in the unique key of databases whose
+# unique indexes treat NULLs as distinct (SQLite), so such rows still conflict
+NULL_KEY = ""
+
+
+def portable_key(model, period_col) -> list:
+    """Unique key elements of a rollup table with NULLs folded into NULL_KEY."""
+    return [
+        period_col,
+        model.tx_type,
+        # Inlined, not bound: a conflict target must spell out the index expression
+        func.coalesce(model.category, literal_column(f"'{NULL_KEY}'")),
+        func.coalesce(model.bucket, literal_column(f"'{NULL_KEY}'")),
+    ]
+
+
+class DailyRollup(Base):
+    """Per-day sums of transactions, maintained incrementally (see services/rollups.py)."""
+
+    __tablename__ = "daily_rollups"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    # First day of the month of `day`, computed by the database; monthly group-bys use it
+    month: Mapped[date] = mapped_column(Date, Computed(month_of(column("day")), persisted=True))
+    tx_type: Mapped[str] = mapped_column(String(10), nullable=False)
+    category: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    bucket: Mapped[str | None] = mapped_column(String(20), nullable=True)
+
+    amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    tx_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # NULL category/bucket are a group of their own, so NULLs must not be distinct
+        Index(
+            "uq_daily_rollups_key",
+            "day",
+            "tx_type",
+            "category",
+            "bucket",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+        # Month charts walk this in order instead of sorting to_char() strings
+        Index(
+            "ix_daily_rollups_month_day",
+            "month",
+            "day",
+            postgresql_include=["tx_type", "amount"],
+        ),
+    )
+
+
+class MonthlyRollup(Base):
+    """Per-month sums of transactions; `month` is the first day of the month."""
+
+    __tablename__ = "monthly_rollups"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+
+    month: Mapped[date] = mapped_column(Date, nullable=False)
+    tx_type: Mapped[str] = mapped_column(String(10), nullable=False)
+    category: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    bucket: Mapped[str | None] = mapped_column(String(20), nullable=True)
+
+    amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    tx_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index(
+            "uq_monthly_rollups_key",
+            "month",
+            "tx_type",
+            "category",
+            "bucket",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+
+# PostgreSQL has the NULLS NOT DISTINCT indexes above; kept out of the metadata
+# (and so out of migrations), these only ever exist on SQLite
+for _model, _period_col in ((DailyRollup, DailyRollup.day), (MonthlyRollup, MonthlyRollup.month)):
+    event.listen(
+        _model.__table__,
+        "after_create",
+        DDL(
+            f"CREATE UNIQUE INDEX uq_{_model.__tablename__}_key_portable ON %(table)s "
+            f"({_period_col.key}, tx_type, "
+            f"coalesce(category, '{NULL_KEY}'), coalesce(bucket, '{NULL_KEY}'))"
+        ).execute_if(dialect="sqlite"),
+    )
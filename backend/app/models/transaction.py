@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import date
 from decimal import Decimal
 
-from sqlalchemy import CheckConstraint, Date, Numeric, String
+from sqlalchemy import CheckConstraint, Date, Index, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -24,6 +24,23 @@ class Transaction(Base):
     occurred_on: Mapped[date] = mapped_column(Date, nullable=False)
     note: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
+    # Content hash of CSV-imported rows (see services/fingerprints.py); NULL for manual entries
+    fingerprint: Mapped[str | None] = mapped_column(String(40), nullable=True)
+
     __table_args__ = (
         CheckConstraint("tx_type IN ('income','expense')", name="ck_transactions_tx_type"),
+        # Covering indexes for the analytics access paths (see migration a4db9976f81f)
+        Index(
+            "ix_transactions_tx_type_occurred_on",
+            "tx_type",
+            "occurred_on",
+            postgresql_include=["amount", "category", "bucket"],
+        ),
+        Index(
+            "ix_transactions_occurred_on_id",
+            "occurred_on",
+            "id",
+            postgresql_include=["tx_type", "amount"],
+        ),
+        Index("uq_transactions_fingerprint", "fingerprint", unique=True),
     )
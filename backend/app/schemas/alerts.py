@@ -9,7 +9,8 @@ class BudgetAlert(BaseModel):
     category: str
     monthly_limit: Decimal
     spent: Decimal
-    over_by: Decimal
+    over_by: Decimal  # negative while under the limit (threshold < 100)
+    threshold: int  # highest alert level exceeded, percent of the limit
 
     model_config = ConfigDict(from_attributes=True)
 
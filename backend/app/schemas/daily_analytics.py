@@ -10,6 +10,10 @@ class DailyPoint(BaseModel):
     income: Decimal
     expense: Decimal
     net: Decimal
+    # Only with ?cumulative=true / ?rolling=true
+    cumulative_net: Decimal | None = None
+    net_7d: Decimal | None = None
+    net_30d: Decimal | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -24,3 +24,34 @@ class GoalPlanResponse(BaseModel):
     history_months_used: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class GoalPlanItem(GoalPlanResponse):
+    goal_id: int
+    name: str
+
+
+class GoalPlansResponse(BaseModel):
+    plans: list[GoalPlanItem]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CompletionPercentile(BaseModel):
+    percentile: int
+    months: int | None  # None: not reached within horizon_months
+    month: str | None  # YYYY-MM
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class GoalSimulationResponse(BaseModel):
+    months_remaining: int
+    paths: int
+    horizon_months: int
+    history_months_sampled: int  # months of history the paths draw from
+    probability_by_target_date: float
+    probability_within_horizon: float
+    completion_percentiles: list[CompletionPercentile]
+
+    model_config = ConfigDict(from_attributes=True)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import date
 from decimal import Decimal
-from typing import Literal
+from typing import Annotated, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, condecimal
 
@@ -45,3 +45,41 @@ class TransactionRead(TransactionBase):
     amount: Decimal
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class BatchCreateOp(BaseModel):
+    op: Literal["create"]
+    data: TransactionCreate
+
+
+class BatchUpdateOp(BaseModel):
+    op: Literal["update"]
+    id: int
+    data: TransactionUpdate
+
+
+class BatchDeleteOp(BaseModel):
+    op: Literal["delete"]
+    id: int
+
+
+BatchOperation = Annotated[
+    BatchCreateOp | BatchUpdateOp | BatchDeleteOp,
+    Field(discriminator="op"),
+]
+
+
+class TransactionBatchRequest(BaseModel):
+    operations: list[BatchOperation] = Field(..., min_length=1, max_length=10_000)
+
+
+class BatchItemResult(BaseModel):
+    index: int  # position in the request's operations list
+    op: Literal["create", "update", "delete"]
+    status: Literal["ok", "not_found"]
+    id: int | None = None
+    transaction: TransactionRead | None = None
+
+
+class TransactionBatchResponse(BaseModel):
+    results: list[BatchItemResult]
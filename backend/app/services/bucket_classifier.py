@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Literal
 
 Bucket = Literal["necessary", "controllable", "unnecessary"]
@@ -53,20 +55,54 @@ KEYWORD_BUCKET_RULES: list[tuple[re.Pattern[str], Bucket]] = [
 ]
 
 
+# All keyword rules folded into one alternation, one named group per rule (r0, r1, ...)
+# so a note is scanned once; the lowest rule index found wins, as in the rule list.
+KEYWORD_BUCKET_PATTERN: re.Pattern[str] = re.compile(
+    "|".join(f"(?P<r{i}>{pattern.pattern})" for i, (pattern, _) in enumerate(KEYWORD_BUCKET_RULES)),
+    re.I,
+)
+_RULE_BUCKETS: dict[str, Bucket] = {f"r{i}": b for i, (_, b) in enumerate(KEYWORD_BUCKET_RULES)}
+_RULE_PRIORITY: dict[str, int] = {f"r{i}": i for i in range(len(KEYWORD_BUCKET_RULES))}
+
+CLASSIFIER_CACHE_SIZE = 8192
+
+
+def _match_note(note: str) -> Bucket | None:
+    best: str | None = None
+    for m in KEYWORD_BUCKET_PATTERN.finditer(note):
+        rule = m.lastgroup
+        if best is None or _RULE_PRIORITY[rule] < _RULE_PRIORITY[best]:
+            best = rule
+            if _RULE_PRIORITY[rule] == 0:
+                break
+    return _RULE_BUCKETS[best] if best else None
+
+
+@lru_cache(maxsize=CLASSIFIER_CACHE_SIZE)
+def _classify(category: str, note: str) -> Bucket | None:
+    # Arguments are already normalized (see infer_bucket) so repeats share cache entries
+    if category in CATEGORY_BUCKET_MAP:
+        return CATEGORY_BUCKET_MAP[category]
+    if note:
+        return _match_note(note)
+    return None
+
+
 def infer_bucket(*, category: str | None, note: str | None) -> Bucket | None:
     """
     Infer bucket from category/note.
     Returns None if not confident.
     """
-    if category:
-        c = category.strip().lower()
-        if c in CATEGORY_BUCKET_MAP:
-            return CATEGORY_BUCKET_MAP[c]
+    return _classify(
+        category.strip().lower() if category else "",
+        note.strip().lower() if note else "",
+    )
 
-    if note:
-        n = note.strip()
-        for pattern, bucket in KEYWORD_BUCKET_RULES:
-            if pattern.search(n):
-                return bucket
 
-    return None
+def infer_buckets(items: Iterable[tuple[str | None, str | None]]) -> list[Bucket | None]:
+    """Batch form of infer_bucket over (category, note) pairs."""
+    return [infer_bucket(category=c, note=n) for c, n in items]
+
+
+def classifier_cache_info():
+    return _classify.cache_info()
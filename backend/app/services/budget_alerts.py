@@ -0,0 +1,157 @@
+"""
+Budget alert states, evaluated incrementally.
+
+monthly_rollups already keeps the expense per (month, category) current on
+every write. apply_transaction_rows marks the (month, category) keys it
+touches, and when the session commits only those keys are re-evaluated
+against their budgets, in one upsert. Each state holds the highest threshold
+(BUDGET_ALERT_THRESHOLDS, percent of the limit) that the spend exceeds; a
+change of level is a transition, stamped with the previous level and time.
+GET /alerts is then a lookup by month.
+
+Backfill / repair (also after changing the thresholds):
+
+    python -m app.services.budget_alerts rebuild
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterable
+from datetime import date
+from functools import lru_cache
+
+from sqlalchemy import TextClause, bindparam, delete, event, text
+from sqlalchemy.orm import Session
+
+from app.core.cache import bump_data_version
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.budget import BudgetAlertState
+
+# Session.info key of the (month, category) pairs written since the last commit
+_PENDING = "budget_alert_keys"
+
+
+def alert_thresholds() -> list[int]:
+    return sorted({int(t) for t in settings.budget_alert_thresholds.split(",") if t.strip()})
+
+
+def mark_pending(db: Session, keys: Iterable[tuple[date, str]]) -> None:
+    """Re-evaluate these (month, category) states when `db` commits."""
+    db.info.setdefault(_PENDING, set()).update(keys)
+
+
+# Only the app's sessions: other sessions (tests, scripts on another engine)
+# commit without touching budget_alert_states
+@event.listens_for(SessionLocal, "before_commit")
+def _refresh_pending(session: Session) -> None:
+    # Once per commit, so an update (removal + insertion) is not seen half-applied
+    keys = session.info.pop(_PENDING, None)
+    if not keys:
+        return
+    refresh_alert_states(session, keys=keys)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING, None)
+
+
+# {level}: CASE over the thresholds; {scope}: which (month, category) keys to refresh.
+# Plain SQL that PostgreSQL and SQLite both run
+_UPSERT_SQL = """
+INSERT INTO budget_alert_states AS s
+    (month, category, monthly_limit, spent, level, previous_level, level_changed_at)
+SELECT r.month, b.category, b.monthly_limit, SUM(r.amount), {level}, 0, CURRENT_TIMESTAMP
+FROM monthly_rollups r
+JOIN budgets b ON b.category = r.category
+WHERE r.tx_type = 'expense' AND {scope}
+GROUP BY r.month, b.category, b.monthly_limit
+ON CONFLICT (month, category) DO UPDATE SET
+    monthly_limit = excluded.monthly_limit,
+    spent = excluded.spent,
+    level = excluded.level,
+    previous_level = CASE WHEN s.level <> excluded.level THEN s.level ELSE s.previous_level END,
+    level_changed_at = CASE WHEN s.level <> excluded.level
+                            THEN excluded.level_changed_at ELSE s.level_changed_at END
+"""
+
+# States whose month has no spend left or whose budget is gone (no DELETE alias in SQLite)
+_DELETE_SQL = """
+DELETE FROM budget_alert_states
+WHERE {scope}
+  AND (NOT EXISTS (SELECT 1 FROM monthly_rollups r
+                   WHERE r.month = budget_alert_states.month
+                     AND r.category = budget_alert_states.category
+                     AND r.tx_type = 'expense')
+       OR NOT EXISTS (SELECT 1 FROM budgets b WHERE b.category = budget_alert_states.category))
+"""
+
+_SCOPES = {
+    # Expanded to one (month, category) pair per key at execution
+    "keys": "({t}.month, {t}.category) IN :keys",
+    "category": "{t}.category = :category",
+    "all": "TRUE",
+}
+
+
+@lru_cache
+def _statements(scope: str, thresholds: tuple[int, ...]) -> tuple[TextClause, TextClause]:
+    # Plain SQL built once: INSERT ... SELECT constructs are not in SQLAlchemy's
+    # compiled cache, and compiling them cost more than running them
+    level = "CASE {} ELSE 0 END".format(
+        " ".join(
+            f"WHEN SUM(r.amount) * 100 > b.monthly_limit * {t} THEN {t}"
+            for t in reversed(thresholds)
+        )
+    )
+    upsert = text(_UPSERT_SQL.format(level=level, scope=_SCOPES[scope].format(t="r")))
+    remove = text(_DELETE_SQL.format(scope=_SCOPES[scope].format(t="budget_alert_states")))
+    if scope == "keys":
+        upsert = upsert.bindparams(bindparam("keys", expanding=True))
+        remove = remove.bindparams(bindparam("keys", expanding=True))
+    return upsert, remove
+
+
+def refresh_alert_states(
+    db: Session,
+    *,
+    keys: Iterable[tuple[date, str]] | None = None,
+    category: str | None = None,
+) -> None:
+    """Re-evaluate the states of `keys`, of one `category`, or (neither) all of them."""
+    if keys is not None:
+        scope, params = "keys", {"keys": sorted(keys)}
+    elif category is not None:
+        scope, params = "category", {"category": category}
+    else:
+        scope, params = "all", {}
+
+    upsert, remove = _statements(scope, tuple(alert_thresholds()))
+    db.execute(upsert, params)
+    db.execute(remove, params)
+
+
+def rebuild_alert_states(db: Session) -> None:
+    """Recompute every state from monthly_rollups and budgets (drops transition history)."""
+    db.execute(delete(BudgetAlertState))
+    refresh_alert_states(db)
+    db.commit()
+    bump_data_version()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Maintain budget alert states.")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        rebuild_alert_states(db)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Literal
+
+from sqlalchemy import column, insert, select, table, text, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.transaction import Transaction
+from app.services.rollups import apply_transaction_rows
+
+BulkBackend = Literal["auto", "copy", "insert"]
+# What merge_transactions does with rows whose fingerprint already exists
+DuplicateMode = Literal["skip", "upsert"]
+
+# Column order of every row tuple handed to the loader
+TRANSACTION_COLUMNS: tuple[str, ...] = (
+    "tx_type",
+    "amount",
+    "currency",
+    "category",
+    "bucket",
+    "occurred_on",
+    "note",
+)
+
+STAGING_TABLE = "transactions_staging"
+STAGING_COLUMNS: tuple[str, ...] = (*TRANSACTION_COLUMNS, "fingerprint")
+
+# Per-connection scratch table; emptied on every commit
+_CREATE_STAGING_SQL = f"""
+CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} (
+    tx_type varchar(10),
+    amount numeric(12, 2),
+    currency varchar(3),
+    category varchar(50),
+    bucket varchar(20),
+    occurred_on date,
+    note varchar(255),
+    fingerprint varchar(40)
+) ON COMMIT DELETE ROWS
+"""
+
+_COLUMNS_SQL = ", ".join(TRANSACTION_COLUMNS)
+# Fields an upsert may change; the fingerprinted ones are equal on conflict
+_UPDATABLE = ("currency", "category", "bucket", "note")
+
+
+def _changed_sql(old: str, new: str) -> str:
+    return (
+        f"({', '.join(f'{old}.{c}' for c in _UPDATABLE)}) IS DISTINCT FROM "
+        f"({', '.join(f'{new}.{c}' for c in _UPDATABLE)})"
+    )
+
+
+# Stored versions of the rows an upsert is about to change (for the rollup deltas)
+_UPSERT_OLD_ROWS_SQL = f"""
+SELECT {", ".join(f"t.{c}" for c in TRANSACTION_COLUMNS)}
+FROM {Transaction.__tablename__} t
+JOIN {STAGING_TABLE} s ON s.fingerprint = t.fingerprint
+WHERE {_changed_sql('t', 's')}
+FOR UPDATE OF t
+"""
+
+_MERGE_SQL = f"""
+INSERT INTO {Transaction.__tablename__} AS t ({_COLUMNS_SQL}, fingerprint)
+SELECT {_COLUMNS_SQL}, fingerprint FROM {STAGING_TABLE} s
+ON CONFLICT (fingerprint) {{action}}
+RETURNING t.id, {", ".join(f"t.{c}" for c in TRANSACTION_COLUMNS)}, (t.xmax = 0) AS inserted
+"""
+
+_SKIP_ACTION = "DO NOTHING"
+_UPSERT_ACTION = (
+    f"DO UPDATE SET {', '.join(f'{c} = EXCLUDED.{c}' for c in _UPDATABLE)} "
+    f"WHERE {_changed_sql('t', 'EXCLUDED')}"
+)
+
+
+@dataclass
+class MergeResult:
+    inserted: int
+    updated: int
+    skipped: int
+    # (id, *TRANSACTION_COLUMNS) of every row inserted or updated
+    rows: list[tuple] = field(default_factory=list)
+
+
+def resolve_backend(db: Session, backend: BulkBackend | None = None) -> Literal["copy", "insert"]:
+    """
+    Pick the staging loader for the session's database.
+    COPY needs PostgreSQL through psycopg 3; everything else uses batched INSERTs.
+    """
+    backend = backend or settings.csv_import_backend
+    if backend == "auto":
+        dialect = db.get_bind().dialect
+        if dialect.name == "postgresql" and dialect.driver == "psycopg":
+            return "copy"
+        return "insert"
+    if backend not in ("copy", "insert"):
+        raise ValueError(f"Unknown bulk insert backend: {backend}")
+    return backend
+
+
+def merge_transactions(
+    db: Session,
+    rows: Sequence[Sequence],
+    fingerprints: Sequence[str],
+    *,
+    on_duplicate: DuplicateMode = "skip",
+    backend: BulkBackend | None = None,
+) -> MergeResult:
+    """
+    Insert fingerprinted rows, resolving duplicates through the unique
+    fingerprint index in one INSERT ... ON CONFLICT from a staging table:
+
+    - "skip":   existing fingerprints are left alone
+    - "upsert": existing rows take the new currency/category/bucket/note
+
+    Rollups follow the rows actually inserted or changed. Other databases
+    (SQLite in development) take _merge_portable; the caller commits.
+    """
+    if on_duplicate not in ("skip", "upsert"):
+        raise ValueError(f"Unknown duplicate mode: {on_duplicate}")
+    if db.get_bind().dialect.name != "postgresql":
+        return _merge_portable(db, rows, fingerprints, on_duplicate=on_duplicate)
+
+    db.execute(text(_CREATE_STAGING_SQL))
+    db.execute(text(f"TRUNCATE {STAGING_TABLE}"))
+    staged = [(*row, fp) for row, fp in zip(rows, fingerprints, strict=True)]
+    if resolve_backend(db, backend) == "copy":
+        _copy_rows(db, staged, STAGING_TABLE, STAGING_COLUMNS)
+    else:
+        _insert_rows(db, staged, STAGING_TABLE, STAGING_COLUMNS)
+
+    if on_duplicate == "upsert":
+        old_rows = db.execute(text(_UPSERT_OLD_ROWS_SQL)).all()
+        apply_transaction_rows(db, old_rows, sign=-1)
+        action = _UPSERT_ACTION
+    else:
+        action = _SKIP_ACTION
+
+    written = db.execute(text(_MERGE_SQL.format(action=action))).all()
+    rows_written = [tuple(r[:-1]) for r in written]
+    apply_transaction_rows(db, [r[1:] for r in rows_written])
+
+    inserted = sum(1 for r in written if r.inserted)
+    updated = len(written) - inserted
+    return MergeResult(
+        inserted=inserted,
+        updated=updated,
+        skipped=len(staged) - len(written),
+        rows=rows_written,
+    )
+
+
+def _merge_portable(
+    db: Session,
+    rows: Sequence[Sequence],
+    fingerprints: Sequence[str],
+    *,
+    on_duplicate: DuplicateMode,
+) -> MergeResult:
+    # Look the fingerprints up, then insert the new rows and update the changed
+    # ones. Unlike ON CONFLICT this races with a concurrent import of the same
+    # rows, which the single-writer databases it serves cannot run.
+    tx = Transaction.__table__
+    stored_cols = [tx.c.id, *(tx.c[c] for c in TRANSACTION_COLUMNS)]
+    existing: dict[str, tuple] = {}
+    it = iter(fingerprints)
+    while batch := list(islice(it, settings.csv_import_insert_batch_size)):
+        stmt = select(tx.c.fingerprint, *stored_cols).where(tx.c.fingerprint.in_(batch))
+        existing.update((r[0], tuple(r[1:])) for r in db.execute(stmt))
+
+    new: list[dict] = []
+    changed: list[tuple[int, dict]] = []
+    old_rows: list[tuple] = []
+    for row, fp in zip(rows, fingerprints, strict=True):
+        values = dict(zip(TRANSACTION_COLUMNS, row, strict=True))
+        old = existing.get(fp)
+        if old is None:
+            new.append({**values, "fingerprint": fp})
+        elif on_duplicate == "upsert" and any(
+            values[c] != old[1 + TRANSACTION_COLUMNS.index(c)] for c in _UPDATABLE
+        ):
+            changed.append((old[0], {c: values[c] for c in _UPDATABLE}))
+            old_rows.append(old[1:])
+
+    written: list[tuple] = []
+    if new:
+        stmt = insert(tx).returning(*stored_cols, sort_by_parameter_order=True)
+        written.extend(tuple(r) for r in db.execute(stmt, new))
+    apply_transaction_rows(db, old_rows, sign=-1)
+    for tx_id, values in changed:
+        stmt = update(tx).where(tx.c.id == tx_id).values(values).returning(*stored_cols)
+        written.append(tuple(db.execute(stmt).one()))
+    apply_transaction_rows(db, [r[1:] for r in written])
+
+    return MergeResult(
+        inserted=len(new),
+        updated=len(changed),
+        skipped=len(rows) - len(new) - len(changed),
+        rows=written,
+    )
+
+
+def _copy_rows(
+    db: Session,
+    rows: Iterable[Sequence],
+    table_name: str = Transaction.__tablename__,
+    columns: Sequence[str] = TRANSACTION_COLUMNS,
+) -> int:
+    # Borrow the psycopg connection bound to the session's transaction
+    raw = db.connection().connection.driver_connection
+
+    count = 0
+    with raw.cursor() as cur:
+        with cur.copy(f"COPY {table_name} ({', '.join(columns)}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row(row)
+                count += 1
+    return count
+
+
+def _insert_rows(
+    db: Session,
+    rows: Iterable[Sequence],
+    table_name: str = Transaction.__tablename__,
+    columns: Sequence[str] = TRANSACTION_COLUMNS,
+) -> int:
+    batch_size = settings.csv_import_insert_batch_size
+    stmt = insert(table(table_name, *(column(c) for c in columns)))
+
+    count = 0
+    it = iter(rows)
+    while batch := list(islice(it, batch_size)):
+        # A list of parameter dicts runs as executemany
+        db.execute(stmt, [dict(zip(columns, row, strict=True)) for row in batch])
+        count += len(batch)
+    return count
@@ -0,0 +1,385 @@
+"""
+Optional in-process columnar copy of `transactions` for analytics (COLUMNAR_STORE=true).
+
+One NumPy array per column, 28 bytes per row:
+
+    id int64 | day int32 (days since 1970-01-01) | month int16 (months since 1970-01)
+    cents int64 | tx_type int8 | category int32 | bucket int8
+
+plus about 100 bytes per row for the id -> position dict that writes look
+rows up in, so budget roughly 130 bytes per transaction.
+
+category/bucket are codes into per-store dictionaries (code 0 = NULL). The
+store loads lazily on the first query and then follows writes through
+upsert_rows / delete_ids, which the CRUD and import paths call after
+committing. While a (re)load reads its snapshot, those calls are queued and
+replayed onto the new arrays once it is in place; both are idempotent per id,
+so a write the snapshot already contains is applied twice at worst, never
+lost. Writes that bypass those paths (raw SQL) need reload().
+
+Query methods return the same payloads as crud/analytics. Every aggregate is
+one np.bincount over (group code * 2 + tx_type), so a query costs a few passes
+over the selected rows and no SQL.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+from sqlalchemy import BigInteger, cast, func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.transaction import Transaction
+from app.services.rollups import to_cents
+
+TX_TYPE_CODES = {"income": 0, "expense": 1}
+_INCOME, _EXPENSE = 0, 1
+
+_EPOCH = date(1970, 1, 1)
+_LOAD_BATCH = 50_000
+
+# (name, dtype) of every column array
+_COLUMNS = (
+    ("ids", np.int64),
+    ("day", np.int32),
+    ("month", np.int16),
+    ("cents", np.int64),
+    ("tx_type", np.int8),
+    ("category", np.int32),
+    ("bucket", np.int8),
+)
+# Attributes a reload swaps in from the freshly loaded store
+_STATE = ("_n", "_pos", "_categories", "_buckets", *(f"_{name}" for name, _ in _COLUMNS))
+
+
+def _money(cents) -> Decimal:
+    return Decimal(int(cents)).scaleb(-2)
+
+
+def _out(cents: bool):
+    # Amount conversion for results: int cents as is, or Decimal
+    return int if cents else _money
+
+
+def _flow(income: int, expense: int, money=_money) -> dict:
+    return {"income": money(income), "expense": money(expense), "net": money(income - expense)}
+
+
+def _month_label(index: int) -> str:
+    year, month = divmod(int(index), 12)
+    return f"{year + 1970:04d}-{month + 1:02d}"
+
+
+class _Dictionary:
+    """Value <-> int code; code 0 is NULL."""
+
+    def __init__(self) -> None:
+        self.values: list[str | None] = [None]
+        self._codes: dict[str | None, int] = {None: 0}
+
+    def code(self, value: str | None) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def encode(self, values: Sequence[str | None], dtype) -> np.ndarray:
+        codes = np.fromiter(map(self.code, values), dtype=np.int64, count=len(values))
+        if len(self.values) > np.iinfo(dtype).max:
+            raise OverflowError(f"More than {np.iinfo(dtype).max} distinct values")
+        return codes.astype(dtype)
+
+
+class ColumnarStore:
+    def __init__(self, *, enabled: bool) -> None:
+        self.enabled = enabled
+        self.loaded = False
+        # _lock guards the arrays; _load_lock lets one thread at a time (re)load
+        self._lock = threading.RLock()
+        self._load_lock = threading.RLock()
+        self._loading = False
+        self._queued: list[tuple[Callable[[list], None], list]] = []
+        self._reset()
+
+    def _reset(self) -> None:
+        self._n = 0
+        for name, dtype in _COLUMNS:
+            setattr(self, f"_{name}", np.empty(0, dtype=dtype))
+        self._pos: dict[int, int] = {}
+        self._categories = _Dictionary()
+        self._buckets = _Dictionary()
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays (capacity included)."""
+        return sum(getattr(self, f"_{name}").nbytes for name, _ in _COLUMNS)
+
+    # ---- loading and write hooks -------------------------------------------------
+
+    def reload(self, db: Session) -> None:
+        """
+        Read every transaction into new arrays and swap them in. Queries keep
+        answering from the current arrays meanwhile; writes are queued.
+        """
+        stmt = select(
+            Transaction.id,
+            Transaction.tx_type,
+            cast(func.round(Transaction.amount * 100), BigInteger),
+            Transaction.category,
+            Transaction.bucket,
+            Transaction.occurred_on,
+        ).execution_options(yield_per=_LOAD_BATCH)
+        with self._load_lock:
+            # Queue from before the snapshot starts, so no commit falls in between
+            with self._lock:
+                self._loading = True
+            fresh = None
+            try:
+                fresh = ColumnarStore(enabled=True)
+                for batch in db.execute(stmt).partitions():
+                    fresh._append(fresh._encode(*zip(*batch, strict=True)))
+            finally:
+                with self._lock:
+                    if fresh is not None:
+                        for name in _STATE:
+                            setattr(self, name, getattr(fresh, name))
+                        self.loaded = True
+                    # On failure the writes still reach the arrays we kept
+                    self._loading = False
+                    queued, self._queued = self._queued, []
+                    for apply, arg in queued:
+                        apply(arg)
+
+    def ensure_loaded(self, db: Session) -> None:
+        if not self.loaded:
+            with self._load_lock:
+                if not self.loaded:
+                    self.reload(db)
+
+    def upsert_rows(self, rows: Iterable[Sequence]) -> None:
+        """Add or replace rows given as (id, *TRANSACTION_COLUMNS)."""
+        rows = list(rows)
+        if not rows:
+            return
+        with self._lock:
+            if self._loading:
+                self._queued.append((self.upsert_rows, rows))
+                return
+            if not self.loaded:
+                return
+            ids, tx_types, amounts, _, categories, buckets, days, _ = zip(*rows, strict=True)
+            cents = [int(to_cents(a) * 100) for a in amounts]
+            encoded = self._encode(ids, tx_types, cents, categories, buckets, days)
+            # Last write wins for ids repeated within `rows`
+            positions: dict[int, int] = {}
+            for k, tx_id in enumerate(ids):
+                positions[tx_id] = k
+            existing = [(self._pos[i], k) for i, k in positions.items() if i in self._pos]
+            new = [k for i, k in positions.items() if i not in self._pos]
+            if existing:
+                at, src = (np.array(x) for x in zip(*existing, strict=True))
+                for name, _ in _COLUMNS:
+                    getattr(self, f"_{name}")[at] = encoded[name][src]
+            if new:
+                self._append({name: col[new] for name, col in encoded.items()})
+
+    def delete_ids(self, ids: Iterable[int]) -> None:
+        ids = list(ids)
+        with self._lock:
+            if self._loading:
+                self._queued.append((self.delete_ids, ids))
+                return
+            if not self.loaded:
+                return
+            for tx_id in ids:
+                i = self._pos.pop(tx_id, None)
+                if i is None:
+                    continue
+                # Swap-remove: move the last row into the hole
+                last = self._n - 1
+                if i != last:
+                    for name, _ in _COLUMNS:
+                        arr = getattr(self, f"_{name}")
+                        arr[i] = arr[last]
+                    self._pos[int(self._ids[i])] = i
+                self._n = last
+
+    def _encode(self, ids, tx_types, cents, categories, buckets, days) -> dict[str, np.ndarray]:
+        day = np.array(days, dtype="datetime64[D]")
+        return {
+            "ids": np.array(ids, dtype=np.int64),
+            "day": day.astype(np.int32),
+            "month": day.astype("datetime64[M]").astype(np.int16),
+            "cents": np.array(cents, dtype=np.int64),
+            "tx_type": np.array([TX_TYPE_CODES[t] for t in tx_types], dtype=np.int8),
+            "category": self._categories.encode(categories, np.int32),
+            "bucket": self._buckets.encode(buckets, np.int8),
+        }
+
+    def _append(self, columns: dict[str, np.ndarray]) -> None:
+        count = len(columns["ids"])
+        start, end = self._n, self._n + count
+        if end > len(self._ids):
+            capacity = max(end, 2 * len(self._ids), 1024)
+            for name, dtype in _COLUMNS:
+                grown = np.empty(capacity, dtype=dtype)
+                grown[:start] = getattr(self, f"_{name}")[:start]
+                setattr(self, f"_{name}", grown)
+        for name, _ in _COLUMNS:
+            getattr(self, f"_{name}")[start:end] = columns[name]
+        self._pos.update(zip(columns["ids"].tolist(), range(start, end), strict=True))
+        self._n = end
+
+    # ---- queries -----------------------------------------------------------------
+
+    def _view(self, date_from: date | None, date_to: date | None, *names: str):
+        cols = [getattr(self, f"_{name}")[: self._n] for name in names]
+        if date_from is None and date_to is None:
+            return cols
+        day = self._day[: self._n]
+        mask = np.ones(self._n, dtype=bool)
+        if date_from is not None:
+            mask &= day >= (date_from - _EPOCH).days
+        if date_to is not None:
+            mask &= day <= (date_to - _EPOCH).days
+        return [c[mask] for c in cols]
+
+    @staticmethod
+    def _by(keys: np.ndarray, tx_type: np.ndarray, amount: np.ndarray, size: int):
+        """(size, 2) cent sums and row counts per key, column = tx_type code."""
+        key = keys.astype(np.int64) * 2 + tx_type
+        # Float64 weights are exact for integer cents below 2**53
+        sums = np.bincount(key, weights=amount, minlength=2 * size)
+        counts = np.bincount(key, minlength=2 * size)
+        return np.rint(sums).astype(np.int64).reshape(size, 2), counts.reshape(size, 2)
+
+    def _totals(self, tx_type: np.ndarray, amount: np.ndarray, money) -> dict:
+        # tx_type is 1 for expenses, so the dot product is the expense sum
+        expense = int(np.dot(amount, tx_type))
+        return _flow(int(amount.sum()) - expense, expense, money)
+
+    def _expense_by(
+        self, codes: np.ndarray, dictionary: _Dictionary, tx_type, amount, money
+    ) -> list[tuple[str | None, Decimal | int]]:
+        sums, counts = self._by(codes, tx_type, amount, len(dictionary.values))
+        # Only groups with expense rows, as with WHERE tx_type = 'expense'
+        present = np.flatnonzero(counts[:, _EXPENSE])
+        present = present[np.argsort(-sums[present, _EXPENSE], kind="stable")]
+        return [(dictionary.values[c], money(sums[c, _EXPENSE])) for c in present]
+
+    def _periods(self, periods: np.ndarray, tx_type, amount, money) -> list[tuple[int, dict]]:
+        if not len(periods):
+            return []
+        base = int(periods.min())
+        keys = periods - base
+        sums, counts = self._by(keys, tx_type, amount, int(keys.max()) + 1)
+        present = np.flatnonzero(counts.sum(axis=1))
+        return [(base + int(k), _flow(sums[k, _INCOME], sums[k, _EXPENSE], money)) for k in present]
+
+    def totals(
+        self,
+        db: Session,
+        *,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        cents: bool = False,
+    ) -> dict:
+        self.ensure_loaded(db)
+        with self._lock:
+            return self._totals(*self._view(date_from, date_to, "tx_type", "cents"), _out(cents))
+
+    def by_bucket(
+        self,
+        db: Session,
+        *,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        cents: bool = False,
+    ) -> list[dict]:
+        self.ensure_loaded(db)
+        with self._lock:
+            bucket, tx_type, amount = self._view(date_from, date_to, "bucket", "tx_type", "cents")
+            groups = self._expense_by(bucket, self._buckets, tx_type, amount, _out(cents))
+        return [{"bucket": b, "expense": e} for b, e in groups]
+
+    def by_category(
+        self,
+        db: Session,
+        *,
+        top_n: int = 10,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        cents: bool = False,
+    ) -> list[dict]:
+        self.ensure_loaded(db)
+        with self._lock:
+            category, tx_type, amount = self._view(
+                date_from, date_to, "category", "tx_type", "cents"
+            )
+            groups = self._expense_by(category, self._categories, tx_type, amount, _out(cents))
+        return [{"category": c, "expense": e} for c, e in groups[:top_n]]
+
+    def monthly(
+        self,
+        db: Session,
+        *,
+        months: int = 12,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        cents: bool = False,
+    ) -> list[dict]:
+        self.ensure_loaded(db)
+        with self._lock:
+            series = self._periods(
+                *self._view(date_from, date_to, "month", "tx_type", "cents"), _out(cents)
+            )
+        return [{"month": _month_label(m), **flow} for m, flow in series[-months:]]
+
+    def daily(
+        self, db: Session, *, date_from: date, date_to: date, cents: bool = False
+    ) -> list[dict]:
+        self.ensure_loaded(db)
+        with self._lock:
+            series = self._periods(
+                *self._view(date_from, date_to, "day", "tx_type", "cents"), _out(cents)
+            )
+        return [{"date": (_EPOCH + timedelta(days=d)).isoformat(), **flow} for d, flow in series]
+
+    def summary(
+        self,
+        db: Session,
+        *,
+        top_n: int = 10,
+        months: int = 12,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        cents: bool = False,
+    ) -> dict:
+        self.ensure_loaded(db)
+        with self._lock:
+            tx_type, amount, bucket, category, month = self._view(
+                date_from, date_to, "tx_type", "cents", "bucket", "category", "month"
+            )
+            money = _out(cents)
+            totals = self._totals(tx_type, amount, money)
+            by_bucket = self._expense_by(bucket, self._buckets, tx_type, amount, money)
+            by_category = self._expense_by(category, self._categories, tx_type, amount, money)
+            monthly = self._periods(month, tx_type, amount, money)
+        return {
+            "totals": totals,
+            "by_bucket": [{"bucket": b, "expense": e} for b, e in by_bucket],
+            "by_category": [{"category": c, "expense": e} for c, e in by_category[:top_n]],
+            "monthly": [{"month": _month_label(m), **flow} for m, flow in monthly[-months:]],
+        }
+
+
+columnar_store = ColumnarStore(enabled=settings.columnar_store)
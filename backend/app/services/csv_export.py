@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Literal
+
+from app.services.bulk_loader import TRANSACTION_COLUMNS
+
+ExportFormat = Literal["csv", "ndjson"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _cell(value) -> str | None:
+    # Decimal/date as plain strings, so exports re-import through the CSV validator
+    if value is None:
+        return None
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def iter_csv(batches: Iterable[Sequence[Sequence]]) -> Iterator[str]:
+    """Header line, then one CSV text block per batch of rows."""
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+
+    writer.writerow(TRANSACTION_COLUMNS)
+    yield buf.getvalue()
+
+    for batch in batches:
+        buf.seek(0)
+        buf.truncate()
+        writer.writerows(["" if v is None else v for v in map(_cell, row)] for row in batch)
+        yield buf.getvalue()
+
+
+def iter_ndjson(batches: Iterable[Sequence[Sequence]]) -> Iterator[str]:
+    """One JSON object per line, one text block per batch of rows."""
+    for batch in batches:
+        yield "".join(
+            json.dumps(dict(zip(TRANSACTION_COLUMNS, map(_cell, row), strict=True))) + "\n"
+            for row in batch
+        )
+
+
+def iter_export(batches: Iterable[Sequence[Sequence]], fmt: ExportFormat) -> Iterator[str]:
+    if fmt == "ndjson":
+        return iter_ndjson(batches)
+    return iter_csv(batches)
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
 import io
+import multiprocessing
+import os
+import shutil
+import tempfile
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
+from itertools import islice
+from typing import BinaryIO
 
+import numpy as np
 import pandas as pd
-import pandera.pandas as pa
 from sqlalchemy.orm import Session
 
-from app.models.transaction import Transaction
-from app.services.bucket_classifier import infer_bucket
-from app.services.csv_schema import TRANSACTION_CSV_SCHEMA
+from app.core.cache import bump_data_version
+from app.core.config import settings
+from app.services.bucket_classifier import CATEGORY_BUCKET_MAP, infer_buckets
+from app.services.bulk_loader import DuplicateMode, merge_transactions
+from app.services.columnar_store import columnar_store
+from app.services.csv_ranges import split_line_ranges
+from app.services.csv_validator import validate_transactions
+from app.services.fingerprints import content_digests, sequence_fingerprints
 
 
 @dataclass
@@ -22,6 +37,14 @@ class RejectRow:
 class ImportResult:
     inserted_count: int
     rejected_rows: list[RejectRow]
+    # Rows whose fingerprint was already stored: left alone ("skip") / refreshed ("upsert")
+    skipped_count: int = 0
+    updated_count: int = 0
+
+
+# Called after every committed chunk with the running totals
+# (rows_processed, inserted_count, rejected_count, skipped_count, updated_count)
+ProgressCallback = Callable[[int, int, int, int, int], None]
 
 
 def _normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
@@ -41,93 +64,230 @@ def _normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def import_transactions_csv(db: Session, file_bytes: bytes) -> ImportResult:
-    # Read CSV
-    df = pd.read_csv(io.BytesIO(file_bytes))
+class _ImportRun:
+    """Running totals of one import; chunks must be added in file order."""
 
-    if df.empty:
-        return ImportResult(inserted_count=0, rejected_rows=[RejectRow(1, "CSV is empty")])
-
-    df = _normalize_dataframe(df)
-
-    # Validate with pandera
-    try:
-        validated = TRANSACTION_CSV_SCHEMA.validate(df, lazy=True)
-        rejected: list[RejectRow] = []
-    except pa.errors.SchemaErrors as e:
-        # Build rejected rows with reasons using failure_cases
-        rejected = []
-        failure_cases = e.failure_cases
-
-        # failure_cases contains row indices in "index"; these are 0-based data rows (not header)
-        for _, row in failure_cases.iterrows():
-            idx = int(row.get("index")) if row.get("index") is not None else 0
-            col = str(row.get("column", "unknown"))
-            check = str(row.get("check", "invalid"))
-            failure = str(row.get("failure_case", ""))
-            reason = f"{col}: {check} ({failure})".strip()
-            rejected.append(RejectRow(row_number=idx + 1, reason=reason))
-
-        # If validation fails, we can still try to insert the valid rows:
-        failed_indices = set(int(i) for i in failure_cases["index"].dropna().unique())
-        valid_df = df.drop(index=list(failed_indices), errors="ignore")
-
-        if valid_df.empty:
-            # Deduplicate reasons per row_number (keep first)
-            seen = set()
-            uniq: list[RejectRow] = []
-            for r in rejected:
-                if r.row_number not in seen:
-                    seen.add(r.row_number)
-                    uniq.append(r)
-            return ImportResult(inserted_count=0, rejected_rows=uniq)
-
-        # Validate again but only on valid_df to coerce types cleanly
-        validated = TRANSACTION_CSV_SCHEMA.validate(valid_df, lazy=False)
-
-        # Deduplicate rejected per row
-        seen = set()
-        uniq = []
-        for r in rejected:
-            if r.row_number not in seen:
-                seen.add(r.row_number)
-                uniq.append(r)
-        rejected = uniq
-
-    # Convert occurred_on to date
-    validated["occurred_on"] = pd.to_datetime(validated["occurred_on"]).dt.date
-
-    # Create SQLAlchemy objects
-    txs: list[Transaction] = []
-    for _, r in validated.iterrows():
-        tx_type = str(r["tx_type"])
-        amount = r["amount"]
-        currency = str(r["currency"])[:3].upper() if r["currency"] else "EUR"
-
-        cat = str(r["category"])[:50] if pd.notna(r["category"]) else None
-        note = str(r["note"])[:255] if pd.notna(r["note"]) else None
-
-        # Use provided bucket if present; otherwise infer for expenses
-        if pd.notna(r["bucket"]):
-            bucket_val = str(r["bucket"])[:20]
-        else:
-            bucket_val = None
-            if tx_type == "expense":
-                bucket_val = infer_bucket(category=cat, note=note)
-
-        txs.append(
-            Transaction(
-                tx_type=tx_type,
-                amount=amount,  # SQLAlchemy Numeric will convert
-                currency=currency,
-                category=cat,
-                bucket=bucket_val,
-                occurred_on=r["occurred_on"],  # already date
-                note=note,
+    def __init__(
+        self, db: Session, on_duplicate: DuplicateMode, progress: ProgressCallback | None
+    ) -> None:
+        self.db = db
+        self.on_duplicate = on_duplicate
+        self.progress = progress
+        self.rows_seen = 0
+        self.inserted = 0
+        self.updated = 0
+        self.skipped = 0
+        self.rejected: list[RejectRow] = []
+        # Fingerprint ordinals span the whole file, not one chunk
+        self._digest_counts: dict[str, int] = {}
+
+    def add_chunk(
+        self, n_rows: int, rows: list[tuple], digests: list[str], rejected: list[RejectRow]
+    ) -> None:
+        self.rows_seen += n_rows
+        self.rejected.extend(rejected)
+
+        if rows:
+            fingerprints = sequence_fingerprints(digests, self._digest_counts)
+            merged = merge_transactions(self.db, rows, fingerprints, on_duplicate=self.on_duplicate)
+            # One commit per chunk keeps each database transaction bounded
+            self.db.commit()
+            bump_data_version()
+            columnar_store.upsert_rows(merged.rows)
+            self.inserted += merged.inserted
+            self.updated += merged.updated
+            self.skipped += merged.skipped
+
+        if self.progress is not None:
+            self.progress(
+                self.rows_seen, self.inserted, len(self.rejected), self.skipped, self.updated
             )
+
+    def result(self) -> ImportResult:
+        if self.rows_seen == 0:
+            return ImportResult(inserted_count=0, rejected_rows=[RejectRow(1, "CSV is empty")])
+        return ImportResult(
+            inserted_count=self.inserted,
+            rejected_rows=self.rejected,
+            skipped_count=self.skipped,
+            updated_count=self.updated,
+        )
+
+
+def import_transactions_csv(
+    db: Session,
+    source: bytes | BinaryIO,
+    *,
+    chunk_size: int | None = None,
+    progress: ProgressCallback | None = None,
+    workers: int | None = None,
+    on_duplicate: DuplicateMode | None = None,
+) -> ImportResult:
+    """
+    Import transactions from CSV bytes or a binary file object.
+
+    The file is read in chunks of `chunk_size` rows; each chunk is validated and
+    committed on its own, so peak memory is bounded by the chunk size rather than
+    the file size. Rejected row numbers are absolute (1-based, excluding header).
+
+    Every row is stored with a content fingerprint; rows already imported (same
+    fingerprint) are skipped or updated per `on_duplicate` (default:
+    CSV_IMPORT_ON_DUPLICATE), so re-uploading an overlapping export is idempotent.
+
+    With `workers` > 1 (default: CSV_IMPORT_WORKERS), files larger than
+    CSV_IMPORT_PARALLEL_CHUNK_BYTES are parsed and validated in a process pool
+    instead; see _import_parallel.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+
+    run = _ImportRun(db, on_duplicate or settings.csv_import_on_duplicate, progress)
+
+    workers = workers or settings.csv_import_workers
+    if workers > 1:
+        with _as_path(source) as path:
+            if os.path.getsize(path) > settings.csv_import_parallel_chunk_bytes:
+                return _import_parallel(run, path, workers=workers)
+            with open(path, "rb") as f:
+                return _import_sequential(run, f, chunk_size=chunk_size)
+
+    return _import_sequential(run, source, chunk_size=chunk_size)
+
+
+def _import_sequential(
+    run: _ImportRun, source: BinaryIO, *, chunk_size: int | None
+) -> ImportResult:
+    chunk_size = chunk_size or settings.csv_import_chunk_size
+
+    # dtype=str keeps column inference identical across chunks; the validator coerces types
+    with pd.read_csv(source, chunksize=chunk_size, dtype=str) as reader:
+        for chunk in reader:
+            if chunk.empty:
+                continue
+            # Chunks keep the reader's running index, so row numbers come out absolute
+            rows, rejected = _validate_chunk(chunk)
+            run.add_chunk(len(chunk), rows, content_digests(rows), rejected)
+
+    return run.result()
+
+
+@contextmanager
+def _as_path(source: BinaryIO) -> Iterator[str]:
+    # Worker processes open the file themselves: reuse an on-disk file, else spool to one
+    name = getattr(source, "name", None)
+    if isinstance(name, str) and os.path.isfile(name):
+        yield name
+        return
+
+    source.seek(0)
+    with tempfile.NamedTemporaryFile(prefix="spendsense-import-", suffix=".csv") as f:
+        shutil.copyfileobj(source, f)
+        f.flush()
+        yield f.name
+
+
+def _import_parallel(run: _ImportRun, path: str, *, workers: int) -> ImportResult:
+    """
+    Split the file into byte ranges on record boundaries, parse + validate the
+    ranges in a process pool and insert the results here, in file order.
+
+    At most 2 * workers ranges are in flight, so memory stays bounded while the
+    database load of one range overlaps with parsing of the next ones. Workers
+    report row numbers relative to their range; they are made absolute here.
+    """
+    header, ranges = split_line_ranges(path, settings.csv_import_parallel_chunk_bytes)
+
+    # spawn: never fork a process that holds pooled DB connections and threads
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        todo = iter(ranges)
+        in_flight: deque[Future] = deque(
+            pool.submit(_validate_range, path, header, start, end)
+            for start, end in islice(todo, 2 * workers)
         )
+        while in_flight:
+            range_rows, rows, digests, range_rejected = in_flight.popleft().result()
+            if (next_range := next(todo, None)) is not None:
+                in_flight.append(pool.submit(_validate_range, path, header, *next_range))
+
+            offset = run.rows_seen
+            rejected = [RejectRow(r.row_number + offset, r.reason) for r in range_rejected]
+            run.add_chunk(range_rows, rows, digests, rejected)
+
+    return run.result()
+
+
+def _validate_range(
+    path: str, header: bytes, start: int, end: int
+) -> tuple[int, list[tuple], list[str], list[RejectRow]]:
+    # Runs in a worker process: parse one byte range (with the header line prepended)
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    df = pd.read_csv(io.BytesIO(header + data), dtype=str)
+    if df.empty:
+        return 0, [], [], []
+    rows, rejected = _validate_chunk(df)
+    return len(df), rows, content_digests(rows), rejected
+
+
+def _validate_chunk(df: pd.DataFrame) -> tuple[list[tuple], list[RejectRow]]:
+    """Validate a raw chunk; returns row tuples (TRANSACTION_COLUMNS order) and rejects."""
+    result = validate_transactions(_normalize_dataframe(df))
 
-    db.add_all(txs)
-    db.commit()
+    # df.index holds 0-based data row numbers (not header)
+    rejected = [RejectRow(row_number=i + 1, reason=r) for i, r in result.reasons.items()]
+    if result.valid.empty:
+        return [], rejected
 
-    return ImportResult(inserted_count=len(txs), rejected_rows=rejected)
+    return _materialize_rows(result.valid), rejected
+
+
+def _infer_bucket_column(category: pd.Series, note: pd.Series) -> pd.Series:
+    # Vectorized infer_bucket: category map first, then one keyword scan per distinct note
+    buckets = category.str.strip().str.lower().map(CATEGORY_BUCKET_MAP).astype(object)
+
+    pending = buckets.isna() & note.notna()
+    if pending.any():
+        codes, uniques = pd.factorize(note[pending])
+        matched = np.array(infer_buckets((None, n) for n in uniques), dtype=object)
+        buckets[pending] = matched[codes]
+
+    return buckets
+
+
+def _as_nullable(s: pd.Series) -> list:
+    # NaN -> None so the loader writes SQL NULLs
+    return s.astype(object).where(s.notna(), None).tolist()
+
+
+def _materialize_rows(validated: pd.DataFrame) -> list[tuple]:
+    """
+    Turn a validated frame into plain row tuples (TRANSACTION_COLUMNS order).
+    All truncation, normalization and bucket inference is done column-wise.
+    """
+    tx_type = validated["tx_type"].astype(str)
+    currency = validated["currency"].astype(str).str[:3].str.upper()
+    category = validated["category"].str[:50]
+    note = validated["note"].str[:255]
+    occurred_on = pd.to_datetime(validated["occurred_on"]).dt.date
+
+    # Use provided bucket if present; otherwise infer for expenses
+    bucket = validated["bucket"].str[:20].astype(object)
+    needs_bucket = bucket.isna() & (tx_type == "expense")
+    if needs_bucket.any():
+        bucket[needs_bucket] = _infer_bucket_column(category[needs_bucket], note[needs_bucket])
+
+    return list(
+        zip(
+            tx_type.tolist(),
+            validated["amount"].tolist(),
+            currency.tolist(),
+            _as_nullable(category),
+            _as_nullable(bucket),
+            occurred_on.tolist(),
+            _as_nullable(note),
+            strict=True,
+        )
+    )
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import mmap
+import os
+
+
+def split_line_ranges(
+    path: str | os.PathLike, chunk_bytes: int
+) -> tuple[bytes, list[tuple[int, int]]]:
+    """
+    Split a CSV file into its header line and (start, end) byte ranges of roughly
+    `chunk_bytes` each. Every range ends on a record boundary: a newline outside
+    double quotes, so quoted fields that contain newlines are never cut in half
+    ("" escapes count as two quotes and leave the parity unchanged).
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return b"", []
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        header_end = _record_end(mm, 0, 0)
+        header = mm[:header_end]
+
+        ranges: list[tuple[int, int]] = []
+        start = header_end
+        while start < size:
+            end = min(start + chunk_bytes, size)
+            if end < size:
+                end = _record_end(mm, start, end)
+            ranges.append((start, end))
+            start = end
+
+    return header, ranges
+
+
+def _record_end(mm: mmap.mmap, start: int, target: int) -> int:
+    # First record boundary at or after `target`; `start` must itself be a boundary
+    quotes = 0
+    pos = start
+    nl = mm.find(b"\n", target)
+    while nl != -1:
+        quotes += mm[pos : nl + 1].count(b'"')
+        pos = nl + 1
+        if quotes % 2 == 0:
+            return pos
+        nl = mm.find(b"\n", pos)
+    return len(mm)
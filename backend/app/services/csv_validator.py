@@ -0,0 +1,95 @@
+"""
+Single-pass validation of raw CSV chunks (all columns still strings).
+
+Each rule yields a boolean failure mask over the whole chunk; rules run in a
+fixed order and a row's reason is the first rule it fails, so there is no
+per-failure Python loop, no de-duplication and no second validation of the
+surviving rows. Numeric and date columns are coerced exactly once and the
+coerced values are what valid rows carry forward.
+
+RULES is the only definition of a valid CSV row; the amount bounds include
+the limit Numeric(12, 2) would otherwise reject at insert time.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+TX_TYPES = ["income", "expense"]
+BUCKETS = ["necessary", "controllable", "unnecessary"]
+# Largest absolute value Numeric(12, 2) can store is just below 10**10
+MAX_AMOUNT = 10**10
+
+
+@dataclass
+class ValidationResult:
+    valid: pd.DataFrame  # rows that passed every rule, coerced, original index
+    reasons: pd.Series  # first failure reason per rejected row, by original index
+
+
+@dataclass(frozen=True)
+class _Rule:
+    column: str
+    check: str
+    fails: Callable[[dict[str, pd.Series]], pd.Series]
+    show_value: bool = True
+
+
+def _isin_fails(column: str, allowed: list[str]) -> Callable[[dict[str, pd.Series]], pd.Series]:
+    return lambda c: c[column].notna() & ~c[column].isin(allowed)
+
+
+RULES: tuple[_Rule, ...] = (
+    _Rule("tx_type", "not_nullable", lambda c: c["tx_type"].isna(), show_value=False),
+    _Rule("tx_type", f"isin({TX_TYPES})", _isin_fails("tx_type", TX_TYPES)),
+    _Rule("amount", "not_nullable", lambda c: c["amount"].isna(), show_value=False),
+    _Rule("amount", "coerce_dtype('float64')", lambda c: c["amount"].notna() & c["_amount"].isna()),
+    _Rule("amount", "greater_than(0)", lambda c: c["_amount"] <= 0),
+    _Rule("amount", f"less_than({MAX_AMOUNT})", lambda c: c["_amount"] >= MAX_AMOUNT),
+    _Rule("bucket", f"isin({BUCKETS})", _isin_fails("bucket", BUCKETS)),
+    _Rule("occurred_on", "not_nullable", lambda c: c["occurred_on"].isna(), show_value=False),
+    _Rule(
+        "occurred_on",
+        "coerce_dtype('datetime64[ns]')",
+        lambda c: c["occurred_on"].notna() & c["_occurred_on"].isna(),
+    ),
+)
+
+
+def validate_transactions(df: pd.DataFrame) -> ValidationResult:
+    """
+    Validate a normalized chunk (see csv_import._normalize_dataframe).
+    Values that fail to coerce become NaN/NaT and are caught by the coerce rules.
+    """
+    amount = pd.to_numeric(df["amount"], errors="coerce")
+    # inf/-inf parse as floats but are not amounts
+    amount = amount.where(np.isfinite(amount))
+    occurred_on = pd.to_datetime(df["occurred_on"], errors="coerce")
+
+    columns = {c: df[c] for c in ("tx_type", "amount", "bucket", "occurred_on")}
+    columns["_amount"] = amount
+    columns["_occurred_on"] = occurred_on
+
+    reasons = pd.Series(pd.NA, index=df.index, dtype=object)
+    rejected = np.zeros(len(df), dtype=bool)
+    for rule in RULES:
+        new = rule.fails(columns).to_numpy(dtype=bool, na_value=False) & ~rejected
+        if not new.any():
+            continue
+        label = f"{rule.column}: {rule.check}"
+        if rule.show_value:
+            reasons[new] = label + " (" + df[rule.column][new].astype(str) + ")"
+        else:
+            reasons[new] = label
+        rejected |= new
+
+    valid = df.loc[~rejected].assign(
+        tx_type=df["tx_type"][~rejected].astype(str),
+        amount=amount[~rejected],
+        occurred_on=occurred_on[~rejected],
+    )
+    return ValidationResult(valid=valid, reasons=reasons[rejected])
@@ -0,0 +1,52 @@
+"""
+Content fingerprints for imported transactions (transactions.fingerprint).
+
+The digest covers occurred_on, amount (in cents), tx_type and the normalized
+category and note. Identical rows inside one import are told apart by their
+ordinal: the first keeps the bare digest, later ones get "-1", "-2", ... So a
+re-uploaded or overlapping export maps onto the rows it already created, while
+two genuine same-day, same-amount purchases in one file both survive.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable, Sequence
+
+from app.services.rollups import to_cents
+
+
+def _normalize(value: str | None) -> str:
+    return " ".join(value.split()).lower() if value else ""
+
+
+def content_digests(rows: Iterable[Sequence]) -> list[str]:
+    """Per-row digest (TRANSACTION_COLUMNS order), without the ordinal."""
+    return [
+        hashlib.blake2b(
+            "|".join(
+                (
+                    occurred_on.isoformat(),
+                    str(to_cents(amount)),
+                    tx_type,
+                    _normalize(category),
+                    _normalize(note),
+                )
+            ).encode(),
+            digest_size=16,
+        ).hexdigest()
+        for tx_type, amount, _currency, category, _bucket, occurred_on, note in rows
+    ]
+
+
+def sequence_fingerprints(digests: Iterable[str], seen: dict[str, int]) -> list[str]:
+    """
+    Append occurrence ordinals. `seen` carries the counts across the chunks of
+    one import, so pass the same dict for every chunk, in file order.
+    """
+    out: list[str] = []
+    for digest in digests:
+        ordinal = seen.get(digest, 0)
+        seen[digest] = ordinal + 1
+        out.append(digest if ordinal == 0 else f"{digest}-{ordinal}")
+    return out
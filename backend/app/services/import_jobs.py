@@ -0,0 +1,162 @@
+"""
+Background CSV imports.
+
+POST /import/jobs spools the upload to a temp file and hands it to a thread pool;
+the request returns a job id straight away. Workers run import_transactions_csv
+with their own session and publish per-chunk progress to the job store, which
+GET /import/jobs/{id} reads. No broker is involved: jobs live in this process
+(MemoryJobStore) and are lost on restart.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Literal
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.bulk_loader import DuplicateMode
+from app.services.csv_import import RejectRow, import_transactions_csv
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+@dataclass
+class ImportJob:
+    id: str
+    filename: str
+    status: JobStatus = "queued"
+    rows_processed: int = 0
+    inserted_count: int = 0
+    rejected_count: int = 0
+    skipped_count: int = 0
+    updated_count: int = 0
+    rejected_rows: list[RejectRow] = field(default_factory=list)
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    def to_dict(self) -> dict:
+        elapsed = None
+        if self.started_at is not None:
+            elapsed = (self.finished_at or time.time()) - self.started_at
+        return {
+            "job_id": self.id,
+            "filename": self.filename,
+            "status": self.status,
+            "rows_processed": self.rows_processed,
+            "inserted_count": self.inserted_count,
+            "rejected_count": self.rejected_count,
+            "skipped_count": self.skipped_count,
+            "updated_count": self.updated_count,
+            "rejected_rows": [
+                {"row_number": r.row_number, "reason": r.reason} for r in self.rejected_rows
+            ],
+            "error": self.error,
+            "elapsed_seconds": round(elapsed, 3) if elapsed is not None else None,
+            "rows_per_second": round(self.rows_processed / elapsed, 1) if elapsed else None,
+        }
+
+
+class MemoryJobStore:
+    """Thread-safe in-process job registry; keeps the newest `retention` finished jobs."""
+
+    def __init__(self, retention: int) -> None:
+        self._retention = retention
+        self._jobs: dict[str, ImportJob] = {}
+        self._lock = threading.Lock()
+
+    def add(self, job: ImportJob) -> None:
+        with self._lock:
+            self._jobs[job.id] = job
+            finished = [j for j in self._jobs.values() if j.done]
+            for old in finished[: max(len(finished) - self._retention, 0)]:
+                del self._jobs[old.id]
+
+    def get(self, job_id: str) -> ImportJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def update(self, job_id: str, **changes) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            for k, v in changes.items():
+                setattr(job, k, v)
+
+
+class ImportJobRunner:
+    def __init__(self, store: MemoryJobStore, max_workers: int) -> None:
+        self.store = store
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="csv-import"
+        )
+
+    def submit(
+        self, path: str, filename: str, *, on_duplicate: DuplicateMode | None = None
+    ) -> ImportJob:
+        """Queue an import of the CSV at `path`; the worker deletes the file when done."""
+        job = ImportJob(id=uuid.uuid4().hex, filename=filename)
+        self.store.add(job)
+        self._executor.submit(self._run, job.id, path, on_duplicate)
+        return job
+
+    def _run(self, job_id: str, path: str, on_duplicate: DuplicateMode | None) -> None:
+        self.store.update(job_id, status="running", started_at=time.time())
+
+        def progress(
+            rows_processed: int,
+            inserted_count: int,
+            rejected_count: int,
+            skipped_count: int,
+            updated_count: int,
+        ) -> None:
+            self.store.update(
+                job_id,
+                rows_processed=rows_processed,
+                inserted_count=inserted_count,
+                rejected_count=rejected_count,
+                skipped_count=skipped_count,
+                updated_count=updated_count,
+            )
+
+        db = SessionLocal()
+        try:
+            with open(path, "rb") as f:
+                result = import_transactions_csv(
+                    db, f, progress=progress, on_duplicate=on_duplicate
+                )
+            self.store.update(
+                job_id,
+                status="succeeded",
+                inserted_count=result.inserted_count,
+                rejected_count=len(result.rejected_rows),
+                skipped_count=result.skipped_count,
+                updated_count=result.updated_count,
+                rejected_rows=result.rejected_rows,
+                finished_at=time.time(),
+            )
+        except Exception as e:
+            # Chunks committed before the failure stay imported
+            db.rollback()
+            self.store.update(job_id, status="failed", error=str(e), finished_at=time.time())
+        finally:
+            db.close()
+            os.unlink(path)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+import_job_runner = ImportJobRunner(
+    MemoryJobStore(settings.import_job_retention), settings.import_job_workers
+)
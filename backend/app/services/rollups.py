@@ -0,0 +1,151 @@
+"""
+Daily/monthly rollups of `transactions`, kept in step with every write.
+
+Writers pass the affected rows (TRANSACTION_COLUMNS order) with sign=+1 for
+inserted rows and sign=-1 for removed ones; an update is a removal of the old
+row plus an insertion of the new one. Deltas are summed per key in Python and
+applied with one upsert per table, in the caller's transaction. Budget alert
+states of the (month, category) keys touched are refreshed when the caller
+commits (see services/budget_alerts.py).
+
+Backfill / repair:
+
+    python -m app.services.rollups rebuild
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterable, Sequence
+from datetime import date
+from decimal import ROUND_HALF_UP, Decimal
+
+from sqlalchemy import delete, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.cache import bump_data_version
+from app.models.rollup import DailyRollup, MonthlyRollup, portable_key
+from app.models.transaction import Transaction
+from app.services.budget_alerts import mark_pending, refresh_alert_states
+
+RollupKey = tuple[date, str, str | None, str | None]
+
+_CENT = Decimal("0.01")
+
+REBUILD_DAILY_SQL = """
+INSERT INTO daily_rollups (day, tx_type, category, bucket, amount, tx_count)
+SELECT occurred_on, tx_type, category, bucket, SUM(amount), COUNT(*)
+FROM transactions
+GROUP BY occurred_on, tx_type, category, bucket
+"""
+
+REBUILD_MONTHLY_SQL = """
+INSERT INTO monthly_rollups (month, tx_type, category, bucket, amount, tx_count)
+SELECT month, tx_type, category, bucket, SUM(amount), SUM(tx_count)
+FROM daily_rollups
+GROUP BY month, tx_type, category, bucket
+"""
+
+
+def transaction_row(tx: Transaction) -> tuple:
+    """Snapshot of a transaction in TRANSACTION_COLUMNS order."""
+    return (tx.tx_type, tx.amount, tx.currency, tx.category, tx.bucket, tx.occurred_on, tx.note)
+
+
+def to_cents(amount) -> Decimal:
+    # Match Numeric(12, 2) rounding of floats coming from CSV imports
+    if not isinstance(amount, Decimal):
+        amount = Decimal(repr(float(amount)))
+    return amount.quantize(_CENT, rounding=ROUND_HALF_UP)
+
+
+def apply_transaction_rows(db: Session, rows: Iterable[Sequence], *, sign: int = 1) -> None:
+    """Add (sign=1) or subtract (sign=-1) transaction rows from both rollup tables."""
+    daily: dict[RollupKey, list] = {}
+    for tx_type, amount, _currency, category, bucket, occurred_on, _note in rows:
+        acc = daily.setdefault((occurred_on, tx_type, category, bucket), [Decimal("0.00"), 0])
+        acc[0] += to_cents(amount)
+        acc[1] += 1
+
+    if not daily:
+        return
+
+    monthly: dict[RollupKey, list] = {}
+    for (day, tx_type, category, bucket), (amount, count) in daily.items():
+        key = (day.replace(day=1), tx_type, category, bucket)
+        acc = monthly.setdefault(key, [Decimal("0.00"), 0])
+        acc[0] += amount
+        acc[1] += count
+
+    _upsert(db, DailyRollup, DailyRollup.day, daily, sign)
+    _upsert(db, MonthlyRollup, MonthlyRollup.month, monthly, sign)
+    mark_pending(db, {(m, c) for m, tx_type, c, _b in monthly if tx_type == "expense" and c})
+
+
+def _lock_order(key: RollupKey) -> tuple:
+    # NULL category/bucket sort first; None never meets a str in a comparison
+    return tuple((v is not None, v) for v in key)
+
+
+def _upsert(db: Session, model, period_col, deltas: dict[RollupKey, list], sign: int) -> None:
+    key_cols = [period_col.key, "tx_type", "category", "bucket"]
+    # Every writer upserts (and so row-locks) keys in the same order; two writers
+    # with overlapping keys in different orders would otherwise deadlock
+    values = [
+        {**dict(zip(key_cols, key, strict=True)), "amount": sign * amount, "tx_count": sign * count}
+        for key, (amount, count) in sorted(deltas.items(), key=lambda kv: _lock_order(kv[0]))
+    ]
+
+    if db.get_bind().dialect.name == "postgresql":
+        conflict_target = key_cols
+    else:
+        # SQLite's unique indexes never match NULLs; conflict on the coalesced key
+        conflict_target = portable_key(model, period_col)
+
+    stmt = insert(model)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=conflict_target,
+        set_={
+            "amount": model.amount + stmt.excluded.amount,
+            "tx_count": model.tx_count + stmt.excluded.tx_count,
+        },
+    )
+    db.execute(stmt, values)
+
+    if sign < 0:
+        # Drop groups that no longer have any transactions
+        db.execute(
+            delete(model)
+            .where(period_col.in_(sorted({k[0] for k in deltas})))
+            .where(model.tx_count <= 0)
+        )
+
+
+def rebuild_rollups(db: Session) -> None:
+    """Recompute both rollup tables from `transactions` (backfills, repairs)."""
+    db.execute(delete(MonthlyRollup))
+    db.execute(delete(DailyRollup))
+    db.execute(text(REBUILD_DAILY_SQL))
+    db.execute(text(REBUILD_MONTHLY_SQL))
+    refresh_alert_states(db)
+    db.commit()
+    bump_data_version()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Maintain transaction rollup tables.")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.parse_args()
+
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        rebuild_rollups(db)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
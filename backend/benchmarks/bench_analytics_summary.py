@@ -0,0 +1,88 @@
+"""
+Compare GET /analytics/summary's four separate aggregate queries with the
+single GROUPING SETS statement (get_summary). Needs DATABASE_URL.
+
+Rows are seeded inside a transaction that is rolled back afterwards.
+
+    python -m benchmarks.bench_analytics_summary --rows 200000 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.crud.analytics.summary import (
+    get_by_bucket,
+    get_by_category,
+    get_monthly,
+    get_summary,
+    get_totals,
+)
+from app.db.session import engine
+
+SEED_SQL = text("""
+    INSERT INTO transactions (tx_type, amount, currency, category, bucket, occurred_on, note)
+    SELECT
+        CASE WHEN g % 5 = 0 THEN 'income' ELSE 'expense' END,
+        (g % 300) + 1,
+        'EUR',
+        (ARRAY['rent', 'groceries', 'dining_out', 'shopping', 'travel'])[g % 5 + 1],
+        (ARRAY['necessary', 'controllable', 'unnecessary'])[g % 3 + 1],
+        DATE '2021-01-01' + (g % 1825),
+        'bench'
+    FROM generate_series(1, :rows) AS g
+    """)
+
+
+def separate(db: Session) -> dict:
+    return {
+        "totals": get_totals(db),
+        "by_bucket": get_by_bucket(db),
+        "by_category": get_by_category(db, top_n=10),
+        "monthly": get_monthly(db, months=12),
+    }
+
+
+def combined(db: Session) -> dict:
+    return get_summary(db, top_n=10, months=12)
+
+
+def _bench(fn, db: Session, repeat: int) -> float:
+    fn(db)  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(db)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            conn.execute(SEED_SQL, {"rows": args.rows})
+            conn.execute(text("ANALYZE transactions"))
+            db = Session(bind=conn)
+
+            separate_s = _bench(separate, db, args.repeat)
+            combined_s = _bench(combined, db, args.repeat)
+            db.close()
+        finally:
+            trans.rollback()
+
+    print(f"rows seeded: {args.rows}")
+    print(f"4 queries:   {separate_s * 1000:8.1f} ms")
+    print(f"1 statement: {combined_s * 1000:8.1f} ms")
+    print(f"speedup:     {separate_s / combined_s:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Concurrent load against the dashboard endpoints with DB_MODE=sync vs async.
+Needs DATABASE_URL pointing at a local Postgres (postgresql+psycopg).
+
+Requests go through httpx's in-process ASGI transport, so the numbers compare
+the two database layers rather than network or server overhead.
+
+In sync mode, keep --concurrency below the threadpool size (40 by default):
+once every worker thread waits on the connection pool, sessions cannot be
+closed and the pool times out.
+
+    python -m benchmarks.bench_async_load --requests 2000 --concurrency 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+
+import httpx
+
+from app.core.config import settings
+from app.db.async_session import get_async_engine
+from app.main import create_app
+
+PATHS = ["/analytics/summary", "/analytics/daily", "/alerts"]
+
+
+async def _run(mode: str, total: int, concurrency: int) -> tuple[float, int]:
+    settings.db_mode = mode
+    app = create_app()
+
+    sem = asyncio.Semaphore(concurrency)
+    errors = 0
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+
+        async def one(i: int) -> None:
+            nonlocal errors
+            async with sem:
+                res = await client.get(PATHS[i % len(PATHS)])
+                if res.status_code != 200:
+                    errors += 1
+
+        await asyncio.gather(*(one(i) for i in range(concurrency)))  # warm up pools
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(total)))
+        elapsed = time.perf_counter() - start
+
+    if mode == "async":
+        await get_async_engine().dispose()
+    return total / elapsed, errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=30)
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    print(f"{'mode':>6} {'req/s':>10} {'errors':>7}")
+    for mode in ("sync", "async"):
+        rps, errors = asyncio.run(_run(mode, args.requests, args.concurrency))
+        print(f"{mode:>6} {rps:>10.1f} {errors:>7}")
+
+
+if __name__ == "__main__":
+    main()
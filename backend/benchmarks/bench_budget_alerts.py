@@ -0,0 +1,112 @@
+"""
+GET /alerts: the previous query (sum the month's expense transactions per
+category, join budgets) against the alert-state lookup, plus the cost the
+state refresh adds to a write (one (month, category) key). Needs DATABASE_URL.
+
+Transactions, budgets and rollups are seeded inside a transaction that is
+rolled back afterwards.
+
+    python -m benchmarks.bench_budget_alerts --rows 200000 --repeat 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.crud.alerts import get_over_budget_alerts
+from app.db.session import engine
+from app.services.budget_alerts import refresh_alert_states
+from app.services.rollups import REBUILD_DAILY_SQL, REBUILD_MONTHLY_SQL
+
+MONTH = date(2400, 6, 1)
+CATEGORIES = [f"bench_alert_{k}" for k in range(20)]
+
+SEED_SQL = text("""
+    INSERT INTO transactions (tx_type, amount, currency, category, bucket, occurred_on)
+    SELECT 'expense', (g % 300) + 1, 'EUR', 'bench_alert_' || (g % 20), NULL,
+           DATE '2396-01-01' + (g % 1825)
+    FROM generate_series(1, :rows) AS g
+    """)
+
+BUDGETS_SQL = text("""
+    INSERT INTO budgets (category, monthly_limit, currency)
+    SELECT 'bench_alert_' || k, 1000 + 500 * k, 'EUR' FROM generate_series(0, 19) AS k
+    """)
+
+# get_over_budget_alerts before the alert states
+SCAN_SQL = text("""
+    SELECT b.category, b.monthly_limit, COALESCE(s.spent, 0) AS spent
+    FROM budgets b
+    LEFT JOIN (
+        SELECT category, COALESCE(SUM(amount), 0) AS spent
+        FROM transactions
+        WHERE tx_type = 'expense' AND occurred_on >= :start AND occurred_on <= :end
+        GROUP BY category
+    ) s ON s.category = b.category
+    """)
+
+
+def scan(db: Session) -> list:
+    rows = db.execute(SCAN_SQL, {"start": MONTH, "end": date(2400, 6, 30)}).all()
+    alerts = [r for r in rows if r.spent > r.monthly_limit]
+    return sorted(alerts, key=lambda r: r.spent - r.monthly_limit, reverse=True)
+
+
+def lookup(db: Session) -> list:
+    return get_over_budget_alerts(db, for_date=MONTH)
+
+
+def refresh_one(db: Session) -> None:
+    refresh_alert_states(db, keys=[(MONTH, CATEGORIES[0])])
+
+
+def _bench(fn, db: Session, repeat: int) -> float:
+    fn(db)  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(db)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            conn.execute(SEED_SQL, {"rows": args.rows})
+            conn.execute(BUDGETS_SQL)
+            conn.execute(text("DELETE FROM monthly_rollups"))
+            conn.execute(text("DELETE FROM daily_rollups"))
+            conn.execute(text(REBUILD_DAILY_SQL))
+            conn.execute(text(REBUILD_MONTHLY_SQL))
+            conn.execute(text("ANALYZE"))
+            db = Session(bind=conn)
+            refresh_alert_states(db)
+
+            expected = [(r.category, r.spent) for r in scan(db)]
+            assert expected and [(r.category, r.spent) for r in lookup(db)] == expected
+
+            scan_s = _bench(scan, db, args.repeat)
+            lookup_s = _bench(lookup, db, args.repeat)
+            refresh_s = _bench(refresh_one, db, args.repeat)
+            db.close()
+        finally:
+            trans.rollback()
+
+    print(f"transactions:   {args.rows}")
+    print(f"scan + join:    {scan_s * 1000:8.2f} ms")
+    print(f"state lookup:   {lookup_s * 1000:8.2f} ms")
+    print(f"refresh 1 key:  {refresh_s * 1000:8.2f} ms (added to each write's commit)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Memory and query time of the columnar store (app/services/columnar_store.py)
+against ORM objects and the SQL aggregates. Needs DATABASE_URL.
+
+Rows are seeded inside a transaction that is rolled back afterwards. They skip
+the rollup tables, so get_summary only times the statement, it does not see them.
+
+    python -m benchmarks.bench_columnar_store --rows 200000 --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.crud.analytics.summary import get_summary
+from app.db.session import engine
+from app.models.transaction import Transaction
+from app.services.columnar_store import ColumnarStore
+from benchmarks.bench_analytics_summary import SEED_SQL
+
+
+def _bench(fn, repeat: int) -> float:
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def _traced(fn):
+    tracemalloc.start()
+    try:
+        result = fn()
+        return result, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            conn.execute(SEED_SQL, {"rows": args.rows})
+            db = Session(bind=conn)
+
+            orm, orm_bytes = _traced(lambda: db.scalars(select(Transaction)).all())
+            n = len(orm)
+            del orm
+            db.expunge_all()
+
+            store = ColumnarStore(enabled=True)
+            start = time.perf_counter()
+            store.reload(db)
+            load_s = time.perf_counter() - start
+
+            last_90 = {"date_from": date.today() - timedelta(days=90)}
+            timings = {
+                "SQL get_summary": _bench(lambda: get_summary(db), args.repeat),
+                "store summary": _bench(lambda: store.summary(db), args.repeat),
+                "store summary (90 days)": _bench(
+                    lambda: store.summary(db, **last_90), args.repeat
+                ),
+                "store totals": _bench(lambda: store.totals(db), args.repeat),
+                "store daily (90 days)": _bench(
+                    lambda: store.daily(db, date_from=last_90["date_from"], date_to=date.today()),
+                    args.repeat,
+                ),
+            }
+            db.close()
+        finally:
+            trans.rollback()
+
+    print(f"rows:               {n}")
+    print(f"ORM objects:        {orm_bytes / n:8.0f} B/row")
+    print(f"columnar arrays:    {store.nbytes / n:8.0f} B/row (capacity, not the id index)")
+    print(f"store load:         {load_s * 1000:8.1f} ms")
+    for name, seconds in timings.items():
+        print(f"{name + ':':<28}{seconds * 1e6:10.0f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Parse + validate throughput of the parallel CSV import pipeline by worker count
+(byte-range split, process pool, in-order merge; no database writes).
+
+    python -m benchmarks.bench_csv_parallel --rows 1000000 --workers 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app.services.csv_import import _validate_range  # noqa: E402
+from app.services.csv_ranges import split_line_ranges  # noqa: E402
+from benchmarks.bench_csv_materialize import make_frame  # noqa: E402
+
+
+def run(path: str, workers: int, chunk_bytes: int) -> tuple[float, int, int]:
+    start = time.perf_counter()
+    header, ranges = split_line_ranges(path, chunk_bytes)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [pool.submit(_validate_range, path, header, s, e) for s, e in ranges]
+        rows = valid = 0
+        for f in futures:
+            range_rows, valid_rows, _ = f.result()
+            rows += range_rows
+            valid += len(valid_rows)
+    return time.perf_counter() - start, rows, valid
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--chunk-mb", type=int, default=16)
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile(suffix=".csv") as f:
+        make_frame(args.rows).to_csv(f.name, index=False)
+        size_mb = os.path.getsize(f.name) / 1e6
+        print(f"{args.rows} rows, {size_mb:.1f} MB")
+
+        print(f"{'workers':>8} {'seconds':>9} {'rows/s':>12} {'speedup':>8}")
+        baseline = None
+        for workers in args.workers:
+            seconds, rows, _ = run(f.name, workers, args.chunk_mb * 1024 * 1024)
+            assert rows == args.rows
+            baseline = baseline or seconds
+            print(
+                f"{workers:>8} {seconds:>9.2f} {rows / seconds:>12,.0f} {baseline / seconds:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
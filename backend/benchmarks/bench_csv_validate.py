@@ -0,0 +1,147 @@
+"""
+Compare the single-pass CSV validator against the original pandera path
+(lazy validate, failure_cases loop, drop, re-validate) on raw string chunks
+with a given share of bad rows.
+
+    python -m benchmarks.bench_csv_validate --rows 100000 --bad 0 0.01 0.3
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pandera.pandas as pa
+from pandera import Column
+from pandera.dtypes import DateTime
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app.services.csv_import import (  # noqa: E402
+    RejectRow,
+    _materialize_rows,
+    _normalize_dataframe,
+    _validate_chunk,
+)
+from benchmarks.bench_csv_materialize import make_frame  # noqa: E402
+
+# The pandera schema the importer validated with before the rewrite; the live
+# rules are csv_validator.RULES. "occurred_on" is validated as datetime.
+LEGACY_SCHEMA = pa.DataFrameSchema(
+    {
+        "tx_type": Column(
+            pa.String,
+            nullable=False,
+            checks=pa.Check.isin(["income", "expense"]),
+            coerce=True,
+        ),
+        "amount": Column(
+            pa.Float,
+            nullable=False,
+            checks=pa.Check.gt(0),
+            coerce=True,
+        ),
+        "currency": Column(
+            pa.String,
+            nullable=True,
+            coerce=True,
+            default="EUR",
+        ),
+        "category": Column(pa.String, nullable=True, coerce=True),
+        "bucket": Column(
+            pa.String,
+            nullable=True,
+            checks=pa.Check.isin(["necessary", "controllable", "unnecessary"]),
+            coerce=True,
+        ),
+        "occurred_on": Column(DateTime, nullable=False, coerce=True),
+        "note": Column(pa.String, nullable=True, coerce=True),
+    },
+    strict=False,  # allow extra columns, we just ignore them
+)
+
+# Check-level failures only: pandera mis-reports rows whose values fail to coerce
+BAD_VALUES = [("amount", "-5"), ("tx_type", "refund"), ("bucket", "luxury"), ("amount", "0")]
+
+
+def make_raw_chunk(n: int, bad_share: float, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = make_frame(n, seed).astype(str).replace("None", None)
+    df["occurred_on"] = df["occurred_on"].str[:10]
+
+    bad = np.flatnonzero(rng.random(n) < bad_share)
+    for i, row in enumerate(bad):
+        column, value = BAD_VALUES[i % len(BAD_VALUES)]
+        df.iat[row, df.columns.get_loc(column)] = value
+    return df
+
+
+def legacy_validate_chunk(df: pd.DataFrame) -> tuple[list[tuple], list[RejectRow]]:
+    # The pre-rewrite pandera path, kept verbatim as the baseline
+    df = _normalize_dataframe(df)
+
+    try:
+        validated = LEGACY_SCHEMA.validate(df, lazy=True)
+        rejected: list[RejectRow] = []
+    except pa.errors.SchemaErrors as e:
+        rejected = []
+        failure_cases = e.failure_cases
+
+        for _, row in failure_cases.iterrows():
+            idx = int(row.get("index")) if row.get("index") is not None else 0
+            col = str(row.get("column", "unknown"))
+            check = str(row.get("check", "invalid"))
+            failure = str(row.get("failure_case", ""))
+            reason = f"{col}: {check} ({failure})".strip()
+            rejected.append(RejectRow(row_number=idx + 1, reason=reason))
+
+        seen = set()
+        uniq: list[RejectRow] = []
+        for r in rejected:
+            if r.row_number not in seen:
+                seen.add(r.row_number)
+                uniq.append(r)
+        rejected = uniq
+
+        failed_indices = set(int(i) for i in failure_cases["index"].dropna().unique())
+        valid_df = df.drop(index=list(failed_indices), errors="ignore")
+
+        if valid_df.empty:
+            return [], rejected
+
+        validated = LEGACY_SCHEMA.validate(valid_df, lazy=False)
+
+    return _materialize_rows(validated), rejected
+
+
+def _time(fn, df: pd.DataFrame, repeat: int) -> tuple[float, tuple]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn(df)
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--bad", type=float, nargs="+", default=[0.0, 0.01, 0.3])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'bad rows':>9} {'pandera (s)':>12} {'single-pass (s)':>16} {'speedup':>8}")
+    for share in args.bad:
+        df = make_raw_chunk(args.rows, share)
+        legacy_s, (legacy_rows, legacy_rejected) = _time(legacy_validate_chunk, df, args.repeat)
+        new_s, (new_rows, new_rejected) = _time(_validate_chunk, df, args.repeat)
+        assert legacy_rows == new_rows, "valid rows diverged from the pandera path"
+        assert {r.row_number for r in legacy_rejected} == {r.row_number for r in new_rejected}
+        print(f"{share:>9.0%} {legacy_s:>12.3f} {new_s:>16.3f} {legacy_s / new_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+GET /analytics/daily?cumulative=true&rolling=true over a multi-year range:
+get_daily_series (sparse rollup query, gap-filled in Python) against the same
+series computed in Postgres with generate_series and window functions.
+Needs DATABASE_URL.
+
+Daily rollup rows (one day in three has activity) are seeded far in the future
+inside a transaction that is rolled back afterwards.
+
+    python -m benchmarks.bench_daily_calendar --years 5 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.crud.analytics.daily import get_daily_series
+from app.db.session import engine
+
+START = date(2300, 1, 1)
+
+SEED_SQL = text("""
+    INSERT INTO daily_rollups (day, tx_type, category, bucket, amount, tx_count)
+    SELECT
+        DATE '2300-01-01' + d,
+        t,
+        'bench_' || c,
+        NULL,
+        ((d * 7 + c * 13) % 50000) / 100.0 + 1,
+        1
+    FROM generate_series(0, :days - 1, :step) AS d,
+         unnest(ARRAY['income', 'expense']) AS t,
+         generate_series(1, 4) AS c
+    """)
+
+
+CALENDAR_SQL = text("""
+    WITH flows AS (
+        SELECT day,
+               SUM(amount) FILTER (WHERE tx_type = 'income') AS income,
+               SUM(amount) FILTER (WHERE tx_type = 'expense') AS expense
+        FROM daily_rollups
+        WHERE day BETWEEN CAST(:start AS date) AND :date_to
+        GROUP BY day
+    ), series AS (
+        SELECT c.day,
+               COALESCE(f.income, 0) AS income,
+               COALESCE(f.expense, 0) AS expense,
+               SUM(CASE WHEN c.day >= :date_from
+                        THEN COALESCE(f.income, 0) - COALESCE(f.expense, 0) ELSE 0 END)
+                   OVER w AS cumulative_net,
+               SUM(COALESCE(f.income, 0) - COALESCE(f.expense, 0))
+                   OVER (w ROWS BETWEEN 6 PRECEDING AND CURRENT ROW) AS net_7d,
+               SUM(COALESCE(f.income, 0) - COALESCE(f.expense, 0))
+                   OVER (w ROWS BETWEEN 29 PRECEDING AND CURRENT ROW) AS net_30d
+        FROM (SELECT CAST(:start AS date) + n AS day
+              FROM generate_series(0, :days) AS n) AS c
+        LEFT JOIN flows f ON f.day = c.day
+        WINDOW w AS (ORDER BY c.day)
+    )
+    SELECT * FROM series WHERE day >= :date_from ORDER BY day
+    """)
+
+
+def python_fill(db: Session, date_to: date) -> list[dict]:
+    return get_daily_series(db, date_from=START, date_to=date_to, cumulative=True, rolling=True)
+
+
+def sql_calendar(db: Session, date_to: date) -> list[dict]:
+    start = START - timedelta(days=29)
+    params = {
+        "start": start,
+        "date_from": START,
+        "date_to": date_to,
+        "days": (date_to - start).days,
+    }
+    out = []
+    for r in db.execute(CALENDAR_SQL, params):
+        out.append(
+            {
+                "date": r.day.isoformat(),
+                "income": r.income,
+                "expense": r.expense,
+                "net": r.income - r.expense,
+                "cumulative_net": r.cumulative_net,
+                "net_7d": r.net_7d,
+                "net_30d": r.net_30d,
+            }
+        )
+    return out
+
+
+def _bench(fn, db: Session, date_to: date, repeat: int) -> float:
+    fn(db, date_to)  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(db, date_to)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--step", type=int, default=3, help="one active day every N days")
+    args = parser.parse_args()
+
+    days = args.years * 365
+    date_to = START + timedelta(days=days - 1)
+
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            conn.execute(SEED_SQL, {"days": days, "step": args.step})
+            conn.execute(text("ANALYZE daily_rollups"))
+            db = Session(bind=conn)
+            assert python_fill(db, date_to) == sql_calendar(db, date_to)
+
+            python_s = _bench(python_fill, db, date_to, args.repeat)
+            sql_s = _bench(sql_calendar, db, date_to, args.repeat)
+            db.close()
+        finally:
+            trans.rollback()
+
+    print(f"points:          {days}")
+    print(f"python fill:     {python_s * 1000:8.1f} ms")
+    print(f"generate_series: {sql_s * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
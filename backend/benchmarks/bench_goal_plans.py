@@ -0,0 +1,58 @@
+"""
+Planning N goals: one plan_goal call per goal (what a dashboard did through
+GET /goals/{id}/plan) against a single plan_goals call (GET /goals/plans).
+Needs DATABASE_URL; reads the existing history and does not write.
+
+    python -m benchmarks.bench_goal_plans --goals 1 20 100 --repeat 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from app.crud.goal_planner import plan_goal, plan_goals
+from app.db.session import SessionLocal
+
+
+def _bench(fn, repeat: int) -> float:
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--goals", type=int, nargs="+", default=[1, 20, 100])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        print(f"{'goals':>6} {'per goal':>10} {'batched':>10}")
+        for n in args.goals:
+            goals = [
+                (Decimal(1000 + 37 * k) + Decimal("0.01"), date.today() + timedelta(days=30 * k))
+                for k in range(1, n + 1)
+            ]
+
+            def per_goal(goals=goals):
+                return [plan_goal(db, target_amount=a, target_date=d) for a, d in goals]
+
+            def batched(goals=goals):
+                return plan_goals(db, goals)
+
+            assert per_goal() == batched()
+            per_goal_s = _bench(per_goal, args.repeat)
+            batched_s = _bench(batched, args.repeat)
+            print(f"{n:>6} {per_goal_s * 1000:>8.1f}ms {batched_s * 1000:>8.1f}ms")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Time simulate_goal (app/services/goal_simulation.py) on the request-path
+budget: 10k paths x 120 months should stay under 50 ms.
+
+    python -m benchmarks.bench_goal_simulation --paths 10000 --horizon 120 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app.services.goal_simulation import simulate_goal  # noqa: E402
+
+BUDGET_MS = 50.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--paths", type=int, default=10_000)
+    parser.add_argument("--horizon", type=int, default=120)
+    parser.add_argument("--history", type=int, default=12, help="months of history")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    # Monthly net in cents: mostly positive with the odd bad month
+    rng = np.random.default_rng(0)
+    history = rng.normal(40_000, 60_000, size=args.history).round().astype(np.int64).tolist()
+    target = 2_000_000
+
+    def run():
+        return simulate_goal(
+            history,
+            target=target,
+            months_to_target=48,
+            paths=args.paths,
+            horizon_months=args.horizon,
+        )
+
+    result = run()  # warm up
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    median = float(np.median(timings))
+    print(f"paths x months:  {args.paths} x {args.horizon}")
+    print(f"median:          {median:8.1f} ms")
+    print(f"max:             {max(timings):8.1f} ms")
+    print(f"budget:          {BUDGET_MS:8.1f} ms ({'ok' if median < BUDGET_MS else 'OVER'})")
+    print(f"P(by target):    {result.probability_by_target:8.3f}")
+    print(f"completion p50:  {result.completion_months[50]} months")
+
+
+if __name__ == "__main__":
+    main()
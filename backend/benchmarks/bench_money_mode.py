@@ -0,0 +1,93 @@
+"""
+GET /analytics/daily over a multi-year range: Decimal amounts through the
+DailySeries model (MONEY_MODE=decimal) against int cents rendered straight to
+JSON (MONEY_MODE=cents). Times the query plus serialization, without HTTP.
+Needs DATABASE_URL.
+
+Daily rollup rows are seeded far in the future inside a transaction that is
+rolled back afterwards.
+
+    python -m benchmarks.bench_money_mode --years 10 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.money import money_json
+from app.crud.analytics.daily import get_daily_series
+from app.db.session import engine
+from app.schemas.daily_analytics import DailySeries
+
+START = date(2200, 1, 1)
+
+SEED_SQL = text("""
+    INSERT INTO daily_rollups (day, tx_type, category, bucket, amount, tx_count)
+    SELECT
+        DATE '2200-01-01' + d,
+        t,
+        'bench_' || c,
+        NULL,
+        ((d * 7 + c * 13) % 50000) / 100.0 + 1,
+        1
+    FROM generate_series(0, :days - 1) AS d,
+         unnest(ARRAY['income', 'expense']) AS t,
+         generate_series(1, 4) AS c
+    """)
+
+
+def decimal_mode(db: Session, date_to: date) -> str:
+    points = get_daily_series(db, date_from=START, date_to=date_to)
+    payload = DailySeries.model_validate({"points": points}).model_dump(mode="json")
+    return json.dumps(payload)
+
+
+def cents_mode(db: Session, date_to: date) -> str:
+    points = get_daily_series(db, date_from=START, date_to=date_to, cents=True)
+    return json.dumps(money_json({"points": points}))
+
+
+def _bench(fn, db: Session, date_to: date, repeat: int) -> float:
+    fn(db, date_to)  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(db, date_to)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    days = args.years * 365
+    date_to = START + timedelta(days=days - 1)
+
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            conn.execute(SEED_SQL, {"days": days})
+            db = Session(bind=conn)
+            assert json.loads(decimal_mode(db, date_to)) == json.loads(cents_mode(db, date_to))
+
+            decimal_s = _bench(decimal_mode, db, date_to, args.repeat)
+            cents_s = _bench(cents_mode, db, date_to, args.repeat)
+            db.close()
+        finally:
+            trans.rollback()
+
+    print(f"points:  {days}")
+    print(f"decimal: {decimal_s * 1000:8.1f} ms")
+    print(f"cents:   {cents_s * 1000:8.1f} ms")
+    print(f"speedup: {decimal_s / cents_s:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
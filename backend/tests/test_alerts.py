@@ -1,8 +1,17 @@
+import random
 from datetime import date
+from uuid import uuid4
 
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
 
+from app.db.base import Base
+from app.db.session import SessionLocal
 from app.main import app
+from app.models.budget import Budget, BudgetAlertState
+from app.services.budget_alerts import refresh_alert_states
+from app.services.rollups import apply_transaction_rows
 
 client = TestClient(app)
 
@@ -47,3 +56,123 @@ def test_alerts_over_budget():
     # should include dining_out as over budget
     # (may include other alerts depending on prior test data)
     assert any(a["category"] == "dining_out" and float(a["over_by"]) >= 15 for a in data["alerts"])
+
+
+def _state(month: date, category: str) -> tuple | None:
+    db = SessionLocal()
+    try:
+        row = db.execute(
+            select(
+                BudgetAlertState.spent, BudgetAlertState.level, BudgetAlertState.previous_level
+            ).where(BudgetAlertState.month == month, BudgetAlertState.category == category)
+        ).first()
+        return tuple(row) if row else None
+    finally:
+        db.close()
+
+
+def _alert_levels(month: date, threshold: int) -> dict[str, int]:
+    res = client.get(f"/alerts?month={month:%Y-%m}&threshold={threshold}")
+    assert res.status_code == 200, res.text
+    return {a["category"]: a["threshold"] for a in res.json()["alerts"]}
+
+
+def test_alert_states_follow_writes_and_thresholds():
+    category = f"alerts_{uuid4().hex[:8]}"
+    month = date(2070 + random.randrange(20), random.randrange(1, 13), 1)
+    other_month = month.replace(year=month.year + 100)
+
+    res = client.post(
+        "/budgets", json={"category": category, "monthly_limit": 100, "currency": "EUR"}
+    )
+    assert res.status_code == 201, res.text
+    budget_id = res.json()["id"]
+
+    def expense(amount, day=month):
+        res = client.post(
+            "/transactions",
+            json={
+                "tx_type": "expense",
+                "amount": amount,
+                "currency": "EUR",
+                "category": category,
+                "occurred_on": str(day),
+            },
+        )
+        assert res.status_code == 201, res.text
+        return res.json()["id"]
+
+    expense(40)
+    assert _state(month, category)[1:] == (0, 0)
+    assert category not in _alert_levels(month, 50)
+
+    expense(20)  # 60 %
+    assert _state(month, category)[1:] == (50, 0)
+    assert _alert_levels(month, 50)[category] == 50
+    assert category not in _alert_levels(month, 80)
+
+    tx_id = expense(45)  # 105 %: under -> over
+    assert _state(month, category)[1:] == (100, 50)
+    assert _alert_levels(month, 100)[category] == 100
+    alerts = client.get(f"/alerts?month={month:%Y-%m}").json()["alerts"]
+    assert next(a for a in alerts if a["category"] == category)["over_by"] == "5.00"
+
+    # Moving the expense to another month re-evaluates both months
+    res = client.put(f"/transactions/{tx_id}", json={"occurred_on": str(other_month)})
+    assert res.status_code == 200, res.text
+    assert _state(month, category)[1:] == (50, 100)
+    assert _state(other_month, category)[1:] == (0, 0)
+
+    # A CSV import counts too: 60 + 25 = 85 %
+    csv_bytes = (
+        "tx_type,amount,currency,category,bucket,occurred_on,note\n"
+        f"expense,25,EUR,{category},,{month},import {uuid4().hex}\n"
+    ).encode()
+    res = client.post("/import/csv", files={"file": ("a.csv", csv_bytes, "text/csv")})
+    assert res.status_code == 200, res.text
+    assert _state(month, category)[1:] == (80, 50)
+
+    # Budget changes re-evaluate every month of the category
+    res = client.put(f"/budgets/{budget_id}", json={"monthly_limit": 50})
+    assert res.status_code == 200, res.text
+    assert _state(month, category)[1:] == (100, 80)
+    assert _state(other_month, category)[1:] == (80, 0)
+
+    res = client.delete(f"/transactions/{tx_id}")
+    assert res.status_code in (200, 204), res.text
+    assert _state(other_month, category) is None
+
+    assert client.delete(f"/budgets/{budget_id}").status_code in (200, 204)
+    assert _state(month, category) is None
+
+
+def test_alerts_rejects_unknown_threshold():
+    assert client.get("/alerts?threshold=90").status_code == 400
+
+
+def test_alert_states_on_sqlite():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = Session(engine)
+    month = date(2026, 4, 1)
+    try:
+        db.add(Budget(category="food", monthly_limit=100, currency="EUR"))
+        apply_transaction_rows(
+            db, [("expense", 85, "EUR", "food", "necessary", date(2026, 4, 2), None)]
+        )
+        # Not one of the app's sessions: the commit leaves the states alone
+        db.commit()
+        assert db.scalars(select(BudgetAlertState)).all() == []
+
+        # The refresh itself is plain SQL that SQLite runs too
+        refresh_alert_states(db, keys=[(month, "food")])
+        state = db.scalars(select(BudgetAlertState)).one()
+        assert (state.month, state.spent, state.level) == (month, 85, 80)
+
+        apply_transaction_rows(
+            db, [("expense", 85, "EUR", "food", "necessary", date(2026, 4, 2), None)], sign=-1
+        )
+        refresh_alert_states(db, category="food")
+        assert db.scalars(select(BudgetAlertState)).all() == []
+    finally:
+        db.close()
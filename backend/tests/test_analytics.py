@@ -1,8 +1,16 @@
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 
 from fastapi.testclient import TestClient
 
+from app.crud.analytics.summary import (
+    get_by_bucket,
+    get_by_category,
+    get_monthly,
+    get_summary,
+    get_totals,
+)
+from app.db.session import SessionLocal
 from app.main import app
 
 client = TestClient(app)
@@ -63,3 +71,26 @@ def test_analytics_summary_shape():
     )
     assert isinstance(data["by_category"], list)
     assert isinstance(data["monthly"], list)
+
+
+def test_summary_single_statement_matches_separate_queries():
+    _seed_transactions()
+    db = SessionLocal()
+    try:
+        kwargs = {"date_from": date.today() - timedelta(days=400), "date_to": date.today()}
+        combined = get_summary(db, top_n=50, months=60, **kwargs)
+
+        assert combined["totals"] == get_totals(db, **kwargs)
+        assert combined["monthly"] == get_monthly(db, months=60, **kwargs)
+
+        def by_key(rows, key):
+            return {r[key]: r["expense"] for r in rows}
+
+        assert by_key(combined["by_bucket"], "bucket") == by_key(
+            get_by_bucket(db, **kwargs), "bucket"
+        )
+        assert by_key(combined["by_category"], "category") == by_key(
+            get_by_category(db, top_n=50, **kwargs), "category"
+        )
+    finally:
+        db.close()
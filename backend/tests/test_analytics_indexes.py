@@ -0,0 +1,102 @@
+from datetime import date
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.crud.alerts import get_over_budget_alerts
+from app.crud.analytics.daily import get_daily_series
+from app.crud.analytics.summary import get_by_bucket, get_by_category, get_monthly, get_totals
+from app.db.session import engine
+from app.services.rollups import REBUILD_DAILY_SQL, REBUILD_MONTHLY_SQL
+
+
+def _seed(conn) -> None:
+    # ~20k rows over five years; rolled back at the end of the test
+    conn.execute(text("""
+            INSERT INTO transactions (tx_type, amount, currency, category, bucket, occurred_on)
+            SELECT
+                CASE WHEN g % 5 = 0 THEN 'income' ELSE 'expense' END,
+                (g % 300) + 1,
+                'EUR',
+                (ARRAY['rent', 'groceries', 'dining_out', 'shopping'])[g % 4 + 1],
+                (ARRAY['necessary', 'controllable', 'unnecessary'])[g % 3 + 1],
+                DATE '2021-01-01' + (g % 1825)
+            FROM generate_series(1, 20000) AS g
+            """))
+    # Rebuild the rollups the daily series reads from
+    conn.execute(text("DELETE FROM monthly_rollups"))
+    conn.execute(text("DELETE FROM daily_rollups"))
+    conn.execute(text(REBUILD_DAILY_SQL))
+    conn.execute(text(REBUILD_MONTHLY_SQL))
+    conn.execute(text("ANALYZE transactions"))
+    conn.execute(text("ANALYZE daily_rollups"))
+
+
+def test_summary_queries_use_indexes():
+    date_from, date_to = date(2024, 3, 1), date(2024, 3, 31)
+
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            _seed(conn)
+
+            captured: list[tuple[str, object]] = []
+
+            def capture(_conn, _cursor, statement, parameters, _context, _executemany):
+                if statement.lstrip().upper().startswith("SELECT"):
+                    captured.append((statement, parameters))
+
+            event.listen(conn, "before_cursor_execute", capture)
+            db = Session(bind=conn)
+            get_totals(db, date_from=date_from, date_to=date_to)
+            get_by_bucket(db, date_from=date_from, date_to=date_to)
+            get_by_category(db, date_from=date_from, date_to=date_to)
+            get_daily_series(db, date_from=date_from, date_to=date_to)
+            get_over_budget_alerts(db, for_date=date_from)
+            db.close()
+            event.remove(conn, "before_cursor_execute", capture)
+
+            assert len(captured) == 5
+            for statement, parameters in captured:
+                plan = "\n".join(
+                    r[0] for r in conn.exec_driver_sql("EXPLAIN " + statement, parameters)
+                )
+                # The daily series reads daily_rollups, which has its own key index
+                assert "Seq Scan on transactions" not in plan, plan
+                assert "Seq Scan on daily_rollups" not in plan, plan
+                # Alerts read budget_alert_states (a row per budget and month), not the
+                # transactions; Postgres may scan a table that small
+                if "budget_alert_states" not in statement:
+                    assert "Index" in plan, plan
+        finally:
+            trans.rollback()
+
+
+def test_monthly_groups_in_month_index_order():
+    # Five years of data, bounded by date: the default 12-month chart reads the
+    # (month, day) index backwards and aggregates without sorting
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            _seed(conn)
+
+            captured: list[tuple[str, object]] = []
+
+            def capture(_conn, _cursor, statement, parameters, _context, _executemany):
+                if statement.lstrip().upper().startswith("SELECT"):
+                    captured.append((statement, parameters))
+
+            event.listen(conn, "before_cursor_execute", capture)
+            db = Session(bind=conn)
+            monthly = get_monthly(db, date_from=date(2021, 1, 1), date_to=date(2025, 12, 31))
+            db.close()
+            event.remove(conn, "before_cursor_execute", capture)
+
+            assert [m["month"] for m in monthly] == [f"2025-{m:02d}" for m in range(1, 13)]
+            ((statement, parameters),) = captured
+            plan = "\n".join(r[0] for r in conn.exec_driver_sql("EXPLAIN " + statement, parameters))
+            assert "ix_daily_rollups_month_day" in plan, plan
+            assert "GroupAggregate" in plan, plan
+            assert "Sort" not in plan, plan
+        finally:
+            trans.rollback()
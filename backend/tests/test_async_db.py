@@ -0,0 +1,47 @@
+from datetime import date
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.db.async_session import get_async_engine
+from app.main import app, create_app
+
+sync_client = TestClient(app)
+
+
+def _create_async_app(monkeypatch):
+    monkeypatch.setattr(settings, "db_mode", "async")
+    return create_app()
+
+
+def test_async_dashboard_matches_sync(monkeypatch):
+    async_app = _create_async_app(monkeypatch)
+    today = date.today()
+    paths = [
+        "/analytics/summary?top_categories=5&months=3",
+        f"/analytics/daily?date_from={today.replace(day=1)}&date_to={today}",
+        "/alerts",
+    ]
+
+    with TestClient(async_app) as client:
+        try:
+            for path in paths:
+                res = client.get(path)
+                assert res.status_code == 200, res.text
+                assert res.json() == sync_client.get(path).json()
+
+            pool = client.get("/db/pool").json()["async"]
+            assert pool["checkouts"] >= len(paths)
+        finally:
+            # Pooled async connections belong to this client's event loop
+            client.portal.call(get_async_engine().dispose)
+
+
+def test_async_goal_plan_not_found(monkeypatch):
+    async_app = _create_async_app(monkeypatch)
+    with TestClient(async_app) as client:
+        try:
+            res = client.get("/goals/2000000000/plan")
+            assert res.status_code == 404
+        finally:
+            client.portal.call(get_async_engine().dispose)
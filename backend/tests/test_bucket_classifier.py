@@ -1,4 +1,4 @@
-from app.services.bucket_classifier import infer_bucket
+from app.services.bucket_classifier import infer_bucket, infer_buckets
 
 
 def test_infer_bucket_from_category():
@@ -15,3 +15,29 @@ def test_infer_bucket_from_note_keywords():
 
 def test_infer_bucket_unknown_returns_none():
     assert infer_bucket(category="some_new_category", note="random") is None
+
+
+def test_infer_bucket_keeps_rule_priority_in_single_scan():
+    # "bar" (unnecessary) appears first, but the necessary rule has priority
+    assert infer_bucket(category=None, note="bar rent split") == "necessary"
+    assert infer_bucket(category=None, note="cinema then coffee") == "controllable"
+
+
+def test_infer_buckets_batch_matches_single():
+    items = [
+        ("rent", None),
+        (None, "NETFLIX.COM"),
+        (None, "UBER *TRIP"),
+        (None, "netflix.com"),
+        ("  Dining_Out ", "whatever"),
+        (None, None),
+    ]
+    assert infer_buckets(items) == [infer_bucket(category=c, note=n) for c, n in items]
+    assert infer_buckets(items) == [
+        "necessary",
+        "unnecessary",
+        "controllable",
+        "unnecessary",
+        "controllable",
+        None,
+    ]
@@ -0,0 +1,81 @@
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.db.session import SessionLocal
+from app.models.rollup import DailyRollup
+from app.models.transaction import Transaction
+from app.services.bulk_loader import merge_transactions
+from app.services.rollups import apply_transaction_rows
+
+
+def _rows(note: str) -> list[tuple]:
+    return [
+        ("expense", Decimal("9.99"), "EUR", "dining_out", "controllable", date(2026, 1, 3), note),
+        ("income", 250.5, "EUR", "salary", "necessary", date(2026, 1, 4), note),
+        ("expense", Decimal("1.00"), "EUR", "misc", "unnecessary", date(2026, 1, 5), note),
+    ]
+
+
+@pytest.mark.parametrize("backend", ["copy", "insert"])
+def test_merge_transactions_staging_backends(backend):
+    note = f"bulk loader {backend} {uuid4().hex[:8]}"
+    fingerprints = [uuid4().hex for _ in range(3)]
+
+    db = SessionLocal()
+    try:
+        merged = merge_transactions(db, _rows(note), fingerprints, backend=backend)
+        db.commit()
+        stored = db.scalars(select(Transaction.amount).where(Transaction.note == note)).all()
+    finally:
+        db.close()
+
+    assert (merged.inserted, merged.updated, merged.skipped) == (3, 0, 0)
+    assert sorted(stored) == [Decimal("1.00"), Decimal("9.99"), Decimal("250.50")]
+
+
+def test_merge_transactions_on_sqlite():
+    # No temp table / ON CONFLICT ... RETURNING xmax: the portable merge runs instead
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = Session(engine)
+    fingerprints = ["a", "b", "c"]
+    try:
+        merged = merge_transactions(db, _rows("first"), fingerprints)
+        assert (merged.inserted, merged.updated, merged.skipped) == (3, 0, 0)
+        assert [r[0] for r in merged.rows] == [1, 2, 3]
+
+        again = _rows("first")
+        again[1] = again[1][:4] + ("controllable",) + again[1][5:]
+        merged = merge_transactions(db, again, fingerprints)
+        assert (merged.inserted, merged.updated, merged.skipped) == (0, 0, 3)
+
+        merged = merge_transactions(db, again, fingerprints, on_duplicate="upsert")
+        assert (merged.inserted, merged.updated, merged.skipped) == (0, 1, 2)
+        assert merged.rows == [(2, *again[1][:1], Decimal("250.50"), *again[1][2:])]
+
+        buckets = db.execute(
+            select(DailyRollup.bucket, DailyRollup.tx_count).where(
+                DailyRollup.day == date(2026, 1, 4)
+            )
+        ).all()
+        assert buckets == [("controllable", 1)]
+
+        # NULL bucket: the second row must land on the first row's rollup key
+        unbucketed = ("expense", Decimal("2.00"), "EUR", "misc", None, date(2026, 1, 6), "first")
+        merged = merge_transactions(db, [unbucketed, unbucketed], ["d", "e"])
+        assert (merged.inserted, merged.updated, merged.skipped) == (2, 0, 0)
+        null_key = select(DailyRollup.amount, DailyRollup.tx_count).where(
+            DailyRollup.day == date(2026, 1, 6)
+        )
+        assert db.execute(null_key).all() == [(Decimal("4.00"), 2)]
+
+        apply_transaction_rows(db, [unbucketed, unbucketed], sign=-1)
+        assert db.execute(null_key).all() == []
+    finally:
+        db.close()
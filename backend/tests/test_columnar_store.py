@@ -0,0 +1,162 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.crud.analytics.daily import get_daily_series
+from app.crud.analytics.summary import get_summary
+from app.db.session import SessionLocal
+from app.main import app
+from app.services.columnar_store import ColumnarStore, columnar_store
+
+client = TestClient(app)
+
+
+def _sorted(groups: list[dict], key: str) -> list[tuple]:
+    return sorted((str(g[key]), g["expense"]) for g in groups)
+
+
+def test_store_matches_sql_aggregates():
+    store = ColumnarStore(enabled=True)
+    db = SessionLocal()
+    try:
+        store.reload(db)
+        for bounds in ({}, {"date_from": date.today() - timedelta(days=90)}):
+            sql = get_summary(db, top_n=1_000, months=1_000, **bounds)
+            mem = store.summary(db, top_n=1_000, months=1_000, **bounds)
+            assert mem["totals"] == sql["totals"]
+            assert mem["monthly"] == sql["monthly"]
+            # Ties in expense may order differently
+            assert _sorted(mem["by_bucket"], "bucket") == _sorted(sql["by_bucket"], "bucket")
+            assert _sorted(mem["by_category"], "category") == _sorted(
+                sql["by_category"], "category"
+            )
+
+        date_from, date_to = date.today() - timedelta(days=30), date.today()
+        assert store.daily(db, date_from=date_from, date_to=date_to) == get_daily_series(
+            db, date_from=date_from, date_to=date_to
+        )
+    finally:
+        db.close()
+
+
+def test_store_follows_writes(monkeypatch):
+    monkeypatch.setattr(columnar_store, "enabled", True)
+    monkeypatch.setattr(columnar_store, "loaded", False)
+    db = SessionLocal()
+    try:
+        columnar_store.reload(db)
+    finally:
+        db.close()
+
+    # A day nobody else writes to, so the expected totals are exact
+    day = date(2090, 1, 1) + timedelta(days=random.randrange(3_650))
+    category = f"columnar_{uuid4().hex[:8]}"
+    base = {"currency": "EUR", "category": category, "occurred_on": str(day), "note": None}
+
+    def create(tx_type: str, amount: str) -> int:
+        res = client.post("/transactions", json={**base, "tx_type": tx_type, "amount": amount})
+        assert res.status_code == 201, res.text
+        return res.json()["id"]
+
+    def summary() -> dict:
+        res = client.get(f"/analytics/summary?date_from={day}&date_to={day}")
+        assert res.status_code == 200, res.text
+        return res.json()
+
+    create("income", "100.00")
+    expense_id = create("expense", "40.10")
+    doomed_id = create("expense", "5.00")
+
+    data = summary()
+    assert data["totals"] == {"income": "100.00", "expense": "45.10", "net": "54.90"}
+    assert data["by_category"] == [{"category": category, "expense": "45.10"}]
+
+    res = client.put(f"/transactions/{expense_id}", json={"amount": "30.00"})
+    assert res.status_code == 200, res.text
+    assert client.delete(f"/transactions/{doomed_id}").status_code == 204
+    assert summary()["totals"]["expense"] == "30.00"
+
+    res = client.post(
+        "/transactions/batch",
+        json={
+            "operations": [
+                {"op": "create", "data": {**base, "tx_type": "expense", "amount": "2.50"}},
+                {"op": "delete", "id": expense_id},
+            ]
+        },
+    )
+    assert res.status_code == 200, res.text
+    data = summary()
+    assert data["totals"] == {"income": "100.00", "expense": "2.50", "net": "97.50"}
+    assert data["monthly"] == [
+        {"month": day.strftime("%Y-%m"), "income": "100.00", "expense": "2.50", "net": "97.50"}
+    ]
+
+    csv = f"tx_type,amount,category,occurred_on\nexpense,7.25,{category},{day}\n"
+    res = client.post("/import/csv", files={"file": ("c.csv", csv.encode(), "text/csv")})
+    assert res.status_code == 200, res.text
+    assert summary()["totals"]["expense"] == "9.75"
+
+
+@pytest.mark.parametrize("count", [0, 1, 3_000])
+def test_delete_ids_keeps_index_consistent(count):
+    store = ColumnarStore(enabled=True)
+    store.loaded = True
+    day = date(2024, 5, 1)
+    rows = [(i, "expense", i + 1, "EUR", f"c{i % 7}", None, day, None) for i in range(count)]
+    store.upsert_rows(rows)
+    store.delete_ids(range(0, count, 2))
+
+    expected = sum(i + 1 for i in range(1, count, 2))
+    assert len(store) == count - (count + 1) // 2
+    assert store.totals(None)["expense"] == expected
+
+
+class _CommitDuringLoad:
+    """Session stand-in that runs `write` right after the load's snapshot is taken."""
+
+    def __init__(self, db, write):
+        self._db = db
+        self._write = write
+
+    def execute(self, stmt, *args, **kwargs):
+        result = self._db.execute(stmt, *args, **kwargs)
+        self._write()
+        return result
+
+
+def test_writes_committed_during_a_reload_are_kept(monkeypatch):
+    monkeypatch.setattr(columnar_store, "enabled", True)
+    monkeypatch.setattr(columnar_store, "loaded", False)
+    day = date(2090, 1, 1) + timedelta(days=random.randrange(36_500))
+    base = {"currency": "EUR", "category": f"columnar_{uuid4().hex[:8]}", "occurred_on": str(day)}
+
+    def create(amount: str) -> int:
+        res = client.post("/transactions", json={**base, "tx_type": "expense", "amount": amount})
+        assert res.status_code == 201, res.text
+        return res.json()["id"]
+
+    doomed_id = create("5.00")
+    written = []
+
+    def write():
+        # Not in the snapshot the load is reading: must be replayed afterwards
+        written.append(create("1.25"))
+        assert client.delete(f"/transactions/{doomed_id}").status_code == 204
+
+    db = SessionLocal()
+    try:
+        columnar_store.reload(_CommitDuringLoad(db, write))
+        assert written
+        points = columnar_store.daily(db, date_from=day, date_to=day)
+        monkeypatch.setattr(columnar_store, "enabled", False)
+        sql = get_daily_series(db, date_from=day, date_to=day)
+    finally:
+        db.close()
+
+    assert points == sql
+    assert points[0]["expense"] >= Decimal("1.25")
@@ -0,0 +1,45 @@
+import pandas as pd
+
+from app.services.csv_validator import validate_transactions
+
+
+def _frame(rows):
+    columns = ["tx_type", "amount", "currency", "category", "bucket", "occurred_on", "note"]
+    return pd.DataFrame(rows, columns=columns, dtype=object)
+
+
+def test_first_failing_rule_is_the_reason():
+    df = _frame(
+        [
+            ["expense", "12.50", "EUR", "food", None, "2026-01-02", None],
+            ["refund", "-1", "EUR", None, "luxury", "2026-01-02", None],
+            ["expense", "abc", "EUR", None, None, "2026-01-02", None],
+            ["income", "inf", "EUR", None, None, "2026-01-02", None],
+            ["income", "5", "EUR", None, "luxury", None, None],
+            ["income", "5", "EUR", None, None, None, None],
+            ["income", "1e12", "EUR", None, None, "2026-01-02", None],
+            ["expense", "3", "EUR", None, "necessary", "not a date", None],
+        ]
+    )
+
+    result = validate_transactions(df)
+
+    assert result.valid.index.tolist() == [0]
+    assert result.valid["amount"].tolist() == [12.5]
+    assert result.valid["occurred_on"].dt.date.astype(str).tolist() == ["2026-01-02"]
+    assert result.reasons.to_dict() == {
+        1: "tx_type: isin(['income', 'expense']) (refund)",
+        2: "amount: coerce_dtype('float64') (abc)",
+        3: "amount: coerce_dtype('float64') (inf)",
+        4: "bucket: isin(['necessary', 'controllable', 'unnecessary']) (luxury)",
+        5: "occurred_on: not_nullable",
+        6: "amount: less_than(10000000000) (1e12)",
+        7: "occurred_on: coerce_dtype('datetime64[ns]') (not a date)",
+    }
+
+
+def test_clean_chunk_has_no_reasons():
+    df = _frame([["income", "100", "EUR", "salary", None, "2026-01-01", "pay"]])
+    result = validate_transactions(df)
+    assert result.reasons.empty
+    assert len(result.valid) == 1
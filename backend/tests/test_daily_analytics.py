@@ -1,7 +1,12 @@
+import random
 from datetime import date, timedelta
+from decimal import Decimal
 
+import pytest
 from fastapi.testclient import TestClient
 
+from app.crud.analytics.daily import get_daily_series
+from app.db.session import SessionLocal
 from app.main import app
 
 client = TestClient(app)
@@ -57,3 +62,96 @@ def test_daily_analytics_points():
     assert "points" in data
     assert isinstance(data["points"], list)
     assert any(p["date"] == str(d1) for p in data["points"])
+
+
+def _unused_day(before: int, after: int) -> date:
+    # Other tests also write to random far-future days; find a quiet window
+    while True:
+        day = date(2090, 1, 1) + timedelta(days=random.randrange(36_500))
+        date_from, date_to = day - timedelta(days=before), day + timedelta(days=after)
+        res = client.get(f"/analytics/daily?date_from={date_from}&date_to={date_to}")
+        if not res.json()["points"]:
+            return day
+
+
+def test_daily_series_fill_cumulative_and_rolling():
+    day = _unused_day(before=30, after=4)
+    for tx_type, amount, offset in [
+        ("expense", 5, -3),  # before the range: only in the rolling windows
+        ("income", 100, 0),
+        ("expense", 40, 0),
+        ("expense", 10, 2),
+    ]:
+        res = client.post(
+            "/transactions",
+            json={
+                "tx_type": tx_type,
+                "amount": amount,
+                "currency": "EUR",
+                "category": "daily_fill",
+                "occurred_on": str(day + timedelta(days=offset)),
+            },
+        )
+        assert res.status_code == 201, res.text
+
+    date_to = day + timedelta(days=4)
+    res = client.get(f"/analytics/daily?date_from={day}&date_to={date_to}")
+    assert [p["date"] for p in res.json()["points"]] == [str(day), str(day + timedelta(days=2))]
+    assert set(res.json()["points"][0]) == {"date", "income", "expense", "net"}
+
+    res = client.get(f"/analytics/daily?date_from={day}&date_to={date_to}&fill=true")
+    points = res.json()["points"]
+    assert [p["date"] for p in points] == [str(day + timedelta(days=k)) for k in range(5)]
+    assert [Decimal(p["net"]) for p in points] == [60, 0, -10, 0, 0]
+
+    res = client.get(
+        f"/analytics/daily?date_from={day}&date_to={date_to}&cumulative=true&rolling=true"
+    )
+    points = res.json()["points"]
+    assert len(points) == 5
+    assert [Decimal(p["cumulative_net"]) for p in points] == [60, 60, 50, 50, 50]
+    assert [Decimal(p["net_7d"]) for p in points] == [55, 55, 45, 45, 50]
+    assert [Decimal(p["net_30d"]) for p in points] == [55, 55, 45, 45, 45]
+
+
+@pytest.mark.parametrize("cents", [False, True])
+def test_filled_series_matches_naive_sums(cents):
+    date_from, date_to = date(2024, 1, 1), date(2026, 12, 31)
+    db = SessionLocal()
+    try:
+        series = get_daily_series(
+            db, date_from=date_from, date_to=date_to, cumulative=True, rolling=True, cents=cents
+        )
+        lookback = date_from - timedelta(days=29)
+        sparse = get_daily_series(db, date_from=lookback, date_to=date_to, cents=cents)
+    finally:
+        db.close()
+
+    net = {date.fromisoformat(p["date"]): p["net"] for p in sparse}
+    assert len(series) == (date_to - date_from).days + 1
+    for k, p in enumerate(series):
+        day = date_from + timedelta(days=k)
+        assert p["date"] == str(day)
+        assert p["net"] == net.get(day, 0)
+        assert p["cumulative_net"] == sum(v for d, v in net.items() if date_from <= d <= day)
+        for days in (7, 30):
+            window = [v for d, v in net.items() if day - timedelta(days=days) < d <= day]
+            assert p[f"net_{days}d"] == sum(window)
+
+
+def test_daily_range_limits():
+    # Only the gap-filled calendar is capped; a sparse series has no point per day
+    res = client.get("/analytics/daily?date_from=2000-01-01&date_to=2026-01-01")
+    assert res.status_code == 200, res.text
+    for dense in ("fill", "cumulative", "rolling"):
+        res = client.get(f"/analytics/daily?date_from=2000-01-01&date_to=2026-01-01&{dense}=true")
+        assert res.status_code == 400
+        assert "at most" in res.json()["detail"]
+
+    # Rolling windows and the calendar stop at the ends of the date range
+    res = client.get("/analytics/daily?date_from=0001-01-01&date_to=0001-01-03&rolling=true")
+    assert res.status_code == 200, res.text
+    assert [p["date"] for p in res.json()["points"]] == ["0001-01-01", "0001-01-02", "0001-01-03"]
+    res = client.get("/analytics/daily?date_from=9999-12-30&date_to=9999-12-31&fill=true")
+    assert res.status_code == 200, res.text
+    assert len(res.json()["points"]) == 2
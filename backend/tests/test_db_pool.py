@@ -0,0 +1,47 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+from app.db.pool import InstrumentedQueuePool, engine_options, instrument, pool_status
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_db_pool_reports_checkouts():
+    before = client.get("/db/pool").json()["sync"]["checkouts"]
+    assert client.get("/db/ping").status_code == 200
+
+    res = client.get("/db/pool")
+    assert res.status_code == 200
+    data = res.json()
+    assert data["async"] is None
+    sync = data["sync"]
+    assert sync["checkouts"] >= before + 1
+    assert sync["size"] == settings.db_pool_size
+    assert sync["open_connections"] >= 1
+    assert sync["wait_max_ms"] >= sync["wait_avg_ms"] >= 0
+
+
+def test_idle_pre_ping_only_pings_idle_connections(monkeypatch):
+    monkeypatch.setattr(settings, "db_pool_pre_ping", "idle")
+    monkeypatch.setattr(settings, "db_pool_pre_ping_idle_seconds", 3600)
+    engine = create_engine(
+        settings.database_url, **engine_options(settings.database_url, InstrumentedQueuePool)
+    )
+    instrument(engine)
+    try:
+        for _ in range(3):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        assert pool_status(engine)["pings"] == 0
+
+        monkeypatch.setattr(settings, "db_pool_pre_ping_idle_seconds", 0)
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        status = pool_status(engine)
+        assert status["pings"] == 1
+        assert status["checkouts"] == 4
+        assert status["connects"] == 1
+    finally:
+        engine.dispose()
@@ -0,0 +1,106 @@
+from datetime import date
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core.cache import MemoryBackend, response_cache
+from app.db.session import SessionLocal
+from app.main import app
+from app.models.transaction import Transaction
+
+client = TestClient(app)
+
+
+def _create_tx():
+    res = client.post(
+        "/transactions",
+        json={
+            "tx_type": "expense",
+            "amount": 3,
+            "currency": "EUR",
+            "category": "etag_test",
+            "occurred_on": str(date.today()),
+        },
+    )
+    assert res.status_code == 201, res.text
+
+
+def test_transactions_not_modified_until_write():
+    _create_tx()
+    res = client.get("/transactions?limit=5")
+    assert res.status_code == 200
+    etag = res.headers["etag"]
+
+    res = client.get("/transactions?limit=5", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.content == b""
+    assert res.headers["etag"] == etag
+
+    # Different query, different representation
+    assert client.get("/transactions?limit=6").headers["etag"] != etag
+
+    _create_tx()
+    res = client.get("/transactions?limit=5", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.headers["etag"] != etag
+
+
+def test_summary_304_skips_the_endpoint():
+    res = client.get("/analytics/summary")
+    etag = res.headers["etag"]
+    stats = client.get("/cache/stats").json()
+
+    res = client.get("/analytics/summary", headers={"If-None-Match": f'"other", {etag}'})
+    assert res.status_code == 304
+    after = client.get("/cache/stats").json()
+    assert (after["hits"], after["misses"]) == (stats["hits"], stats["misses"])
+
+
+def test_budgets_etag_changes_on_budget_write():
+    etag = client.get("/budgets").headers["etag"]
+    assert client.get("/budgets", headers={"If-None-Match": etag}).status_code == 304
+
+    res = client.post(
+        "/budgets",
+        json={"category": f"etag_{uuid4().hex[:8]}", "monthly_limit": 5, "currency": "EUR"},
+    )
+    assert res.status_code == 201, res.text
+    assert client.get("/budgets", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_concurrent_writers_do_not_wait_on_each_other():
+    def add_tx(db):
+        db.add(
+            Transaction(
+                tx_type="expense",
+                amount=1,
+                currency="EUR",
+                category="etag_concurrent",
+                occurred_on=date.today(),
+            )
+        )
+        db.flush()
+
+    first, second = SessionLocal(), SessionLocal()
+    try:
+        add_tx(first)
+        # A per-table counter row locked by `first` would block this insert
+        second.execute(text("SET LOCAL lock_timeout = '2s'"))
+        add_tx(second)
+    finally:
+        first.rollback()
+        second.rollback()
+        first.close()
+        second.close()
+
+
+def test_etag_differs_across_processes_at_the_same_version(monkeypatch):
+    etag = client.get("/budgets").headers["etag"]
+    # Another worker, or this one after a restart, with its counter at the same number
+    other = MemoryBackend(max_entries=10)
+    other._version = response_cache.data_version()
+    monkeypatch.setattr(response_cache, "backend", other)
+    res = client.get("/budgets", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.headers["etag"] != etag
@@ -1,7 +1,9 @@
 from datetime import date, timedelta
 
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 
+from app.db.session import engine
 from app.main import app
 
 client = TestClient(app)
@@ -65,3 +67,54 @@ def test_goal_plan_returns_shape():
     assert "feasible" in data
     assert "suggested_cut_targets" in data
     assert isinstance(data["suggested_cut_targets"], list)
+
+
+def test_goal_plans_match_single_plans_with_constant_queries():
+    today = date.today()
+    ids = []
+    for days, amount in [(40, "300.00"), (200, "1000.01"), (3000, "25000.55")]:
+        res = client.post(
+            "/goals",
+            json={
+                "name": f"Plan {days}",
+                "target_amount": amount,
+                "currency": "EUR",
+                "target_date": str(today + timedelta(days=days)),
+            },
+        )
+        assert res.status_code == 201, res.text
+        ids.append(res.json()["id"])
+
+    statements = []
+
+    def count(*_):
+        statements.append(1)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        res_one = client.get("/goals/plans", params={"ids": ids[:1], "history_months": 5})
+        one = len(statements)
+        res = client.get("/goals/plans", params={"ids": ids, "history_months": 5})
+        many = len(statements) - one
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert res_one.status_code == 200, res_one.text
+    assert res.status_code == 200, res.text
+    assert many == one
+
+    plans = {p["goal_id"]: p for p in res.json()["plans"]}
+    assert sorted(plans) == sorted(ids)
+    for goal_id in ids:
+        single = client.get(f"/goals/{goal_id}/plan?history_months=5")
+        assert single.status_code == 200, single.text
+        plan = plans[goal_id]
+        assert plan.pop("name").startswith("Plan ")
+        assert plan.pop("goal_id") == goal_id
+        assert plan == single.json()
+
+
+def test_goal_plans_route_is_not_a_goal_id():
+    res = client.get("/goals/plans", params={"ids": [0]})
+    assert res.status_code == 200, res.text
+    assert res.json() == {"plans": []}
@@ -0,0 +1,91 @@
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.goal_simulation import simulate_goal
+
+client = TestClient(app)
+
+
+def test_constant_history_reaches_target_on_schedule():
+    result = simulate_goal([100], target=1_000, months_to_target=10, paths=500, seed=1)
+    assert result.probability_by_target == 1.0
+    assert result.probability_within_horizon == 1.0
+    assert result.completion_months == {10: 10, 50: 10, 90: 10}
+
+    late = simulate_goal([100], target=1_000, months_to_target=9, paths=500, seed=1)
+    assert late.probability_by_target == 0.0
+
+
+def test_unreachable_and_empty_history():
+    for history in ([-50, 0], []):
+        result = simulate_goal(history, target=1_000, months_to_target=12, paths=200, seed=3)
+        assert result.probability_by_target == 0.0
+        assert result.probability_within_horizon == 0.0
+        assert result.completion_months == {10: None, 50: None, 90: None}
+
+
+def test_bootstrap_spreads_completion_around_mean():
+    # Mean net 100 per month: the median path needs about 10 months
+    result = simulate_goal(
+        [0, 200], target=1_000, months_to_target=10, paths=10_000, horizon_months=60, seed=7
+    )
+    assert (
+        result.completion_months[10] < result.completion_months[50] < result.completion_months[90]
+    )
+    assert 9 <= result.completion_months[50] <= 11
+    assert 0.4 < result.probability_by_target < 0.8
+
+    again = simulate_goal(
+        [0, 200], target=1_000, months_to_target=10, paths=10_000, horizon_months=60, seed=7
+    )
+    assert again == result
+
+
+def test_goal_simulation_endpoint():
+    res = client.post(
+        "/goals",
+        json={
+            "name": "Simulated",
+            "target_amount": "500.00",
+            "currency": "EUR",
+            "target_date": str(date.today() + timedelta(days=365)),
+        },
+    )
+    assert res.status_code == 201, res.text
+    goal_id = res.json()["id"]
+
+    res = client.get(f"/goals/{goal_id}/simulation?paths=1000&horizon_months=36&seed=5")
+    assert res.status_code == 200, res.text
+    data = res.json()
+    assert data["paths"] == 1000
+    assert data["horizon_months"] == 36
+    assert 0.0 <= data["probability_by_target_date"] <= data["probability_within_horizon"] <= 1.0
+    assert [p["percentile"] for p in data["completion_percentiles"]] == [10, 50, 90]
+    for p in data["completion_percentiles"]:
+        assert (p["months"] is None) == (p["month"] is None)
+
+    assert client.get("/goals/999999999/simulation").status_code == 404
+
+    # Unseeded: a new sample per request, never served from the cache
+    stats = client.get("/cache/stats").json()
+    for _ in range(2):
+        res = client.get(f"/goals/{goal_id}/simulation?paths=100&horizon_months=12")
+        assert res.status_code == 200, res.text
+    after = client.get("/cache/stats").json()
+    assert (after["hits"], after["misses"]) == (stats["hits"], stats["misses"])
+
+
+def test_large_runs_are_drawn_in_blocks():
+    # 50k paths x 600 months would be a 240 MB array drawn at once
+    result = simulate_goal(
+        [100, 300], target=10**9, months_to_target=600, paths=50_000, horizon_months=600, seed=2
+    )
+    assert result.probability_within_horizon == 0.0
+
+    # Months are numbered across blocks: 200 per month reaches 25_000 in month 125
+    result = simulate_goal(
+        [200], target=25_000, months_to_target=130, paths=20_000, horizon_months=200, seed=2
+    )
+    assert result.completion_months == {10: 125, 50: 125, 90: 125}
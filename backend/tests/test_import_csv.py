@@ -1,16 +1,30 @@
+import time
+from uuid import uuid4
+
 from fastapi.testclient import TestClient
+from sqlalchemy import select
 
+from app.core.config import settings
+from app.db.session import SessionLocal
 from app.main import app
+from app.models.transaction import Transaction
+from app.services.csv_import import import_transactions_csv
+from app.services.csv_ranges import split_line_ranges
 
 client = TestClient(app)
 
 
+def _tagged(csv_bytes: bytes) -> bytes:
+    # Imports are deduplicated by content; a per-run tag in the notes keeps rows new
+    return csv_bytes.replace(b"{tag}", uuid4().hex[:8].encode())
+
+
 def test_import_csv_inserts_and_rejects():
-    csv_bytes = b"""tx_type,amount,currency,category,bucket,occurred_on,note
-expense,12.50,EUR,dining_out,controllable,2026-01-25,Burger
+    csv_bytes = _tagged(b"""tx_type,amount,currency,category,bucket,occurred_on,note
+expense,12.50,EUR,dining_out,controllable,2026-01-25,Burger {tag}
 expense,-5,EUR,shopping,unnecessary,2026-01-20,invalid amount
-income,500,EUR,salary,,2026-01-01,monthly pay
-"""
+income,500,EUR,salary,,2026-01-01,monthly pay {tag}
+""")
     files = {"file": ("sample.csv", csv_bytes, "text/csv")}
     res = client.post("/import/csv", files=files)
     assert res.status_code == 200, res.text
@@ -23,3 +37,179 @@ def test_import_csv_rejects_non_csv():
     files = {"file": ("sample.txt", b"hello", "text/plain")}
     res = client.post("/import/csv", files=files)
     assert res.status_code == 400
+
+
+def test_import_csv_chunked_reports_absolute_row_numbers():
+    csv_bytes = _tagged(b"""tx_type,amount,currency,category,bucket,occurred_on,note
+expense,3.50,EUR,dining_out,,2026-01-02,Coffee {tag}
+expense,4.00,EUR,dining_out,,2026-01-03,Coffee {tag}
+income,100,EUR,salary,,2026-01-04,pay {tag}
+expense,0,EUR,shopping,,2026-01-05,zero amount
+expense,7.00,EUR,groceries,,2026-01-06,Market {tag}
+""")
+    db = SessionLocal()
+    try:
+        result = import_transactions_csv(db, csv_bytes, chunk_size=2)
+    finally:
+        db.close()
+
+    assert result.inserted_count == 4
+    assert [r.row_number for r in result.rejected_rows] == [4]
+
+
+def _wait_for_job(job_id: str, timeout: float = 10.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        res = client.get(f"/import/jobs/{job_id}")
+        assert res.status_code == 200, res.text
+        job = res.json()
+        if job["status"] in ("succeeded", "failed") or time.monotonic() > deadline:
+            return job
+        time.sleep(0.05)
+
+
+def test_import_job_runs_in_background():
+    csv_bytes = _tagged(b"""tx_type,amount,currency,category,bucket,occurred_on,note
+expense,12.50,EUR,dining_out,controllable,2026-01-25,Burger {tag}
+expense,-5,EUR,shopping,unnecessary,2026-01-20,invalid amount
+income,500,EUR,salary,,2026-01-01,monthly pay {tag}
+""")
+    files = {"file": ("sample.csv", csv_bytes, "text/csv")}
+    res = client.post("/import/jobs", files=files)
+    assert res.status_code == 202, res.text
+    job_id = res.json()["job_id"]
+    assert res.headers["location"] == f"/import/jobs/{job_id}"
+
+    job = _wait_for_job(job_id)
+    assert job["status"] == "succeeded", job
+    assert job["rows_processed"] == 3
+    assert job["inserted_count"] == 2
+    assert job["rejected_count"] == 1
+    assert [r["row_number"] for r in job["rejected_rows"]] == [2]
+    assert job["rows_per_second"] > 0
+
+
+def test_import_job_not_found():
+    assert client.get("/import/jobs/does-not-exist").status_code == 404
+
+
+def test_split_line_ranges_keeps_quoted_newlines_together(tmp_path):
+    path = tmp_path / "quoted.csv"
+    path.write_bytes(
+        b"tx_type,amount,occurred_on,note\n"
+        b'expense,1,2026-01-01,"line one\nline two"\n'
+        b'expense,2,2026-01-02,"say ""hi""\nbye"\n'
+        b"expense,3,2026-01-03,plain\n"
+    )
+
+    header, ranges = split_line_ranges(path, chunk_bytes=1)
+    assert header == b"tx_type,amount,occurred_on,note\n"
+
+    data = path.read_bytes()
+    chunks = [data[start:end] for start, end in ranges]
+    assert chunks == [
+        b'expense,1,2026-01-01,"line one\nline two"\n',
+        b'expense,2,2026-01-02,"say ""hi""\nbye"\n',
+        b"expense,3,2026-01-03,plain\n",
+    ]
+
+
+def test_parallel_import_matches_sequential(monkeypatch):
+    lines = [b"tx_type,amount,currency,category,bucket,occurred_on,note"]
+    for i in range(60):
+        amount = b"-1" if i % 7 == 3 else str(i + 1).encode()
+        lines.append(b"expense," + amount + b',EUR,groceries,,2026-02-03,"Market, stall {tag}"')
+    csv_bytes = b"\n".join(lines) + b"\n"
+
+    db = SessionLocal()
+    try:
+        sequential = import_transactions_csv(db, _tagged(csv_bytes), workers=1)
+
+        # Tiny ranges force several worker tasks
+        monkeypatch.setattr(settings, "csv_import_parallel_chunk_bytes", 256)
+        seen = []
+        parallel = import_transactions_csv(
+            db, _tagged(csv_bytes), workers=2, progress=lambda *p: seen.append(p)
+        )
+    finally:
+        db.close()
+
+    assert parallel.inserted_count == sequential.inserted_count == 51
+    assert parallel.rejected_rows == sequential.rejected_rows
+    assert [r.row_number for r in parallel.rejected_rows] == [4, 11, 18, 25, 32, 39, 46, 53, 60]
+    assert len(seen) > 1
+    assert seen[-1] == (60, 51, 9, 0, 0)
+
+
+def test_reimport_skips_rows_already_imported():
+    tag = uuid4().hex[:8]
+    first = f"""tx_type,amount,currency,category,bucket,occurred_on,note
+expense,4.20,EUR,dining_out,,2026-03-01,Coffee {tag}
+expense,4.20,EUR,dining_out,,2026-03-01,Coffee {tag}
+expense,30,EUR,groceries,,2026-03-02,Market {tag}
+""".encode()
+    # Overlapping export: same three rows (note case/spacing differs) plus one new row
+    overlap = f"""tx_type,amount,currency,category,bucket,occurred_on,note
+expense,4.2,EUR,dining_out,,2026-03-01,coffee  {tag}
+expense,4.20,EUR,dining_out,,2026-03-01,Coffee {tag}
+expense,30.00,EUR,groceries,,2026-03-02,Market {tag}
+income,900,EUR,salary,,2026-03-03,Pay {tag}
+""".encode()
+
+    db = SessionLocal()
+    try:
+        result = import_transactions_csv(db, first)
+        # Identical rows inside one file are both kept
+        assert (result.inserted_count, result.skipped_count) == (3, 0)
+
+        seen = []
+        result = import_transactions_csv(
+            db, overlap, chunk_size=2, progress=lambda *p: seen.append(p)
+        )
+        assert (result.inserted_count, result.skipped_count) == (1, 3)
+        # Per-chunk merge counts are reported as they accumulate
+        assert seen == [(2, 0, 0, 2, 0), (4, 1, 0, 3, 0)]
+
+        stored = db.scalars(
+            select(Transaction.fingerprint).where(Transaction.note.ilike(f"%{tag}"))
+        ).all()
+    finally:
+        db.close()
+
+    assert len(stored) == 4
+    assert all(stored)
+
+
+def test_reimport_upsert_updates_changed_rows():
+    tag = uuid4().hex[:8]
+    original = f"""tx_type,amount,currency,category,bucket,occurred_on,note
+expense,12,EUR,upsert_test,,2026-03-05,Lunch {tag}
+expense,8,EUR,upsert_test,,2026-03-06,Taxi {tag}
+""".encode()
+    changed = f"""tx_type,amount,currency,category,bucket,occurred_on,note
+expense,12,EUR,upsert_test,necessary,2026-03-05,Lunch {tag}
+expense,8,EUR,upsert_test,,2026-03-06,Taxi {tag}
+""".encode()
+
+    assert (
+        client.post("/import/csv", files={"file": ("a.csv", original, "text/csv")}).json()[
+            "inserted_count"
+        ]
+        == 2
+    )
+
+    res = client.post(
+        "/import/csv?on_duplicate=upsert", files={"file": ("b.csv", changed, "text/csv")}
+    )
+    assert res.status_code == 200, res.text
+    data = res.json()
+    assert (data["inserted_count"], data["updated_count"], data["skipped_count"]) == (0, 1, 1)
+
+    db = SessionLocal()
+    try:
+        buckets = db.scalars(
+            select(Transaction.bucket).where(Transaction.note == f"Lunch {tag}")
+        ).all()
+    finally:
+        db.close()
+    assert buckets == ["necessary"]
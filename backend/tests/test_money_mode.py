@@ -0,0 +1,105 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.money import div_cents, format_cents
+from app.main import app
+
+client = TestClient(app)
+
+MONEY_KEYS = {
+    "income",
+    "expense",
+    "net",
+    "cumulative_net",
+    "net_7d",
+    "net_30d",
+    "required_monthly_saving",
+    "avg_monthly_net_saving",
+    "monthly_shortfall",
+}
+
+
+def _normalized(value):
+    # Decimal mode may render a zero sum as "0", cents mode always as "0.00"
+    if isinstance(value, dict):
+        return {k: Decimal(v) if k in MONEY_KEYS else _normalized(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_normalized(v) for v in value]
+    return value
+
+
+@pytest.mark.parametrize("cents", [0, 5, -5, 99, 100, 123456, -123456, 10**12 + 7])
+def test_format_cents_matches_decimal(cents):
+    assert format_cents(cents) == str(Decimal(cents).scaleb(-2))
+
+
+@pytest.mark.parametrize("numerator", [-1001, -250, -5, 0, 5, 250, 1001, 100001])
+@pytest.mark.parametrize("denominator", [1, 2, 3, 4, 7, -3])
+def test_div_cents_rounds_like_quantize(numerator, denominator):
+    expected = (Decimal(numerator) / Decimal(denominator)).quantize(Decimal("1"))
+    assert div_cents(numerator, denominator) == int(expected)
+
+
+def test_cents_mode_serves_same_payloads(monkeypatch):
+    day = date(2080, 1, 1) + timedelta(days=random.randrange(3_650))
+    for tx_type, amount, category, offset in [
+        ("income", "1000.05", "salary", 0),
+        ("expense", "0.07", "dining_out", 0),
+        ("expense", "333.33", "rent", 1),
+        ("expense", "12.40", "shopping", 3),
+    ]:
+        res = client.post(
+            "/transactions",
+            json={
+                "tx_type": tx_type,
+                "amount": amount,
+                "currency": "EUR",
+                "category": category,
+                "occurred_on": str(day + timedelta(days=offset)),
+            },
+        )
+        assert res.status_code == 201, res.text
+
+    res = client.post(
+        "/goals",
+        json={
+            "name": "Cents",
+            "target_amount": "1000.01",
+            "currency": "EUR",
+            "target_date": str(date.today() + timedelta(days=200)),
+        },
+    )
+    assert res.status_code == 201, res.text
+    goal_id = res.json()["id"]
+
+    urls = [
+        f"/analytics/daily?date_from={day}&date_to={day + timedelta(days=5)}",
+        f"/analytics/daily?date_from={day}&date_to={day + timedelta(days=40)}"
+        "&cumulative=true&rolling=true",
+        f"/analytics/summary?date_from={day}&date_to={day + timedelta(days=5)}",
+        "/analytics/summary",
+        f"/goals/{goal_id}/plan",
+    ]
+    decimal_mode = [client.get(url) for url in urls]
+    monkeypatch.setattr(settings, "money_mode", "cents")
+    cents_mode = [client.get(url) for url in urls]
+
+    for url, expected, res in zip(urls, decimal_mode, cents_mode, strict=True):
+        assert res.status_code == 200, (url, res.text)
+        assert _normalized(res.json()) == _normalized(expected.json()), url
+
+    points = cents_mode[0].json()["points"]
+    assert points[0] == {
+        "date": str(day),
+        "income": "1000.05",
+        "expense": "0.07",
+        "net": "999.98",
+    }
+    assert points[1]["net"] == "-333.33"
+    # Headers set by the ETag dependency survive the direct JSON response
+    assert "etag" in cents_mode[2].headers
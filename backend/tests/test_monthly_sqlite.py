@@ -0,0 +1,67 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.crud.analytics.summary import get_monthly
+from app.crud.goal_planner import get_recent_monthly_net
+from app.db.base import Base
+from app.models.rollup import DailyRollup, MonthlyRollup
+
+
+def _sqlite_session() -> Session:
+    # Same models and queries as Postgres; the rollups' month column is generated by SQLite
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return Session(engine)
+
+
+def test_month_aggregations_run_on_sqlite():
+    db = _sqlite_session()
+    try:
+        for day, tx_type, amount in [
+            (date(2025, 1, 31), "income", "100.00"),
+            (date(2025, 2, 1), "expense", "30.50"),
+            (date(2025, 2, 28), "income", "50.00"),
+            (date(2025, 3, 15), "expense", "10.25"),
+        ]:
+            db.add(DailyRollup(day=day, tx_type=tx_type, amount=Decimal(amount), tx_count=1))
+            db.add(
+                MonthlyRollup(
+                    month=day.replace(day=1), tx_type=tx_type, amount=Decimal(amount), tx_count=1
+                )
+            )
+        db.commit()
+
+        assert sorted(r.month for r in db.query(DailyRollup)) == [
+            date(2025, 1, 1),
+            date(2025, 2, 1),
+            date(2025, 2, 1),
+            date(2025, 3, 1),
+        ]
+
+        bounded = get_monthly(db, date_from=date(2025, 2, 1), date_to=date(2025, 3, 31))
+        assert bounded == [
+            {
+                "month": "2025-02",
+                "income": Decimal("50.00"),
+                "expense": Decimal("30.50"),
+                "net": Decimal("19.50"),
+            },
+            {
+                "month": "2025-03",
+                "income": Decimal("0"),
+                "expense": Decimal("10.25"),
+                "net": Decimal("-10.25"),
+            },
+        ]
+
+        recent = get_recent_monthly_net(db, months=2, cents=True)
+        assert recent == [
+            {"month": "2025-02", "income": 5000, "expense": 3050, "net": 1950},
+            {"month": "2025-03", "income": 0, "expense": 1025, "net": -1025},
+        ]
+        assert [m["month"] for m in get_monthly(db, months=2)] == ["2025-02", "2025-03"]
+    finally:
+        db.close()
@@ -0,0 +1,122 @@
+import time
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from app.core.cache import MemoryBackend, RedisBackend, ResponseCache
+from app.main import app
+
+client = TestClient(app)
+
+SUMMARY = "/analytics/summary?top_categories=5&months=3"
+
+
+def _stats():
+    return client.get("/cache/stats").json()
+
+
+def test_summary_is_served_from_cache_until_a_write():
+    first = client.get(SUMMARY)
+    assert first.status_code == 200
+    before = _stats()
+
+    # Same query, params in a different order: one cache entry
+    second = client.get("/analytics/summary?months=3&top_categories=5")
+    assert second.json() == first.json()
+    after = _stats()
+    assert after["hits"] == before["hits"] + 1
+    assert after["misses"] == before["misses"]
+
+    res = client.post(
+        "/transactions",
+        json={
+            "tx_type": "income",
+            "amount": 7,
+            "currency": "EUR",
+            "category": "cache_test",
+            "occurred_on": str(date.today()),
+        },
+    )
+    assert res.status_code == 201, res.text
+    assert _stats()["data_version"] > after["data_version"]
+
+    fresh = client.get(SUMMARY).json()
+    assert Decimal(fresh["totals"]["income"]) == Decimal(first.json()["totals"]["income"]) + 7
+    assert _stats()["misses"] == after["misses"] + 1
+
+
+def test_budget_write_invalidates_alerts():
+    client.get("/alerts")
+    version = _stats()["data_version"]
+
+    res = client.post(
+        "/budgets",
+        json={"category": f"cache_{uuid4().hex[:8]}", "monthly_limit": 10, "currency": "EUR"},
+    )
+    assert res.status_code == 201, res.text
+    assert _stats()["data_version"] == version + 1
+
+
+def test_memory_backend_ttl_and_lru():
+    backend = MemoryBackend(max_entries=2)
+    backend.set("a", 1, ttl=60)
+    backend.set("b", 2, ttl=60)
+    backend.get("a")
+    backend.set("c", 3, ttl=60)
+    # "b" was least recently used
+    assert backend.get("b") is None
+    assert backend.get("a") == 1
+
+    backend.set("expired", 4, ttl=-1)
+    assert backend.get("expired") is None
+
+
+class FakeRedis:
+    """In-process stand-in for redis.Redis: bytes values, px expiry, incr."""
+
+    def __init__(self):
+        self.data: dict[str, tuple[float | None, bytes]] = {}
+
+    def get(self, key):
+        entry = self.data.get(key)
+        if entry is None or (entry[0] is not None and entry[0] < time.monotonic()):
+            self.data.pop(key, None)
+            return None
+        return entry[1]
+
+    def set(self, key, value, px=None):
+        value = value if isinstance(value, bytes) else str(value).encode()
+        self.data[key] = (None if px is None else time.monotonic() + px / 1000, value)
+
+    def incr(self, key):
+        value = int(self.get(key) or 0) + 1
+        self.set(key, value)
+        return value
+
+    def dbsize(self):
+        return len(self.data)
+
+
+def test_redis_backend_shares_entries_and_version():
+    client = FakeRedis()
+    # Two workers, one server
+    first = ResponseCache(RedisBackend(client), ttl=60)
+    second = ResponseCache(RedisBackend(client), ttl=60)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"total": len(calls)}
+
+    assert first.get_or_compute("e", {"p": 1}, None, compute) == {"total": 1}
+    assert second.get_or_compute("e", {"p": 1}, None, compute) == {"total": 1}
+    assert len(calls) == 1
+
+    first.bump_data_version()
+    assert second.data_version() == 1
+    assert second.get_or_compute("e", {"p": 1}, None, compute) == {"total": 2}
+
+    RedisBackend(client).set("short", 1, ttl=-1)
+    assert RedisBackend(client).get("short") is None
@@ -0,0 +1,145 @@
+import random
+import threading
+import time
+from datetime import date, timedelta
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.db.session import SessionLocal
+from app.main import app
+from app.services.rollups import apply_transaction_rows
+
+client = TestClient(app)
+
+RAW_DAILY_SQL = text("""
+    SELECT occurred_on, tx_type, category, bucket, SUM(amount), COUNT(*)
+    FROM transactions
+    GROUP BY occurred_on, tx_type, category, bucket
+    """)
+ROLLUP_DAILY_SQL = text(
+    "SELECT day, tx_type, category, bucket, amount, tx_count FROM daily_rollups"
+)
+RAW_MONTHLY_SQL = text("""
+    SELECT CAST(date_trunc('month', occurred_on) AS date), tx_type, category, bucket,
+           SUM(amount), COUNT(*)
+    FROM transactions
+    GROUP BY 1, tx_type, category, bucket
+    """)
+ROLLUP_MONTHLY_SQL = text(
+    "SELECT month, tx_type, category, bucket, amount, tx_count FROM monthly_rollups"
+)
+
+
+def _assert_rollups_match_transactions():
+    db = SessionLocal()
+    try:
+        assert set(db.execute(ROLLUP_DAILY_SQL).all()) == set(db.execute(RAW_DAILY_SQL).all())
+        assert set(db.execute(ROLLUP_MONTHLY_SQL).all()) == set(db.execute(RAW_MONTHLY_SQL).all())
+    finally:
+        db.close()
+
+
+def test_rollups_follow_create_update_delete_and_import():
+    res = client.post(
+        "/transactions",
+        json={
+            "tx_type": "expense",
+            "amount": 19.99,
+            "currency": "EUR",
+            "category": "rollup_test",
+            "bucket": None,
+            "occurred_on": "2025-06-30",
+            "note": "rollup",
+        },
+    )
+    assert res.status_code == 201, res.text
+    tx_id = res.json()["id"]
+    _assert_rollups_match_transactions()
+
+    # Move it to another month and category
+    res = client.put(
+        f"/transactions/{tx_id}",
+        json={"amount": 5, "occurred_on": "2025-07-01", "category": "rollup_moved"},
+    )
+    assert res.status_code == 200, res.text
+    _assert_rollups_match_transactions()
+
+    csv_bytes = b"""tx_type,amount,currency,category,bucket,occurred_on,note
+expense,1.005,EUR,rollup_test,,2025-07-01,rounding
+income,10,EUR,salary,,2025-07-02,pay
+"""
+    res = client.post("/import/csv", files={"file": ("r.csv", csv_bytes, "text/csv")})
+    assert res.status_code == 200, res.text
+    _assert_rollups_match_transactions()
+
+    assert client.delete(f"/transactions/{tx_id}").status_code == 204
+    _assert_rollups_match_transactions()
+
+    # Daily analytics reads the rollups
+    res = client.get("/analytics/daily?date_from=2025-07-01&date_to=2025-07-02")
+    assert res.status_code == 200, res.text
+    assert {p["date"] for p in res.json()["points"]} >= {str(date(2025, 7, 2))}
+
+
+def test_rollups_follow_import_upsert():
+    tag = uuid4().hex[:8]
+    original = f"""tx_type,amount,currency,category,bucket,occurred_on,note
+expense,5,EUR,rollup_upsert,,2025-08-01,Snack {tag}
+""".encode()
+    changed = f"""tx_type,amount,currency,category,bucket,occurred_on,note
+expense,5,EUR,Rollup_Upsert,unnecessary,2025-08-01,Snack {tag}
+""".encode()
+
+    client.post("/import/csv", files={"file": ("a.csv", original, "text/csv")})
+    res = client.post(
+        "/import/csv?on_duplicate=upsert", files={"file": ("b.csv", changed, "text/csv")}
+    )
+    assert res.json()["updated_count"] == 1, res.text
+    _assert_rollups_match_transactions()
+
+
+def _wait_until_blocked(db, pid: int) -> None:
+    for _ in range(200):
+        waiting = db.execute(
+            text("SELECT wait_event_type FROM pg_stat_activity WHERE pid = :pid"), {"pid": pid}
+        ).scalar()
+        if waiting == "Lock":
+            return
+        time.sleep(0.01)
+    raise AssertionError("second writer never waited on a row lock")
+
+
+def test_overlapping_rollup_keys_lock_in_one_order():
+    day = date(2090, 1, 1) + timedelta(days=random.randrange(36_500))
+    tag = uuid4().hex[:8]
+    k1 = ("expense", 1, "EUR", f"a_{tag}", None, day, None)
+    k2 = ("expense", 1, "EUR", f"b_{tag}", "necessary", day, None)
+
+    first, second, watcher = SessionLocal(), SessionLocal(), SessionLocal()
+    errors = []
+
+    def apply_reversed():
+        try:
+            apply_transaction_rows(second, [k2, k1])
+        except Exception as e:
+            errors.append(e)
+
+    try:
+        apply_transaction_rows(first, [k1])
+        pid = second.execute(text("SELECT pg_backend_pid()")).scalar()
+        thread = threading.Thread(target=apply_reversed)
+        thread.start()
+        _wait_until_blocked(watcher, pid)
+        # In key order `second` waits on k1 before taking k2, so this does not deadlock
+        apply_transaction_rows(first, [k2])
+        first.rollback()
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+        assert errors == []
+    finally:
+        first.rollback()
+        second.rollback()
+        for db in (first, second, watcher):
+            db.close()
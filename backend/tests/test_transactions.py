@@ -1,4 +1,6 @@
+import json
 from datetime import date
+from uuid import uuid4
 
 from fastapi.testclient import TestClient
 
@@ -33,3 +35,129 @@ def test_list_transactions_limit_offset():
     assert res.status_code == 200
     assert isinstance(res.json(), list)
     assert len(res.json()) <= 5
+
+
+def test_list_transactions_cursor_pages_match_offset_pages():
+    for i in range(5):
+        res = client.post(
+            "/transactions",
+            json={
+                "tx_type": "expense",
+                "amount": 1 + i,
+                "currency": "EUR",
+                "category": "cursor_test",
+                "occurred_on": "2025-03-0" + str(1 + i % 3),
+            },
+        )
+        assert res.status_code == 201, res.text
+
+    base = "/transactions?category=cursor_test&limit=2"
+    by_offset = []
+    offset = 0
+    while page := client.get(f"{base}&offset={offset}").json():
+        by_offset.extend(t["id"] for t in page)
+        offset += 2
+
+    by_cursor = []
+    res = client.get(base)
+    while True:
+        assert res.status_code == 200, res.text
+        by_cursor.extend(t["id"] for t in res.json())
+        cursor = res.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        res = client.get(f"{base}&cursor={cursor}")
+
+    assert by_cursor == by_offset
+    assert len(by_cursor) >= 5
+
+
+def test_list_transactions_rejects_bad_cursor():
+    res = client.get("/transactions?cursor=not-a-cursor")
+    assert res.status_code == 400
+
+
+def test_export_csv_round_trips_through_import():
+    # Fresh category per run: the re-import below would otherwise double it every time
+    category = f"export_{uuid4().hex[:8]}"
+    res = client.post(
+        "/transactions",
+        json={
+            "tx_type": "expense",
+            "amount": 7.10,
+            "currency": "EUR",
+            "category": category,
+            "occurred_on": "2025-04-02",
+            "note": 'Comma, "quoted" note',
+        },
+    )
+    assert res.status_code == 201, res.text
+
+    res = client.get(f"/transactions/export?format=csv&category={category}")
+    assert res.status_code == 200, res.text
+    assert res.headers["content-type"].startswith("text/csv")
+    lines = res.text.splitlines()
+    assert lines[0] == "tx_type,amount,currency,category,bucket,occurred_on,note"
+    exported_rows = len(lines) - 1
+    assert exported_rows == 1
+
+    res = client.post("/import/csv", files={"file": ("export.csv", res.content, "text/csv")})
+    assert res.status_code == 200, res.text
+    assert res.json()["inserted_count"] == exported_rows
+    assert res.json()["rejected_rows"] == []
+
+
+def test_export_ndjson():
+    category = f"export_{uuid4().hex[:8]}"
+    res = client.post(
+        "/transactions",
+        json={
+            "tx_type": "expense",
+            "amount": 7.10,
+            "currency": "EUR",
+            "category": category,
+            "occurred_on": "2025-04-02",
+        },
+    )
+    assert res.status_code == 201, res.text
+
+    res = client.get(f"/transactions/export?format=ndjson&category={category}")
+    assert res.status_code == 200, res.text
+    rows = [json.loads(line) for line in res.text.splitlines()]
+    assert len(rows) == 1
+    assert rows[0]["category"] == category
+    assert rows[0]["amount"] == "7.10"
+
+
+def test_batch_create_update_delete():
+    base = {"currency": "EUR", "category": "batch_test", "occurred_on": "2025-05-05"}
+    res = client.post(
+        "/transactions",
+        json={**base, "tx_type": "expense", "amount": 3, "note": "to delete"},
+    )
+    assert res.status_code == 201, res.text
+    delete_id = res.json()["id"]
+
+    operations = [
+        {"op": "create", "data": {**base, "tx_type": "expense", "amount": 9, "note": "Netflix"}},
+        {"op": "create", "data": {**base, "tx_type": "income", "amount": 50}},
+        {"op": "delete", "id": delete_id},
+        {"op": "update", "id": 2_000_000_000, "data": {"amount": 1}},
+    ]
+    res = client.post("/transactions/batch", json={"operations": operations})
+    assert res.status_code == 200, res.text
+    results = res.json()["results"]
+
+    assert [r["status"] for r in results] == ["ok", "ok", "ok", "not_found"]
+    created = results[0]["transaction"]
+    assert created["id"] == results[0]["id"]
+    assert created["bucket"] == "unnecessary"  # auto-bucketed from the note
+    assert client.get(f"/transactions/{delete_id}").status_code == 404
+
+    res = client.post(
+        "/transactions/batch",
+        json={"operations": [{"op": "update", "id": created["id"], "data": {"amount": 12.5}}]},
+    )
+    assert res.status_code == 200, res.text
+    assert res.json()["results"][0]["transaction"]["amount"] == "12.50"
+    assert client.get(f"/transactions/{created['id']}").json()["amount"] == "12.50"